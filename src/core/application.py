@@ -8,10 +8,15 @@ all the components of the application.
 import asyncio
 import sys
 import atexit
-import os
 import signal
 import logging
-from typing import Dict, List, Optional, Any
+from typing import Any, Dict, List, Optional
+
+try:
+    import termios
+except ImportError:
+    # termios is POSIX-only
+    termios = None
 
 from core.di import Container
 from core.services import ServiceRegistry
@@ -21,10 +26,33 @@ from core.errors import MCPError, ErrorHandler
 class Application:
     """Core application class."""
     
+    __slots__ = ('running', 'logger', '_termios_saved', '_loop', '_main_task')
+    
     def __init__(self):
         """Initialize the application."""
         self.running = True
         self.logger = logging.getLogger("mcp-cli")
+        self._termios_saved = self._save_terminal_state()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        # Task that initialized the application, left to unwind on its own at shutdown
+        self._main_task: Optional[asyncio.Task] = None
+    
+    @staticmethod
+    def _save_terminal_state() -> Optional[List[Any]]:
+        """
+        Snapshot the terminal attributes so they can be restored on exit.
+        
+        Returns:
+            The termios attributes of stdin, or None if stdin is not a terminal
+        """
+        if termios is None:
+            return None
+        try:
+            if sys.stdin.isatty():
+                return termios.tcgetattr(sys.stdin.fileno())
+        except (termios.error, OSError, ValueError):
+            pass
+        return None
     
     async def initialize(self, config_file: str = "server_config.json") -> bool:
         """
@@ -37,6 +65,8 @@ class Application:
             True if initialization was successful, False otherwise
         """
         try:
+            self._main_task = asyncio.current_task()
+            
             # Register services
             self._register_services(config_file)
             
@@ -70,25 +100,59 @@ class Application:
             config_service.config = config_service._load_config()
     
     def setup_signal_handlers(self) -> None:
-        """Set up signal handlers for graceful shutdown."""
-        def signal_handler(sig, frame):
-            self.logger.info(f"Received signal {sig}")
-            self.running = False
-            asyncio.create_task(self.shutdown())
+        """
+        Set up signal handlers for graceful shutdown.
+        
+        Handlers are dispatched on the running event loop. Event loops that do
+        not support add_signal_handler (Windows) fall back to signal.signal.
+        """
+        loop = self._loop = asyncio.get_running_loop()
+        
+        for sig_name in ("SIGINT", "SIGTERM", "SIGQUIT"):
+            # SIGQUIT does not exist on Windows
+            sig = getattr(signal, sig_name, None)
+            if sig is None:
+                continue
             
-        # Register signal handlers
-        signal.signal(signal.SIGINT, signal_handler)
-        signal.signal(signal.SIGTERM, signal_handler)
+            try:
+                loop.add_signal_handler(sig, self._handle_signal, sig)
+            except NotImplementedError:
+                signal.signal(sig, self._on_signal)
+    
+    def _on_signal(self, sig: int, frame: Any) -> None:
+        """
+        signal.signal handler that hands the signal off to the event loop.
+        
+        Args:
+            sig: The signal number that was received
+            frame: The interrupted stack frame (unused)
+        """
+        self._loop.call_soon_threadsafe(self._handle_signal, sig)
+    
+    def _handle_signal(self, sig: int) -> None:
+        """
+        Handle a shutdown signal on the event loop.
         
-        # On non-Windows platforms, handle SIGQUIT
-        if hasattr(signal, 'SIGQUIT'):
-            signal.signal(signal.SIGQUIT, signal_handler)
+        Args:
+            sig: The signal number that was received
+        """
+        self.logger.info(f"Received signal {sig}")
+        self.running = False
+        asyncio.ensure_future(self.shutdown())
             
+    def restore_terminal(self) -> None:
+        """Restore the terminal attributes saved at startup."""
+        if self._termios_saved:
+            try:
+                termios.tcsetattr(sys.stdin.fileno(), termios.TCSADRAIN, self._termios_saved)
+            except (termios.error, OSError, ValueError):
+                pass
+    
     def register_exit_handlers(self) -> None:
         """Register exit handlers."""
         def exit_handler():
             # Restore terminal
-            os.system("stty sane")
+            self.restore_terminal()
             
             # Clean up any resources that need synchronous shutdown
             self.logger.info("Application shutdown in exit handler")
@@ -98,6 +162,7 @@ class Application:
     async def shutdown(self) -> None:
         """Shutdown the application."""
         self.logger.info("Shutting down application")
+        self.running = False
         
         # Get the server service if it exists
         try:
@@ -107,8 +172,13 @@ class Application:
             # Server service not registered yet
             pass
         
-        # Force exit after cleanup
-        sys.exit(0)
+        # Cancel the remaining background tasks so asyncio.run can unwind
+        # cleanly. The main task sees running is False and returns by itself.
+        keep = (asyncio.current_task(), self._main_task)
+        tasks = [task for task in asyncio.all_tasks() if task not in keep]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
     
     @staticmethod
     def handle_error(error: Exception) -> str:
@@ -5,16 +5,76 @@ Configuration Service for MCP-CLI.
 This module provides functionality for loading, accessing, and managing
 application configuration from various sources.
 """
+import contextlib
 import json
 import os
 import logging
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib parser
+    orjson = None
+
+
+def _loads(data: bytes) -> Any:
+    """Parse JSON bytes, using orjson when it is available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps(data: Any) -> bytes:
+    """Serialize data to indented JSON bytes, using orjson when it is available."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode()
+
+
+def load_json(path: str) -> Dict[str, Any]:
+    """
+    Load and parse a JSON file.
+    
+    Args:
+        path: Path to the JSON file
+        
+    Returns:
+        The parsed JSON data
+        
+    Raises:
+        FileNotFoundError: If the file does not exist
+        json.JSONDecodeError: If the file is not valid JSON
+    """
+    return _loads(Path(path).read_bytes())
+
+
+def dump_json(path: str, data: Any) -> bytes:
+    """
+    Atomically write data to a JSON file.
+    
+    The data is written to a sibling temporary file which then replaces the
+    target, so readers never observe a partially written file.
+    
+    Args:
+        path: Path to the JSON file
+        data: The data to serialize
+        
+    Returns:
+        The bytes written to the file
+    """
+    encoded = _dumps(data)
+    tmp_path = f"{path}.tmp"
+    Path(tmp_path).write_bytes(encoded)
+    os.replace(tmp_path, path)
+    return encoded
 
 
 class ConfigService:
     """Service for managing application configuration."""
     
+    __slots__ = ('config_file', 'config', '_servers', '_in_txn', '_dirty')
+    
     def __init__(self, config_file: str = "server_config.json"):
         """
         Initialize the configuration service.
@@ -24,6 +84,8 @@ class ConfigService:
         """
         self.config_file = config_file
         self.config = self._load_config()
+        self._in_txn = False
+        self._dirty = False
         
     def _load_config(self) -> Dict[str, Any]:
         """
@@ -33,28 +95,68 @@ class ConfigService:
             Dict containing configuration data
         """
         try:
-            with open(self.config_file, 'r') as f:
-                return json.load(f)
+            config = load_json(self.config_file)
         except (FileNotFoundError, json.JSONDecodeError) as e:
             logging.warning(f"Error loading config file {self.config_file}: {str(e)}")
-            # Return empty default configuration
-            return {"mcpServers": {}}
+            # Use empty default configuration
+            config = {"mcpServers": {}}
+        
+        # Keep a direct reference to the servers section for the accessors
+        self._servers = config.setdefault("mcpServers", {})
+        return config
     
     def save_config(self) -> bool:
         """
         Save current configuration to file.
         
+        Inside a transaction the write is deferred until the transaction ends.
+        
+        Returns:
+            True if successful, False otherwise
+        """
+        if self._in_txn:
+            self._dirty = True
+            return True
+        return self._flush()
+    
+    def _flush(self) -> bool:
+        """
+        Write the current configuration to file.
+        
         Returns:
             True if successful, False otherwise
         """
         try:
-            with open(self.config_file, 'w') as f:
-                json.dump(self.config, f, indent=2)
+            dump_json(self.config_file, self.config)
+            self._dirty = False
             return True
         except Exception as e:
             logging.error(f"Error saving config file {self.config_file}: {str(e)}")
             return False
     
+    @contextlib.contextmanager
+    def transaction(self) -> Iterator[None]:
+        """
+        Batch several configuration changes into a single file write.
+        
+        Mutators called inside the block update the in-memory configuration
+        and the file is written once when the outermost block exits without
+        an exception.
+        """
+        if self._in_txn:
+            # Nested transactions join the outer one
+            yield
+            return
+        
+        self._in_txn = True
+        try:
+            yield
+        finally:
+            self._in_txn = False
+        
+        if self._dirty:
+            self._flush()
+    
     def get_server_config(self, server_name: str) -> Optional[Dict[str, Any]]:
         """
         Get configuration for a specific server.
@@ -65,7 +167,7 @@ class ConfigService:
         Returns:
             Server configuration or None if not found
         """
-        return self.config.get("mcpServers", {}).get(server_name)
+        return self._servers.get(server_name)
     
     def get_all_servers(self) -> Dict[str, Dict[str, Any]]:
         """
@@ -74,7 +176,7 @@ class ConfigService:
         Returns:
             Dict of server configurations
         """
-        return self.config.get("mcpServers", {})
+        return self._servers
     
     def add_server(self, name: str, config: Dict[str, Any]) -> bool:
         """
@@ -87,10 +189,7 @@ class ConfigService:
         Returns:
             True if successful, False otherwise
         """
-        if "mcpServers" not in self.config:
-            self.config["mcpServers"] = {}
-            
-        self.config["mcpServers"][name] = config
+        self._servers[name] = config
         return self.save_config()
     
     def remove_server(self, name: str) -> bool:
@@ -103,8 +202,8 @@ class ConfigService:
         Returns:
             True if successful, False otherwise
         """
-        if name in self.config.get("mcpServers", {}):
-            del self.config["mcpServers"][name]
+        if name in self._servers:
+            del self._servers[name]
             return self.save_config()
         return False
     
@@ -119,7 +218,7 @@ class ConfigService:
         Returns:
             True if successful, False otherwise
         """
-        if name in self.config.get("mcpServers", {}):
-            self.config["mcpServers"][name] = config
+        if name in self._servers:
+            self._servers[name] = config
             return self.save_config()
         return False
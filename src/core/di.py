@@ -8,11 +8,25 @@ registering and resolving dependencies throughout the application.
 from typing import Any, Callable, Dict, Optional, Type
 
 
+# Sentinel returned by dict.get for unregistered interfaces
+_MISSING = object()
+
+
+class _FactoryMarker:
+    """Placeholder for a factory-registered service that has not been created yet."""
+    
+    __slots__ = ('factory',)
+    
+    def __init__(self, factory: Callable[[], Any]):
+        self.factory = factory
+
+
 class Container:
     """Simple dependency injection container."""
     
+    # Factories are stored in place as _FactoryMarker entries and replaced by
+    # their instance on first resolve, so resolution is a single dict lookup.
     _instances: Dict[str, Any] = {}
-    _factories: Dict[str, Callable[[], Any]] = {}
     
     @classmethod
     def register(cls, interface: str, implementation: Any = None, factory: Optional[Callable[[], Any]] = None) -> None:
@@ -25,7 +39,7 @@ class Container:
             factory: A factory function that creates the implementation
         """
         if factory:
-            cls._factories[interface] = factory
+            cls._instances[interface] = _FactoryMarker(factory)
         else:
             cls._instances[interface] = implementation
     
@@ -43,18 +57,15 @@ class Container:
         Raises:
             KeyError: If the interface is not registered
         """
-        if interface in cls._factories:
-            # If we haven't created this factory's instance yet, create and store it
-            if interface not in cls._instances:
-                cls._instances[interface] = cls._factories[interface]()
-            return cls._instances[interface]
-        elif interface in cls._instances:
-            return cls._instances[interface]
-        else:
+        instance = cls._instances.get(interface, _MISSING)
+        if instance.__class__ is _FactoryMarker:
+            # First resolve of a factory: create the instance and store it
+            instance = cls._instances[interface] = instance.factory()
+        elif instance is _MISSING:
             raise KeyError(f"No implementation registered for interface: {interface}")
+        return instance
     
     @classmethod
     def clear(cls) -> None:
         """Clear all registrations (useful for testing)."""
         cls._instances.clear()
-        cls._factories.clear()
@@ -11,6 +11,8 @@ from typing import Dict, Optional, Any
 class MCPError(Exception):
     """Base class for all MCP-CLI errors."""
     
+    __slots__ = ('message', 'code', 'details')
+    
     def __init__(self, message: str, code: int = 1, details: Optional[Dict[str, Any]] = None):
         """
         Initialize a new MCP error.
@@ -29,6 +31,8 @@ class MCPError(Exception):
 class ConfigurationError(MCPError):
     """Error raised when there is a problem with configuration."""
     
+    __slots__ = ()
+    
     def __init__(self, message: str, details: Optional[Dict[str, Any]] = None):
         super().__init__(message, 100, details)
 
@@ -36,32 +40,45 @@ class ConfigurationError(MCPError):
 class ProviderError(MCPError):
     """Error raised when there is a problem with a provider."""
     
+    __slots__ = ()
+    
     def __init__(self, message: str, provider: str, details: Optional[Dict[str, Any]] = None):
-        details_with_provider = {'provider': provider, **(details or {})}
+        details_with_provider = {'provider': provider} if details is None else {'provider': provider, **details}
         super().__init__(message, 200, details_with_provider)
 
 
 class ProtocolError(MCPError):
     """Error raised when there is a problem with the MCP protocol."""
     
+    __slots__ = ()
+    
     def __init__(self, message: str, method: Optional[str] = None, details: Optional[Dict[str, Any]] = None):
-        details_with_method = {'method': method, **(details or {})} if method else details
+        if not method:
+            details_with_method = details
+        elif details is None:
+            details_with_method = {'method': method}
+        else:
+            details_with_method = {'method': method, **details}
         super().__init__(message, 300, details_with_method)
 
 
 class ServerError(MCPError):
     """Error raised when there is a problem with an MCP server."""
     
+    __slots__ = ()
+    
     def __init__(self, message: str, server: str, details: Optional[Dict[str, Any]] = None):
-        details_with_server = {'server': server, **(details or {})}
+        details_with_server = {'server': server} if details is None else {'server': server, **details}
         super().__init__(message, 400, details_with_server)
 
 
 class ToolError(MCPError):
     """Error raised when there is a problem executing a tool."""
     
+    __slots__ = ()
+    
     def __init__(self, message: str, tool: str, details: Optional[Dict[str, Any]] = None):
-        details_with_tool = {'tool': tool, **(details or {})}
+        details_with_tool = {'tool': tool} if details is None else {'tool': tool, **details}
         super().__init__(message, 500, details_with_tool)
 
 
@@ -82,7 +99,7 @@ class ErrorHandler:
         if isinstance(error, MCPError):
             # Format MCP errors with code and details if available
             if error.details:
-                details_str = ', '.join(f"{k}={v}" for k, v in error.details.items())
+                details_str = ', '.join(['%s=%s' % item for item in error.details.items()])
                 return f"Error [{error.code}]: {error.message} ({details_str})"
             else:
                 return f"Error [{error.code}]: {error.message}"
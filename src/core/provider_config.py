@@ -5,76 +5,197 @@ Provider Configuration Service for MCP-CLI.
 This module manages the configuration of LLM providers, including
 API keys, models, and provider-specific settings.
 """
+import contextlib
+import copy
 import os
 import json
 import logging
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterator, List, Optional, Any, Tuple
 from pathlib import Path
 
+from core.config import load_json, dump_json
+from core.di import Container
+
+
+# Configuration used when the provider config file is missing or invalid
+_DEFAULT_PROVIDER_CONFIG: Dict[str, Any] = {
+    "defaultProvider": "openai",
+    "defaultModels": {
+        "openai": "gpt-4o-mini",
+        "ollama": "llama3.2"
+    },
+    "providers": {
+        "openai": {
+            "type": "openai",
+            "apiKeyEnvVar": "OPENAI_API_KEY",
+            "baseUrl": "https://api.openai.com/v1",
+            "models": ["gpt-4o-mini", "gpt-4o", "gpt-3.5-turbo"],
+            "streaming": True
+        },
+        "ollama": {
+            "type": "ollama",
+            "baseUrl": "http://localhost:11434",
+            "models": ["llama3.2", "qwen2.5-coder", "llama3"],
+            "streaming": True
+        }
+    }
+}
+
+
+def _file_stamp(path: str) -> Optional[Tuple[int, int]]:
+    """Get the modification time and size of a file, or None if it cannot be read."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
 
 class ProviderConfigService:
     """Service for managing provider configuration."""
     
-    def __init__(self, config_file: str = "providers_config.json"):
+    __slots__ = (
+        'config_file', 'config', '_providers', '_default_models',
+        '_in_txn', '_dirty', '_api_key_cache', '_last_written', '_stamp'
+    )
+    
+    def __init__(self, config_file: str = "providers_config.json", config: Optional[Dict[str, Any]] = None):
         """
         Initialize the provider configuration service.
         
         Args:
             config_file: Path to the provider configuration file
+            config: Configuration to use instead of reading config_file
+                (optional; copied, and written to config_file on change)
         """
         self.config_file = config_file
-        self.config = self._load_config()
+        self.config = self._load_config(config)
+        # Stamp of the file the configuration was read from or written to
+        self._stamp = _file_stamp(config_file) if config is None else None
+        self._in_txn = False
+        self._dirty = False
+        # API keys found in the environment, keyed by provider name
+        self._api_key_cache: Dict[str, str] = {}
+        # JSON bytes of the last successful write, if any
+        self._last_written: Optional[bytes] = None
         
-    def _load_config(self) -> Dict[str, Any]:
+    @classmethod
+    def get(cls, config_file: Optional[str] = None) -> "ProviderConfigService":
         """
-        Load configuration from file.
+        Get the service registered in the container for a configuration file.
+        
+        A new service is created and registered if none is registered yet or
+        the registered one reads another file. Otherwise the file is only
+        stat'ed, and the configuration reloaded if someone else changed it.
+        Services built from a configuration dict are never reloaded.
         
+        Args:
+            config_file: Path to the provider configuration file (optional;
+                by default the registered service is used whatever its file,
+                or one is created for "providers_config.json")
+            
         Returns:
-            Dict containing provider configuration data
+            The registered service for the file
         """
         try:
-            with open(self.config_file, 'r') as f:
-                return json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError) as e:
-            logging.warning(f"Error loading provider config file {self.config_file}: {str(e)}")
-            # Return default configuration if file not found or invalid
-            return {
-                "defaultProvider": "openai",
-                "defaultModels": {
-                    "openai": "gpt-4o-mini",
-                    "ollama": "llama3.2"
-                },
-                "providers": {
-                    "openai": {
-                        "type": "openai",
-                        "apiKeyEnvVar": "OPENAI_API_KEY",
-                        "baseUrl": "https://api.openai.com/v1",
-                        "models": ["gpt-4o-mini", "gpt-4o", "gpt-3.5-turbo"],
-                        "streaming": True
-                    },
-                    "ollama": {
-                        "type": "ollama",
-                        "baseUrl": "http://localhost:11434",
-                        "models": ["llama3.2", "qwen2.5-coder", "llama3"],
-                        "streaming": True
-                    }
-                }
-            }
+            service = Container.resolve('provider_config')
+        except KeyError:
+            service = None
+        
+        if not isinstance(service, cls):
+            service = cls(config_file or "providers_config.json")
+            Container.register('provider_config', service)
+        elif config_file is not None and os.path.abspath(service.config_file) != os.path.abspath(config_file):
+            service = cls(config_file)
+            Container.register('provider_config', service)
+        elif (not service._in_txn and service._stamp is not None and
+                service._stamp != _file_stamp(service.config_file)):
+            service.reload()
+        return service
+    
+    def reload(self) -> None:
+        """Reload the configuration from file, dropping cached API keys."""
+        self.config = self._load_config()
+        self._stamp = _file_stamp(self.config_file)
+        self._api_key_cache.clear()
+    
+    def _load_config(self, config: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Load configuration from file, unless a configuration is given.
+        
+        Args:
+            config: Configuration to use instead of the file (optional)
+            
+        Returns:
+            Dict containing provider configuration data
+        """
+        if config is not None:
+            config = copy.deepcopy(config)
+        else:
+            try:
+                config = load_json(self.config_file)
+            except (FileNotFoundError, json.JSONDecodeError) as e:
+                logging.warning(f"Error loading provider config file {self.config_file}: {str(e)}")
+                # Use default configuration if file not found or invalid
+                config = copy.deepcopy(_DEFAULT_PROVIDER_CONFIG)
+        
+        # Keep direct references to the sections used by the accessors
+        self._providers = config.setdefault("providers", {})
+        self._default_models = config.setdefault("defaultModels", {})
+        return config
             
     def save_config(self) -> bool:
         """
         Save current configuration to file.
         
+        Inside a transaction the write is deferred until the transaction ends.
+        
+        Returns:
+            True if successful, False otherwise
+        """
+        if self._in_txn:
+            self._dirty = True
+            return True
+        return self._flush()
+    
+    def _flush(self) -> bool:
+        """
+        Write the current configuration to file.
+        
         Returns:
             True if successful, False otherwise
         """
         try:
-            with open(self.config_file, 'w') as f:
-                json.dump(self.config, f, indent=2)
+            self._last_written = dump_json(self.config_file, self.config)
+            self._stamp = _file_stamp(self.config_file)
+            self._dirty = False
             return True
         except Exception as e:
             logging.error(f"Error saving provider config file {self.config_file}: {str(e)}")
             return False
+    
+    @contextlib.contextmanager
+    def transaction(self) -> Iterator[None]:
+        """
+        Batch several configuration changes into a single file write.
+        
+        Mutators called inside the block update the in-memory configuration
+        and the file is written once when the outermost block exits without
+        an exception.
+        """
+        if self._in_txn:
+            # Nested transactions join the outer one
+            yield
+            return
+        
+        self._in_txn = True
+        try:
+            yield
+        finally:
+            self._in_txn = False
+        
+        if self._dirty:
+            self._flush()
             
     def get_default_provider(self) -> str:
         """
@@ -95,7 +216,7 @@ class ProviderConfigService:
         Returns:
             Default model name or None if not set
         """
-        return self.config.get("defaultModels", {}).get(provider)
+        return self._default_models.get(provider)
         
     def get_provider_config(self, provider: str) -> Optional[Dict[str, Any]]:
         """
@@ -107,7 +228,7 @@ class ProviderConfigService:
         Returns:
             Provider configuration or None if not found
         """
-        return self.config.get("providers", {}).get(provider)
+        return self._providers.get(provider)
         
     def get_all_providers(self) -> Dict[str, Dict[str, Any]]:
         """
@@ -116,7 +237,7 @@ class ProviderConfigService:
         Returns:
             Dict of provider configurations
         """
-        return self.config.get("providers", {})
+        return self._providers
         
     def add_provider(self, name: str, config: Dict[str, Any]) -> bool:
         """
@@ -129,10 +250,8 @@ class ProviderConfigService:
         Returns:
             True if successful, False otherwise
         """
-        if "providers" not in self.config:
-            self.config["providers"] = {}
-            
-        self.config["providers"][name] = config
+        self._providers[name] = config
+        self._api_key_cache.pop(name, None)
         return self.save_config()
         
     def remove_provider(self, name: str) -> bool:
@@ -145,16 +264,17 @@ class ProviderConfigService:
         Returns:
             True if successful, False otherwise
         """
-        if name in self.config.get("providers", {}):
-            del self.config["providers"][name]
+        if name in self._providers:
+            del self._providers[name]
+            self._api_key_cache.pop(name, None)
             
             # Remove from default models if present
-            if name in self.config.get("defaultModels", {}):
-                del self.config["defaultModels"][name]
+            if name in self._default_models:
+                del self._default_models[name]
                 
             # Change default provider if needed
             if self.config.get("defaultProvider") == name:
-                providers = list(self.config.get("providers", {}).keys())
+                providers = list(self._providers)
                 self.config["defaultProvider"] = providers[0] if providers else "openai"
                 
             return self.save_config()
@@ -171,8 +291,9 @@ class ProviderConfigService:
         Returns:
             True if successful, False otherwise
         """
-        if name in self.config.get("providers", {}):
-            self.config["providers"][name] = config
+        if name in self._providers:
+            self._providers[name] = config
+            self._api_key_cache.pop(name, None)
             return self.save_config()
         return False
         
@@ -186,7 +307,7 @@ class ProviderConfigService:
         Returns:
             True if successful, False otherwise
         """
-        if name in self.config.get("providers", {}):
+        if name in self._providers:
             self.config["defaultProvider"] = name
             return self.save_config()
         return False
@@ -202,11 +323,8 @@ class ProviderConfigService:
         Returns:
             True if successful, False otherwise
         """
-        if provider in self.config.get("providers", {}):
-            if "defaultModels" not in self.config:
-                self.config["defaultModels"] = {}
-                
-            self.config["defaultModels"][provider] = model
+        if provider in self._providers:
+            self._default_models[provider] = model
             return self.save_config()
         return False
         
@@ -214,21 +332,29 @@ class ProviderConfigService:
         """
         Get the API key for a provider from environment variables.
         
+        A key found in the environment is cached for the provider until its
+        configuration is changed or removed. Missing keys are not cached, so
+        a key set later is picked up.
+        
         Args:
             provider: Provider name
             
         Returns:
             API key or None if not found
         """
+        api_key = self._api_key_cache.get(provider)
+        if api_key is not None:
+            return api_key
+        
         provider_config = self.get_provider_config(provider)
-        if not provider_config:
-            return None
-            
-        api_key_var = provider_config.get("apiKeyEnvVar")
-        if not api_key_var:
-            return None
-            
-        return os.environ.get(api_key_var)
+        if provider_config:
+            api_key_var = provider_config.get("apiKeyEnvVar")
+            if api_key_var:
+                api_key = os.environ.get(api_key_var)
+        
+        if api_key is not None:
+            self._api_key_cache[provider] = api_key
+        return api_key
         
     def get_models(self, provider: str) -> List[str]:
         """
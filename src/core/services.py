@@ -21,11 +21,13 @@ class ServiceRegistry:
         
         # Create and register services
         config_service = ConfigService()
-        provider_config_service = ProviderConfigService()
         
         # Register in the container
         Container.register('config_service', config_service)
-        Container.register('provider_config', provider_config_service)
+        
+        # Registers the provider config service itself, reusing one that
+        # is already registered for the same file
+        ProviderConfigService.get()
         
     @classmethod
     def register_factories(cls) -> None:
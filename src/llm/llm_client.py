@@ -12,6 +12,8 @@ from typing import Any, AsyncGenerator, Callable, Dict, List, Optional, Union
 class LLMClient(ABC):
     """Interface for LLM clients."""
     
+    __slots__ = ()
+    
     @abstractmethod
     async def generate_text(self, messages: List[Dict[str, str]], 
                            tool_handler: Optional[Callable[[str, Dict[str, Any]], Any]] = None) -> str:
@@ -6,7 +6,7 @@ This module provides a base class for LLM providers that implements
 common functionality.
 """
 from abc import ABC, abstractmethod
-from typing import Any, AsyncGenerator, Callable, Dict, List, Optional
+from typing import Any, AsyncGenerator, Callable, Dict, List, Optional, Tuple
 import logging
 
 from llm.llm_client import LLMClient, LLMClientError
@@ -15,6 +15,11 @@ from llm.llm_client import LLMClient, LLMClientError
 class BaseProvider(LLMClient, ABC):
     """Base class for LLM providers."""
     
+    __slots__ = (
+        'model_name', 'base_url', 'streaming', 'api_key', 'available_tools',
+        'system_prompt_generator', 'options', 'logger', '_prompt_tools', '_cached_default_prompt'
+    )
+    
     # Provider type identifier - should be overridden by subclasses
     PROVIDER_TYPE = "base"
     
@@ -38,6 +43,10 @@ class BaseProvider(LLMClient, ABC):
         self.system_prompt_generator = None
         self.options = kwargs
         self.logger = logging.getLogger(f"mcp-cli.provider.{self.PROVIDER_TYPE}")
+        # (name, description) pairs of the tools listed in the default prompt
+        self._prompt_tools: Tuple[Tuple[str, str], ...] = ()
+        # Default system prompt, built lazily and reset whenever the tools change
+        self._cached_default_prompt: Optional[str] = None
     
     def set_tools(self, tools: List[Dict[str, Any]]) -> None:
         """
@@ -47,7 +56,11 @@ class BaseProvider(LLMClient, ABC):
             tools: List of tool definitions
         """
         self.available_tools = tools
-        self.logger.debug(f"Set {len(tools)} tools for {self.PROVIDER_TYPE} provider")
+        self._prompt_tools = tuple((tool['name'], tool['description'])
+                                   for tool in tools
+                                   if 'name' in tool and 'description' in tool)
+        self._cached_default_prompt = None
+        self.logger.debug("Set %d tools for %s provider", len(tools), self.PROVIDER_TYPE)
     
     def set_system_prompt_generator(self, generator: Callable[[Dict[str, Any]], str]) -> None:
         """
@@ -57,7 +70,7 @@ class BaseProvider(LLMClient, ABC):
             generator: Function that generates system prompts
         """
         self.system_prompt_generator = generator
-        self.logger.debug(f"Set system prompt generator for {self.PROVIDER_TYPE} provider")
+        self.logger.debug("Set system prompt generator for %s provider", self.PROVIDER_TYPE)
     
     def generate_system_prompt(self, capabilities: Dict[str, Any]) -> str:
         """
@@ -72,16 +85,23 @@ class BaseProvider(LLMClient, ABC):
         if self.system_prompt_generator:
             return self.system_prompt_generator(capabilities)
         
-        # Default system prompt
-        tools_str = "\n".join([f"- {tool['name']}: {tool['description']}" 
-                              for tool in self.available_tools
-                              if 'name' in tool and 'description' in tool])
+        if self._cached_default_prompt is None:
+            self._cached_default_prompt = self._build_default_prompt()
+        return self._cached_default_prompt
+    
+    def _build_default_prompt(self) -> str:
+        """
+        Build the default system prompt from the available tools.
         
+        Returns:
+            The default system prompt
+        """
         prompt = (
             "You are a helpful assistant with access to tools.\n\n"
         )
         
-        if tools_str:
+        if self._prompt_tools:
+            tools_str = "\n".join(f"- {name}: {description}" for name, description in self._prompt_tools)
             prompt += f"Available tools:\n{tools_str}\n\n"
             prompt += "When you need to use a tool, indicate the tool name and parameters clearly.\n"
         
@@ -98,5 +118,5 @@ class BaseProvider(LLMClient, ABC):
             True if the model was changed successfully, False otherwise
         """
         self.model_name = model_name
-        self.logger.info(f"Changed model to {model_name} for {self.PROVIDER_TYPE} provider")
+        self.logger.info("Changed model to %s for %s provider", model_name, self.PROVIDER_TYPE)
         return True
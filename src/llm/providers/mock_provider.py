@@ -13,23 +13,54 @@ from llm.providers.base import BaseProvider
 from llm.llm_client import LLMClientError
 
 
+# Default streaming response, followed by a final "<model_name>." chunk
+_DEFAULT_STREAM_CHUNKS = ("This ", "is ", "a ", "mock ", "streaming ", "response ", "from ")
+
+
 class MockProvider(BaseProvider):
     """Mock LLM provider for testing."""
     
+    __slots__ = (
+        'responses', 'streaming_responses', 'tool_calls', '_chunk_delay',
+        '_default_response', '_default_stream_chunks'
+    )
+    
     PROVIDER_TYPE = "mock"
     
-    def __init__(self, model_name: Optional[str] = "mock-model", **kwargs):
+    def __init__(self, model_name: Optional[str] = "mock-model", chunk_delay: float = 0.0, **kwargs):
         """
         Initialize the mock provider.
         
         Args:
             model_name: Name of the model to use
+            chunk_delay: Seconds to wait between streamed chunks (0 disables the delay)
             **kwargs: Additional provider-specific options
         """
         super().__init__(model_name=model_name, **kwargs)
+        self._chunk_delay = chunk_delay
         self.responses = {}
         self.streaming_responses = {}
         self.tool_calls = {}
+        self._set_default_responses()
+    
+    def _set_default_responses(self) -> None:
+        """Build the default responses for the current model."""
+        self._default_response = f"This is a mock response from {self.model_name}."
+        self._default_stream_chunks = _DEFAULT_STREAM_CHUNKS + (f"{self.model_name}.",)
+    
+    def change_model(self, model_name: str) -> bool:
+        """
+        Change the model being used.
+        
+        Args:
+            model_name: Name of the model to use
+            
+        Returns:
+            True if the model was changed successfully, False otherwise
+        """
+        changed = super().change_model(model_name)
+        self._set_default_responses()
+        return changed
     
     def add_response(self, messages_hash: str, response: str) -> None:
         """
@@ -72,13 +103,10 @@ class MockProvider(BaseProvider):
         Returns:
             A string hash of the messages
         """
-        # For testing, we can use the last user message as the hash
-        for msg in reversed(messages):
-            if msg["role"] == "user":
-                return msg["content"]
-        
-        # If no user message is found, use an empty string
-        return ""
+        # For testing, we can use the last user message as the hash. The scan
+        # starts at the end, so it stops at the latest turn in the common case.
+        # If no user message is found, use an empty string.
+        return next((msg["content"] for msg in reversed(messages) if msg["role"] == "user"), "")
     
     async def generate_text(self, messages: List[Dict[str, str]], 
                            tool_handler: Optional[Callable[[str, Dict[str, Any]], Any]] = None) -> str:
@@ -99,15 +127,15 @@ class MockProvider(BaseProvider):
         messages_hash = self._hash_messages(messages)
         
         # Check if we should make a tool call
-        if messages_hash in self.tool_calls and tool_handler:
-            tool_call = self.tool_calls[messages_hash]
+        tool_call = self.tool_calls.get(messages_hash)
+        if tool_call is not None and tool_handler:
             try:
                 await tool_handler(tool_call["tool_name"], tool_call["params"])
             except Exception as e:
                 self.logger.warning(f"Tool call error: {str(e)}")
         
         # Return predefined response or default
-        return self.responses.get(messages_hash, f"This is a mock response from {self.model_name}.")
+        return self.responses.get(messages_hash, self._default_response)
     
     async def generate_streaming_text(self, messages: List[Dict[str, str]],
                                      tool_handler: Optional[Callable[[str, Dict[str, Any]], Any]] = None
@@ -129,20 +157,18 @@ class MockProvider(BaseProvider):
         messages_hash = self._hash_messages(messages)
         
         # Check if we should make a tool call
-        if messages_hash in self.tool_calls and tool_handler:
-            tool_call = self.tool_calls[messages_hash]
+        tool_call = self.tool_calls.get(messages_hash)
+        if tool_call is not None and tool_handler:
             try:
                 await tool_handler(tool_call["tool_name"], tool_call["params"])
             except Exception as e:
                 self.logger.warning(f"Tool call error: {str(e)}")
         
         # Get predefined chunks or default
-        chunks = self.streaming_responses.get(
-            messages_hash, 
-            [f"This ", f"is ", f"a ", f"mock ", f"streaming ", f"response ", f"from ", f"{self.model_name}."]
-        )
+        chunks = self.streaming_responses.get(messages_hash, self._default_stream_chunks)
         
-        # Yield chunks with a small delay for realism
+        # Yield chunks, optionally with a delay for realism
         for chunk in chunks:
             yield chunk
-            await asyncio.sleep(0.05)
+            if self._chunk_delay:
+                await asyncio.sleep(self._chunk_delay)
@@ -4,15 +4,15 @@ Provider factory for LLM providers.
 
 This module provides a factory for creating and managing LLM providers.
 """
-import importlib
+import importlib.util
 import inspect
 import os
 import logging
-from typing import Dict, List, Optional, Type, Any
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple, Type, Any
 
 from llm.llm_client import LLMClient
 from llm.providers.base import BaseProvider
-from core.di import Container
+from core.provider_config import ProviderConfigService
 
 
 class ProviderFactory:
@@ -22,6 +22,10 @@ class ProviderFactory:
         """Initialize the provider factory."""
         self._provider_types: Dict[str, Type[BaseProvider]] = {}
         self._provider_instances: Dict[str, BaseProvider] = {}
+        # Keyword arguments accepted by each provider class's __init__
+        self._init_params_cache: Dict[Type[BaseProvider], FrozenSet[str]] = {}
+        # Custom provider modules already executed, keyed by (realpath, mtime_ns)
+        self._loaded_module_paths: Set[Tuple[str, int]] = set()
         self.logger = logging.getLogger("mcp-cli.provider-factory")
         
         # Register built-in providers
@@ -54,6 +58,7 @@ class ProviderFactory:
             provider_class: The provider class
         """
         self._provider_types[type_name] = provider_class
+        self._init_params_cache.pop(provider_class, None)
         self.logger.debug(f"Registered provider type: {type_name}")
     
     def create_provider(self, provider_name: str, model_name: Optional[str] = None) -> BaseProvider:
@@ -71,10 +76,7 @@ class ProviderFactory:
             ValueError: If the provider is not found or cannot be created
         """
         # Get provider configuration
-        try:
-            config_service = Container.resolve('provider_config')
-        except KeyError:
-            raise ValueError("Provider configuration service not registered")
+        config_service = ProviderConfigService.get()
         
         provider_config = config_service.get_provider_config(provider_name)
         
@@ -111,11 +113,8 @@ class ProviderFactory:
             init_params.update(provider_config["options"])
         
         # Create instance with parameter filtering (only pass params that the __init__ accepts)
-        sig = inspect.signature(provider_class.__init__)
-        valid_params = {}
-        for param_name, param in sig.parameters.items():
-            if param_name != 'self' and param_name in init_params:
-                valid_params[param_name] = init_params[param_name]
+        accepted = self._accepted_params(provider_class)
+        valid_params = {k: v for k, v in init_params.items() if k in accepted}
         
         provider = provider_class(**valid_params)
         
@@ -125,6 +124,23 @@ class ProviderFactory:
         self.logger.info(f"Created provider instance: {provider_name} ({provider_type})")
         return provider
     
+    def _accepted_params(self, provider_class: Type[BaseProvider]) -> FrozenSet[str]:
+        """
+        Get the keyword arguments accepted by a provider class's __init__.
+        
+        Args:
+            provider_class: The provider class
+            
+        Returns:
+            The accepted parameter names (excluding self)
+        """
+        accepted = self._init_params_cache.get(provider_class)
+        if accepted is None:
+            sig = inspect.signature(provider_class.__init__)
+            accepted = frozenset(name for name in sig.parameters if name != 'self')
+            self._init_params_cache[provider_class] = accepted
+        return accepted
+    
     def get_provider(self, provider_name: str) -> Optional[BaseProvider]:
         """
         Get an existing provider instance.
@@ -144,7 +160,7 @@ class ProviderFactory:
         Returns:
             List of provider type names
         """
-        return list(self._provider_types.keys())
+        return list(self._provider_types)
     
     def get_available_providers(self) -> List[str]:
         """
@@ -154,8 +170,7 @@ class ProviderFactory:
             List of provider configuration names
         """
         try:
-            config_service = Container.resolve('provider_config')
-            return list(config_service.get_all_providers().keys())
+            return list(ProviderConfigService.get().get_all_providers())
         except Exception:
             return []
     
@@ -173,24 +188,30 @@ class ProviderFactory:
             return 0
         
         count = 0
-        for filename in os.listdir(directory):
-            if filename.endswith(".py") and not filename.startswith("_"):
-                module_name = filename[:-3]  # Remove .py extension
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if not entry.name.endswith(".py") or entry.name.startswith("_") or not entry.is_file():
+                    continue
+                
+                module_name = entry.name[:-3]  # Remove .py extension
                 
                 try:
+                    # Skip modules that have not changed since they were loaded
+                    module_key = (os.path.realpath(entry.path), entry.stat().st_mtime_ns)
+                    if module_key in self._loaded_module_paths:
+                        continue
+                    
                     # Import the module
-                    spec = importlib.util.spec_from_file_location(
-                        module_name, 
-                        os.path.join(directory, filename)
-                    )
+                    spec = importlib.util.spec_from_file_location(module_name, entry.path)
                     module = importlib.util.module_from_spec(spec)
                     spec.loader.exec_module(module)
+                    self._loaded_module_paths.add(module_key)
                     
                     # Find provider classes
-                    for name, obj in inspect.getmembers(module):
-                        if (inspect.isclass(obj) and 
+                    for obj in list(vars(module).values()):
+                        if (isinstance(obj, type) and 
                             issubclass(obj, BaseProvider) and 
-                            obj != BaseProvider):
+                            obj is not BaseProvider):
                             
                             # Get provider type from class
                             provider_type = getattr(obj, "PROVIDER_TYPE", module_name)
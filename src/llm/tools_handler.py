@@ -128,7 +128,7 @@ async def handle_tool_call(
         
         # Format the tool response.
         formatted_response: str = format_tool_response(raw_content)
-        logging.debug(f"Tool '{tool_name}' Response: {formatted_response}")
+        logging.debug("Tool '%s' Response: %s", tool_name, formatted_response)
 
         # Append the tool call (for tracking purposes).
         conversation_history.append({
@@ -5,8 +5,9 @@ Mock implementation of the MCP protocol client for testing.
 This module provides a mock implementation of the ProtocolClient
 interface for testing without a real MCP server.
 """
+import json
 import logging
-from typing import Any, Dict, List, Optional, AsyncGenerator
+from typing import Any, Dict, Hashable, List, Optional, AsyncGenerator, Set, Tuple
 
 from mcp.client.protocol_client import ProtocolClient
 from mcp.messages.exceptions import (
@@ -16,31 +17,104 @@ from mcp.messages.exceptions import (
 )
 
 
+# Sentinel for result lookups that have no predefined entry
+_MISSING = object()
+
+# Key used for calls without parameters
+_EMPTY_PARAMS = frozenset()
+
+# Capability keys
+_TOOLS = "tools"
+_PROMPTS = "prompts"
+_RESOURCES = "resources"
+
+
+def _freeze(value: Any) -> Hashable:
+    """
+    Convert a JSON-like value into an equivalent hashable value.
+    
+    Args:
+        value: The value to convert
+        
+    Returns:
+        The value with dicts turned into frozensets, lists into tuples and
+        other values paired with their type, so that True, 1 and 1.0 differ
+    """
+    if isinstance(value, dict):
+        return frozenset((k, _freeze(v)) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, set):
+        return frozenset(_freeze(v) for v in value)
+    return (type(value), value)
+
+
 class MockProtocolClient(ProtocolClient):
-    """Mock MCP protocol client for testing."""
+    """
+    Mock MCP protocol client for testing.
+    
+    The capabilities are private so that the name sets used for existence
+    checks stay in step with them: change them with set_capabilities or
+    the add_* methods. The capabilities property and the get_* methods
+    return copies.
+    """
+    
+    __slots__ = (
+        '_capabilities', 'tool_results', 'streaming_tool_results', 'prompt_results',
+        'resource_results', 'connected', 'logger', '_tools_list', '_prompts_list',
+        '_resources_list', '_tool_names', '_prompt_names', '_resource_names'
+    )
     
     def __init__(self):
         """Initialize the mock protocol client."""
-        self.capabilities = {
-            "tools": [],
-            "prompts": [],
-            "resources": []
+        self._capabilities: Dict[str, Any] = {
+            _TOOLS: [],
+            _PROMPTS: [],
+            _RESOURCES: []
         }
-        self.tool_results = {}
-        self.streaming_tool_results = {}
-        self.prompt_results = {}
-        self.resource_results = {}
+        # Predefined results, keyed by (name, params_hash)
+        self.tool_results: Dict[Tuple[str, Hashable], Any] = {}
+        self.streaming_tool_results: Dict[Tuple[str, Hashable], List[Any]] = {}
+        self.prompt_results: Dict[Tuple[str, Hashable], Any] = {}
+        self.resource_results: Dict[Tuple[str, Hashable], Any] = {}
         self.connected = False
         self.logger = logging.getLogger("mcp-cli.mock-protocol-client")
+        
+        # Capability lists, bound once instead of looked up per call
+        self._tools_list: List[Dict[str, Any]] = self._capabilities[_TOOLS]
+        self._prompts_list: List[Dict[str, Any]] = self._capabilities[_PROMPTS]
+        self._resources_list: List[Dict[str, Any]] = self._capabilities[_RESOURCES]
+        
+        # Names of the defined tools, prompts and resources for existence checks
+        self._tool_names: Set[str] = set()
+        self._prompt_names: Set[str] = set()
+        self._resource_names: Set[str] = set()
+    
+    @property
+    def capabilities(self) -> Dict[str, Any]:
+        """A copy of the capabilities to return."""
+        return {key: list(value) if isinstance(value, list) else value
+                for key, value in self._capabilities.items()}
+    
+    @capabilities.setter
+    def capabilities(self, capabilities: Dict[str, Any]) -> None:
+        self.set_capabilities(capabilities)
     
     def set_capabilities(self, capabilities: Dict[str, Any]) -> None:
         """
         Set the capabilities to return.
         
         Args:
-            capabilities: The capabilities to return
-        """
-        self.capabilities = capabilities
+            capabilities: The capabilities to return (copied)
+        """
+        self._capabilities = {key: list(value) if isinstance(value, list) else value
+                              for key, value in capabilities.items()}
+        self._tools_list = self._capabilities.setdefault(_TOOLS, [])
+        self._prompts_list = self._capabilities.setdefault(_PROMPTS, [])
+        self._resources_list = self._capabilities.setdefault(_RESOURCES, [])
+        self._tool_names = {tool["name"] for tool in self._tools_list}
+        self._prompt_names = {prompt["name"] for prompt in self._prompts_list}
+        self._resource_names = {resource["name"] for resource in self._resources_list}
     
     def add_tool(self, tool_def: Dict[str, Any]) -> None:
         """
@@ -49,10 +123,8 @@ class MockProtocolClient(ProtocolClient):
         Args:
             tool_def: The tool definition
         """
-        if "tools" not in self.capabilities:
-            self.capabilities["tools"] = []
-        
-        self.capabilities["tools"].append(tool_def)
+        self._tools_list.append(tool_def)
+        self._tool_names.add(tool_def["name"])
     
     def add_prompt(self, prompt_def: Dict[str, Any]) -> None:
         """
@@ -61,10 +133,8 @@ class MockProtocolClient(ProtocolClient):
         Args:
             prompt_def: The prompt definition
         """
-        if "prompts" not in self.capabilities:
-            self.capabilities["prompts"] = []
-        
-        self.capabilities["prompts"].append(prompt_def)
+        self._prompts_list.append(prompt_def)
+        self._prompt_names.add(prompt_def["name"])
     
     def add_resource(self, resource_def: Dict[str, Any]) -> None:
         """
@@ -73,82 +143,75 @@ class MockProtocolClient(ProtocolClient):
         Args:
             resource_def: The resource definition
         """
-        if "resources" not in self.capabilities:
-            self.capabilities["resources"] = []
-        
-        self.capabilities["resources"].append(resource_def)
+        self._resources_list.append(resource_def)
+        self._resource_names.add(resource_def["name"])
     
-    def set_tool_result(self, tool_name: str, params_hash: str, result: Any) -> None:
+    def set_tool_result(self, tool_name: str, params_hash: Hashable, result: Any) -> None:
         """
         Set the result for a specific tool call.
         
         Args:
             tool_name: Name of the tool
-            params_hash: Hash of the parameters
+            params_hash: Key for the parameters, as returned by _hash_params
             result: The result to return
         """
-        if tool_name not in self.tool_results:
-            self.tool_results[tool_name] = {}
-        
-        self.tool_results[tool_name][params_hash] = result
+        self.tool_results[(tool_name, params_hash)] = result
     
-    def set_streaming_tool_result(self, tool_name: str, params_hash: str, results: List[Any]) -> None:
+    def set_streaming_tool_result(self, tool_name: str, params_hash: Hashable, results: List[Any]) -> None:
         """
         Set the streaming result for a specific tool call.
         
         Args:
             tool_name: Name of the tool
-            params_hash: Hash of the parameters
+            params_hash: Key for the parameters, as returned by _hash_params
             results: The list of results to return
         """
-        if tool_name not in self.streaming_tool_results:
-            self.streaming_tool_results[tool_name] = {}
-        
-        self.streaming_tool_results[tool_name][params_hash] = results
+        self.streaming_tool_results[(tool_name, params_hash)] = results
     
-    def set_prompt_result(self, prompt_name: str, params_hash: str, result: Any) -> None:
+    def set_prompt_result(self, prompt_name: str, params_hash: Hashable, result: Any) -> None:
         """
         Set the result for a specific prompt.
         
         Args:
             prompt_name: Name of the prompt
-            params_hash: Hash of the parameters
+            params_hash: Key for the parameters, as returned by _hash_params
             result: The result to return
         """
-        if prompt_name not in self.prompt_results:
-            self.prompt_results[prompt_name] = {}
-        
-        self.prompt_results[prompt_name][params_hash] = result
+        self.prompt_results[(prompt_name, params_hash)] = result
     
-    def set_resource_result(self, resource_name: str, params_hash: str, result: Any) -> None:
+    def set_resource_result(self, resource_name: str, params_hash: Hashable, result: Any) -> None:
         """
         Set the result for a specific resource.
         
         Args:
             resource_name: Name of the resource
-            params_hash: Hash of the parameters
+            params_hash: Key for the parameters, as returned by _hash_params
             result: The result to return
         """
-        if resource_name not in self.resource_results:
-            self.resource_results[resource_name] = {}
-        
-        self.resource_results[resource_name][params_hash] = result
+        self.resource_results[(resource_name, params_hash)] = result
     
-    def _hash_params(self, params: Optional[Dict[str, Any]]) -> str:
+    def _hash_params(self, params: Optional[Dict[str, Any]]) -> Hashable:
         """
-        Create a simple hash for parameters.
+        Create a lookup key for parameters.
+        
+        The key compares equal for equal parameters regardless of key order.
         
         Args:
             params: The parameters to hash
             
         Returns:
-            A string hash of the parameters
+            A hashable key for the parameters
         """
         if not params:
-            return "empty"
-        
-        # For testing purposes, we can use a simple string representation
-        return str(sorted(params.items()))
+            return _EMPTY_PARAMS
+        
+        key = _freeze(params)
+        try:
+            hash(key)
+        except TypeError:
+            # Parameters contain unhashable values; fall back to canonical JSON
+            return json.dumps(params, sort_keys=True, separators=(',', ':'), default=str)
+        return key
     
     async def initialize(self) -> Dict[str, Any]:
         """
@@ -160,7 +223,8 @@ class MockProtocolClient(ProtocolClient):
         Raises:
             ProtocolError: If initialization fails
         """
-        self.connected = True
+        if not self.connected:
+            self.connected = True
         return self.capabilities
     
     async def ping(self) -> bool:
@@ -182,7 +246,7 @@ class MockProtocolClient(ProtocolClient):
         Raises:
             ProtocolError: If an error occurs
         """
-        return self.capabilities.get("tools", [])
+        return list(self._tools_list)
     
     async def call_tool(self, tool_name: str, params: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -200,15 +264,14 @@ class MockProtocolClient(ProtocolClient):
             ToolExecutionError: If an error occurs during tool execution
         """
         # Check if tool exists
-        if not any(tool["name"] == tool_name for tool in self.capabilities.get("tools", [])):
+        if tool_name not in self._tool_names:
             raise InvalidToolError(tool_name)
         
         # Get the result
         params_hash = self._hash_params(params)
         
-        if tool_name in self.tool_results and params_hash in self.tool_results[tool_name]:
-            result = self.tool_results[tool_name][params_hash]
-            
+        result = self.tool_results.get((tool_name, params_hash), _MISSING)
+        if result is not _MISSING:
             # If the result is an exception, raise it
             if isinstance(result, Exception):
                 raise result
@@ -218,6 +281,44 @@ class MockProtocolClient(ProtocolClient):
         # Default result
         return {"result": f"Mock result for {tool_name}"}
     
+    async def call_tools_batch(self, calls: List[Tuple[str, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """
+        Call several tools in one pass.
+        
+        Equivalent to awaiting call_tool for each call in order, without
+        scheduling a coroutine per call.
+        
+        Args:
+            calls: List of (tool_name, params) pairs
+            
+        Returns:
+            The tool execution results, in call order
+            
+        Raises:
+            InvalidToolError: If any tool is not valid
+            ToolExecutionError: If an error occurs during tool execution
+        """
+        tool_names = self._tool_names
+        tool_results = self.tool_results
+        hash_params = self._hash_params
+        
+        results = []
+        for tool_name, params in calls:
+            # Check if tool exists
+            if tool_name not in tool_names:
+                raise InvalidToolError(tool_name)
+            
+            result = tool_results.get((tool_name, hash_params(params)), _MISSING)
+            if result is _MISSING:
+                # Default result
+                result = {"result": f"Mock result for {tool_name}"}
+            elif isinstance(result, Exception):
+                raise result
+            
+            results.append(result)
+        
+        return results
+    
     async def call_streaming_tool(self, tool_name: str, params: Dict[str, Any]) -> AsyncGenerator[Dict[str, Any], None]:
         """
         Call a tool on the server with streaming response.
@@ -234,27 +335,24 @@ class MockProtocolClient(ProtocolClient):
             ToolExecutionError: If an error occurs during tool execution
         """
         # Check if tool exists
-        if not any(tool["name"] == tool_name for tool in self.capabilities.get("tools", [])):
+        if tool_name not in self._tool_names:
             raise InvalidToolError(tool_name)
         
         # Get the result
         params_hash = self._hash_params(params)
         
-        if tool_name in self.streaming_tool_results and params_hash in self.streaming_tool_results[tool_name]:
-            results = self.streaming_tool_results[tool_name][params_hash]
-            
-            # Yield each result
-            for result in results:
-                # If the result is an exception, raise it
-                if isinstance(result, Exception):
-                    raise result
-                
-                yield result
-            
-            return
+        results = self.streaming_tool_results.get((tool_name, params_hash), _MISSING)
+        if results is _MISSING:
+            # Default result
+            results = ({"result": f"Mock streaming result for {tool_name}"},)
         
-        # Default result
-        yield {"result": f"Mock streaming result for {tool_name}"}
+        # Yield each result
+        for result in results:
+            # If the result is an exception, raise it
+            if isinstance(result, Exception):
+                raise result
+            
+            yield result
     
     async def get_prompts(self) -> List[Dict[str, Any]]:
         """
@@ -266,7 +364,7 @@ class MockProtocolClient(ProtocolClient):
         Raises:
             ProtocolError: If an error occurs
         """
-        return self.capabilities.get("prompts", [])
+        return list(self._prompts_list)
     
     async def get_prompt(self, prompt_name: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
@@ -283,15 +381,14 @@ class MockProtocolClient(ProtocolClient):
             ProtocolError: If an error occurs
         """
         # Check if prompt exists
-        if not any(prompt["name"] == prompt_name for prompt in self.capabilities.get("prompts", [])):
+        if prompt_name not in self._prompt_names:
             raise MCPProtocolError(f"Prompt not found: {prompt_name}", 1201)
         
         # Get the result
         params_hash = self._hash_params(params)
         
-        if prompt_name in self.prompt_results and params_hash in self.prompt_results[prompt_name]:
-            result = self.prompt_results[prompt_name][params_hash]
-            
+        result = self.prompt_results.get((prompt_name, params_hash), _MISSING)
+        if result is not _MISSING:
             # If the result is an exception, raise it
             if isinstance(result, Exception):
                 raise result
@@ -311,7 +408,7 @@ class MockProtocolClient(ProtocolClient):
         Raises:
             ProtocolError: If an error occurs
         """
-        return self.capabilities.get("resources", [])
+        return list(self._resources_list)
     
     async def get_resource(self, resource_name: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
@@ -328,15 +425,14 @@ class MockProtocolClient(ProtocolClient):
             ProtocolError: If an error occurs
         """
         # Check if resource exists
-        if not any(resource["name"] == resource_name for resource in self.capabilities.get("resources", [])):
+        if resource_name not in self._resource_names:
             raise MCPProtocolError(f"Resource not found: {resource_name}", 1301)
         
         # Get the result
         params_hash = self._hash_params(params)
         
-        if resource_name in self.resource_results and params_hash in self.resource_results[resource_name]:
-            result = self.resource_results[resource_name][params_hash]
-            
+        result = self.resource_results.get((resource_name, params_hash), _MISSING)
+        if result is not _MISSING:
             # If the result is an exception, raise it
             if isinstance(result, Exception):
                 raise result
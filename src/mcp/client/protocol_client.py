@@ -5,13 +5,67 @@ MCP protocol client interface.
 This module defines the abstract ProtocolClient interface that all
 protocol client implementations must follow.
 """
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional, AsyncGenerator
+from typing import Any, Dict, List, Optional, AsyncGenerator, AsyncIterator, TypeVar
+
+from mcp.transport.base.transport import SPSCBuffer
+
+T = TypeVar("T")
+
+# Queue marker for the end of a buffered stream
+_END = object()
+
+
+async def buffered_stream(stream: AsyncIterator[T], size: int = 4) -> AsyncGenerator[T, None]:
+    """
+    Prefetch items from an async stream into a bounded queue.
+    
+    A background task reads ahead up to `size` items while the consumer
+    processes the current one, so chained streaming calls can overlap.
+    Errors raised by the stream are re-raised to the consumer in order.
+    
+    Args:
+        stream: The async stream to read from (e.g. call_streaming_tool)
+        size: Maximum number of items to read ahead
+        
+    Returns:
+        An async generator yielding the items of the stream
+    """
+    queue = SPSCBuffer(size)
+    
+    async def produce() -> None:
+        end = (_END, None)
+        try:
+            async for item in stream:
+                await queue.put((item, None))
+        except BaseException as e:
+            end = (_END, e)
+            raise
+        finally:
+            # Always wake the consumer, even if the producer was cancelled
+            queue.put_nowait(end)
+    
+    producer = asyncio.create_task(produce())
+    try:
+        while True:
+            item, error = await queue.get()
+            if item is _END:
+                if error is not None:
+                    raise error
+                return
+            yield item
+    finally:
+        # Stop reading ahead if the consumer stops early
+        producer.cancel()
+        await asyncio.gather(producer, return_exceptions=True)
 
 
 class ProtocolClient(ABC):
     """Base class for MCP protocol clients."""
     
+    __slots__ = ()
+    
     @abstractmethod
     async def initialize(self) -> Dict[str, Any]:
         """
@@ -142,6 +196,21 @@ class ProtocolClient(ABC):
         """
         pass
     
+    async def discover(self) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Get the available tools, prompts and resources concurrently.
+        
+        Returns:
+            Dict with "tools", "prompts" and "resources" definition lists
+            
+        Raises:
+            ProtocolError: If an error occurs
+        """
+        tools, prompts, resources = await asyncio.gather(
+            self.get_tools(), self.get_prompts(), self.get_resources()
+        )
+        return {"tools": tools, "prompts": prompts, "resources": resources}
+    
     @abstractmethod
     async def shutdown(self) -> bool:
         """
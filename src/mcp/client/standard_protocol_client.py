@@ -5,11 +5,16 @@ Standard implementation of the MCP protocol client.
 This module provides a standard implementation of the ProtocolClient
 interface for MCP servers.
 """
+import asyncio
+import copy
+import json
 import logging
-from typing import Any, Dict, List, Optional, AsyncGenerator
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, List, Optional, AsyncGenerator, Set, Tuple, Union
 
 from mcp.client.protocol_client import ProtocolClient
-from mcp.transport.base.transport import Transport, TransportError
+from mcp.transport.base.transport import STREAM_RESULT, Transport, TransportError
 from mcp.messages.message_method import MessageMethod
 from mcp.messages.exceptions import (
     MCPProtocolError, 
@@ -19,30 +24,207 @@ from mcp.messages.exceptions import (
 )
 
 
+# Sentinel for responses without a result and for "no default" in _unwrap
+_MISSING = object()
+
+# Method names, bound as module globals to skip the class attribute lookup
+_M_INITIALIZE = MessageMethod.INITIALIZE
+_M_SHUTDOWN = MessageMethod.SHUTDOWN
+_M_PING = MessageMethod.PING
+_M_TOOLS_LIST = MessageMethod.TOOLS_LIST
+_M_TOOLS_CALL = MessageMethod.TOOLS_CALL
+_M_PROMPTS_LIST = MessageMethod.PROMPTS_LIST
+_M_PROMPTS_GET = MessageMethod.PROMPTS_GET
+_M_RESOURCES_LIST = MessageMethod.RESOURCES_LIST
+_M_RESOURCES_GET = MessageMethod.RESOURCES_GET
+
+# Parameters of the initialize request. Shared by every call; never mutate.
+_INIT_PAYLOAD = {
+    "clientInfo": {
+        "name": "mcp-cli",
+        "version": "1.0.0"
+    },
+    "capabilities": {
+        "tools": True,
+        "prompts": True,
+        "resources": True
+    }
+}
+
+# The tools, prompts and resources list requests, sent together as one batch
+_LIST_REQUESTS = [(_M_TOOLS_LIST, {}), (_M_PROMPTS_LIST, {}), (_M_RESOURCES_LIST, {})]
+
+
+def _protocol_error(error: Optional[Dict[str, Any]]) -> MCPProtocolError:
+    """
+    Convert a JSON-RPC error object into an MCPProtocolError.
+    
+    Args:
+        error: The JSON-RPC error object, or None for an invalid response
+        
+    Returns:
+        The protocol error
+    """
+    if error is None:
+        return MCPProtocolError("Invalid response from server", 0)
+    return MCPProtocolError(
+        error.get("message", "Unknown error"),
+        error.get("code", 0),
+        error.get("data")
+    )
+
+
+def _initialization_error(error: Optional[Dict[str, Any]]) -> InitializationError:
+    """
+    Convert a JSON-RPC error object from initialize into an InitializationError.
+    
+    Args:
+        error: The JSON-RPC error object, or None for an invalid response
+        
+    Returns:
+        The initialization error
+    """
+    if error is None:
+        return InitializationError("Invalid response from server")
+    return InitializationError(
+        error.get("message", "Unknown initialization error"),
+        error.get("data")
+    )
+
+
+class _PooledConnection:
+    """An initialized connection shared by pooled clients."""
+    
+    __slots__ = ('transport', 'capabilities', 'users', 'idle_since')
+    
+    def __init__(self, transport: Transport, capabilities: Dict[str, Any]):
+        self.transport = transport
+        self.capabilities = capabilities
+        self.users = 1
+        self.idle_since = 0.0
+
+
+# Open connections of pooled clients, keyed by Transport.endpoint_key()
+_POOL: Dict[str, _PooledConnection] = {}
+
+# Pending eviction tasks, referenced so they are not garbage collected
+_EVICTION_TASKS: Set[asyncio.Task] = set()
+
+_logger = logging.getLogger("mcp-cli.protocol-client")
+
+
+async def _close_transport(transport: Transport) -> bool:
+    """
+    Send shutdown to the server and disconnect the transport.
+    
+    Args:
+        transport: The transport to close
+        
+    Returns:
+        True if shutdown was successful, False otherwise
+    """
+    try:
+        await transport.send_message(_M_SHUTDOWN, {})
+        await transport.disconnect()
+        return True
+    except Exception as e:
+        _logger.warning(f"Shutdown error: {str(e)}")
+        return False
+
+
+async def _evict_idle(idle_timeout_s: float) -> None:
+    """
+    Close pooled connections that have been idle for at least idle_timeout_s.
+    
+    Args:
+        idle_timeout_s: Idle time in seconds after which a connection is closed
+    """
+    await asyncio.sleep(idle_timeout_s)
+    now = time.monotonic()
+    for key, entry in list(_POOL.items()):
+        if entry.users == 0 and now - entry.idle_since >= idle_timeout_s:
+            del _POOL[key]
+            await _close_transport(entry.transport)
+
+
 class StandardProtocolClient(ProtocolClient):
     """Standard implementation of the MCP protocol client."""
     
-    def __init__(self, transport: Transport):
+    def __init__(self, transport: Transport, pool: bool = False, idle_timeout_s: float = 60.0,
+                 cache_tools: Iterable[str] = (), tool_cache_size: int = 256):
         """
         Initialize the standard protocol client.
         
+        With pooling enabled, clients whose transports share an endpoint key
+        reuse one initialized connection, and shutdown() leaves it open for
+        idle_timeout_s seconds so that later clients can pick it up.
+        
+        Results of the tools named in cache_tools are kept in an LRU cache
+        keyed by tool name and parameters, so only list tools whose calls
+        are idempotent. Callers get copies of cached results, and calls whose
+        parameters are not JSON-serializable are never cached.
+        
         Args:
             transport: The transport to use for communication
+            pool: Whether to share the connection with other pooled clients
+            idle_timeout_s: Seconds an unused pooled connection stays open
+            cache_tools: Names of the tools whose results may be cached
+            tool_cache_size: Maximum number of cached tool results
         """
-        self.transport = transport
+        self._bind(transport)
         self.capabilities = None
-        self.logger = logging.getLogger("mcp-cli.protocol-client")
+        self.logger = _logger
+        self._pool_key = transport.endpoint_key() if pool else None
+        self._idle_timeout_s = idle_timeout_s
+        self._pooled: Optional[_PooledConnection] = None
+        self.cache_tools = frozenset(cache_tools)
+        self._tool_cache: "OrderedDict[Tuple[str, str], Any]" = OrderedDict()
+        self._tool_cache_max = tool_cache_size
+    
+    def _bind(self, transport: Transport) -> None:
+        """
+        Use a transport for all further communication.
+        
+        Args:
+            transport: The transport to use
+        """
+        self.transport = transport
+        # Bound transport methods, resolved once instead of on every call
+        self._send = transport.send_message
+        self._send_stream = transport.send_streaming_message
+        self._send_batch = transport.send_batch
     
     async def initialize(self) -> Dict[str, Any]:
         """
         Initialize the connection and get capabilities.
         
+        Calling this again on an initialized connection returns the cached
+        capabilities without negotiating again. Once the transport has lost
+        its connection, it is reconnected and negotiates again.
+        
         Returns:
             The server capabilities
             
         Raises:
             InitializationError: If initialization fails
         """
+        if self.capabilities is not None:
+            if self.transport.is_connected():
+                return self.capabilities
+            self.capabilities = None
+            self._tool_cache.clear()
+        
+        # Reuse an open pooled connection to the same endpoint
+        if self._pool_key is not None and self._pooled is None:
+            pooled = _POOL.get(self._pool_key)
+            if pooled is not None:
+                pooled.users += 1
+                self._pooled = pooled
+                self._bind(pooled.transport)
+                if pooled.transport.is_connected():
+                    self.capabilities = pooled.capabilities
+                    return self.capabilities
+        
         try:
             # Connect to the server
             success = await self.transport.connect()
@@ -50,41 +232,18 @@ class StandardProtocolClient(ProtocolClient):
                 raise InitializationError("Failed to connect to server")
             
             # Send initialize message
-            response = await self.transport.send_message(
-                MessageMethod.INITIALIZE,
-                {
-                    "clientInfo": {
-                        "name": "mcp-cli",
-                        "version": "1.0.0"
-                    },
-                    "capabilities": {
-                        "tools": True,
-                        "prompts": True,
-                        "resources": True
-                    }
-                }
-            )
+            response = await self._send(_M_INITIALIZE, _INIT_PAYLOAD)
             
-            if "result" in response:
-                self.capabilities = response["result"]
-                return self.capabilities
-            else:
-                # Handle error response
-                if "error" in response:
-                    error = response["error"]
-                    raise InitializationError(
-                        error.get("message", "Unknown initialization error"),
-                        error.get("data")
-                    )
-                else:
-                    raise InitializationError("Invalid response from server")
+            self.capabilities = self._unwrap(response, _initialization_error)
+            if self._pooled is not None:
+                # Reconnected a pooled connection that had been lost
+                self._pooled.capabilities = self.capabilities
+            elif self._pool_key is not None and self._pool_key not in _POOL:
+                self._pooled = _POOL[self._pool_key] = _PooledConnection(self.transport, self.capabilities)
+            return self.capabilities
                 
         except TransportError as e:
             raise InitializationError(f"Transport error: {e.message}", {"cause": str(e.cause) if e.cause else None})
-        except Exception as e:
-            if not isinstance(e, MCPProtocolError):
-                raise InitializationError(f"Unexpected error: {str(e)}")
-            raise
     
     async def ping(self) -> bool:
         """
@@ -94,9 +253,9 @@ class StandardProtocolClient(ProtocolClient):
             True if the server is responsive, False otherwise
         """
         try:
-            response = await self.transport.send_message(MessageMethod.PING, {})
+            response = await self._send(_M_PING, {})
             return "result" in response
-        except Exception as e:
+        except (TransportError, asyncio.TimeoutError, OSError) as e:
             self.logger.warning(f"Ping failed: {str(e)}")
             return False
     
@@ -111,21 +270,10 @@ class StandardProtocolClient(ProtocolClient):
             ProtocolError: If an error occurs
         """
         try:
-            response = await self.transport.send_message(MessageMethod.TOOLS_LIST, {})
-            
-            if "result" in response:
-                return response["result"].get("tools", [])
-            else:
-                # Handle error response
-                if "error" in response:
-                    error = response["error"]
-                    raise MCPProtocolError(
-                        error.get("message", "Unknown error"),
-                        error.get("code", 0),
-                        error.get("data")
-                    )
-                else:
-                    return []
+            response = await self._send(_M_TOOLS_LIST, {})
+            
+            result = self._unwrap(response, _protocol_error, None)
+            return result.get("tools", []) if result is not None else []
                 
         except TransportError as e:
             raise MCPProtocolError(f"Transport error: {e.message}", 0, {"cause": str(e.cause) if e.cause else None})
@@ -145,33 +293,29 @@ class StandardProtocolClient(ProtocolClient):
             InvalidToolError: If the tool is not valid
             ToolExecutionError: If an error occurs during tool execution
         """
+        cache = self._tool_cache
+        key = None
+        if tool_name in self.cache_tools:
+            try:
+                key = (tool_name, json.dumps(params, sort_keys=True, separators=(",", ":")))
+            except (TypeError, ValueError):
+                # No stable key for these parameters; call the tool uncached
+                key = None
+            result = cache.get(key, _MISSING) if key is not None else _MISSING
+            if result is not _MISSING:
+                cache.move_to_end(key)
+                return copy.deepcopy(result)
+        
         try:
-            response = await self.transport.send_message(
-                MessageMethod.TOOLS_CALL,
+            response = await self._send(
+                _M_TOOLS_CALL,
                 {
                     "name": tool_name,
                     "parameters": params
                 }
             )
             
-            if "result" in response:
-                return response["result"]
-            else:
-                # Handle error response
-                if "error" in response:
-                    error = response["error"]
-                    code = error.get("code", 0)
-                    
-                    if code == 1100:  # INVALID_TOOL
-                        raise InvalidToolError(tool_name, error.get("data"))
-                    else:
-                        raise ToolExecutionError(
-                            tool_name,
-                            error.get("message", "Unknown error"),
-                            error.get("data")
-                        )
-                else:
-                    raise ToolExecutionError(tool_name, "Invalid response from server")
+            result = self._unwrap(response, lambda error: self._tool_error(tool_name, error))
                 
         except TransportError as e:
             raise ToolExecutionError(
@@ -179,6 +323,181 @@ class StandardProtocolClient(ProtocolClient):
                 f"Transport error: {e.message}", 
                 {"cause": str(e.cause) if e.cause else None}
             )
+        
+        if key is not None:
+            cache[key] = copy.deepcopy(result)
+            if len(cache) > self._tool_cache_max:
+                cache.popitem(last=False)
+        return result
+    
+    @staticmethod
+    def _unwrap(response: Dict[str, Any], make_error: Callable[[Optional[Dict[str, Any]]], Exception],
+                default: Any = _MISSING) -> Any:
+        """
+        Get the result of a JSON-RPC response.
+        
+        Args:
+            response: The JSON-RPC response
+            make_error: Converts the error object (None for an invalid
+                response) into the exception to raise
+            default: Value to return for a response with neither a result
+                nor an error (raises make_error(None) if not given)
+            
+        Returns:
+            The result of the response
+            
+        Raises:
+            Exception: The exception built by make_error
+        """
+        result = response.get("result", _MISSING)
+        if result is not _MISSING:
+            return result
+        
+        error = response.get("error")
+        if error is not None or default is _MISSING:
+            raise make_error(error)
+        return default
+    
+    @staticmethod
+    def _tool_error(tool_name: str, error: Optional[Dict[str, Any]]) -> MCPProtocolError:
+        """
+        Convert a JSON-RPC error object from a tool call into an exception.
+        
+        Args:
+            tool_name: Name of the tool that was called
+            error: The JSON-RPC error object, or None for an invalid response
+            
+        Returns:
+            InvalidToolError or ToolExecutionError
+        """
+        if error is None:
+            return ToolExecutionError(tool_name, "Invalid response from server")
+        if error.get("code", 0) == 1100:  # INVALID_TOOL
+            return InvalidToolError(tool_name, error.get("data"))
+        return ToolExecutionError(
+            tool_name,
+            error.get("message", "Unknown error"),
+            error.get("data")
+        )
+    
+    async def call_tools_batch(self, calls: List[Tuple[str, Dict[str, Any]]], 
+                               max_concurrent: Optional[int] = None,
+                               stop_on_error: bool = False) -> List[Union[Dict[str, Any], MCPProtocolError]]:
+        """
+        Call several tools on the server using JSON-RPC batches.
+        
+        Each batch is sent in a single round-trip instead of one per call.
+        If the transport fails to send a batch, its calls are sent concurrently
+        as single requests instead.
+        
+        Args:
+            calls: List of (tool_name, params) pairs
+            max_concurrent: Maximum number of calls per batch (None for a single batch)
+            stop_on_error: Raise the first failed call and send no further batches
+            
+        Returns:
+            The tool execution results, in call order. Unless stop_on_error is
+            set, failed calls are returned as their exception.
+            
+        Raises:
+            InvalidToolError: If a tool is not valid and stop_on_error is set
+            ToolExecutionError: If a tool call fails and stop_on_error is set,
+                or if a transport error occurs
+        """
+        if not calls:
+            return []
+        
+        size = max_concurrent or len(calls)
+        results: List[Union[Dict[str, Any], MCPProtocolError]] = []
+        
+        for start in range(0, len(calls), size):
+            chunk = calls[start:start + size]
+            requests = [
+                (_M_TOOLS_CALL, {"name": tool_name, "parameters": params})
+                for tool_name, params in chunk
+            ]
+            try:
+                try:
+                    responses = await self._send_batch(requests)
+                except (TransportError, asyncio.TimeoutError) as e:
+                    self.logger.debug(f"Batch failed ({e}); sending {len(requests)} tool calls separately")
+                    responses = await asyncio.gather(*(self._send(method, params) for method, params in requests))
+            except TransportError as e:
+                raise ToolExecutionError(
+                    ", ".join(tool_name for tool_name, _ in chunk),
+                    f"Transport error: {e.message}",
+                    {"cause": str(e.cause) if e.cause else None}
+                )
+            
+            for (tool_name, _), response in zip(chunk, responses):
+                result = response.get("result", _MISSING)
+                if result is _MISSING:
+                    result = self._tool_error(tool_name, response.get("error"))
+                    if stop_on_error:
+                        raise result
+                results.append(result)
+        
+        return results
+    
+    async def list_capabilities(self) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Get the available tools, prompts and resources in one round-trip.
+        
+        Returns:
+            Dict with "tools", "prompts" and "resources" definition lists
+            
+        Raises:
+            ProtocolError: If an error occurs
+        """
+        try:
+            responses = await self._send_batch(_LIST_REQUESTS)
+        except TransportError as e:
+            raise MCPProtocolError(f"Transport error: {e.message}", 0, {"cause": str(e.cause) if e.cause else None})
+        
+        return self._unwrap_lists(responses)
+    
+    def _unwrap_lists(self, responses: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Get the definition lists from the responses to _LIST_REQUESTS.
+        
+        Args:
+            responses: The responses, in request order
+            
+        Returns:
+            Dict with "tools", "prompts" and "resources" definition lists
+            
+        Raises:
+            ProtocolError: If the server returned an error
+        """
+        lists = {}
+        for kind, response in zip(("tools", "prompts", "resources"), responses):
+            result = self._unwrap(response, _protocol_error, None)
+            lists[kind] = result.get(kind, []) if result is not None else []
+        
+        return lists
+    
+    async def discover(self) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Get the available tools, prompts and resources in one round-trip.
+        
+        Overrides the concurrent default: the three list requests go out as
+        one JSON-RPC batch, which costs one write and one response instead
+        of three, whether or not the transport overlaps requests. If the
+        batch fails, the concurrent default is used instead.
+        
+        Returns:
+            Dict with "tools", "prompts" and "resources" definition lists
+            
+        Raises:
+            ProtocolError: If an error occurs
+        """
+        try:
+            responses = await self._send_batch(_LIST_REQUESTS)
+        except (TransportError, asyncio.TimeoutError) as e:
+            self.logger.debug(f"Batch failed ({e}); listing capabilities separately")
+            return await super().discover()
+        
+        return self._unwrap_lists(responses)
     
     async def call_streaming_tool(self, tool_name: str, params: Dict[str, Any]) -> AsyncGenerator[Dict[str, Any], None]:
         """
@@ -196,30 +515,21 @@ class StandardProtocolClient(ProtocolClient):
             ToolExecutionError: If an error occurs during tool execution
         """
         try:
-            response_stream = self.transport.send_streaming_message(
-                MessageMethod.TOOLS_CALL,
+            response_stream = self._send_stream(
+                _M_TOOLS_CALL,
                 {
                     "name": tool_name,
                     "parameters": params
-                }
+                },
+                extract=True
             )
             
-            async for response in response_stream:
-                if "result" in response:
-                    yield response["result"]
-                elif "error" in response:
+            async for kind, payload in response_stream:
+                if kind is STREAM_RESULT:
+                    yield payload
+                else:
                     # Handle error response
-                    error = response["error"]
-                    code = error.get("code", 0)
-                    
-                    if code == 1100:  # INVALID_TOOL
-                        raise InvalidToolError(tool_name, error.get("data"))
-                    else:
-                        raise ToolExecutionError(
-                            tool_name,
-                            error.get("message", "Unknown error"),
-                            error.get("data")
-                        )
+                    raise self._tool_error(tool_name, payload)
                 
         except TransportError as e:
             raise ToolExecutionError(
@@ -239,21 +549,10 @@ class StandardProtocolClient(ProtocolClient):
             ProtocolError: If an error occurs
         """
         try:
-            response = await self.transport.send_message(MessageMethod.PROMPTS_LIST, {})
-            
-            if "result" in response:
-                return response["result"].get("prompts", [])
-            else:
-                # Handle error response
-                if "error" in response:
-                    error = response["error"]
-                    raise MCPProtocolError(
-                        error.get("message", "Unknown error"),
-                        error.get("code", 0),
-                        error.get("data")
-                    )
-                else:
-                    return []
+            response = await self._send(_M_PROMPTS_LIST, {})
+            
+            result = self._unwrap(response, _protocol_error, None)
+            return result.get("prompts", []) if result is not None else []
                 
         except TransportError as e:
             raise MCPProtocolError(f"Transport error: {e.message}", 0, {"cause": str(e.cause) if e.cause else None})
@@ -277,21 +576,9 @@ class StandardProtocolClient(ProtocolClient):
             if params:
                 request_params["parameters"] = params
                 
-            response = await self.transport.send_message(MessageMethod.PROMPTS_GET, request_params)
-            
-            if "result" in response:
-                return response["result"]
-            else:
-                # Handle error response
-                if "error" in response:
-                    error = response["error"]
-                    raise MCPProtocolError(
-                        error.get("message", "Unknown error"),
-                        error.get("code", 0),
-                        error.get("data")
-                    )
-                else:
-                    raise MCPProtocolError("Invalid response from server", 0)
+            response = await self._send(_M_PROMPTS_GET, request_params)
+            
+            return self._unwrap(response, _protocol_error)
                 
         except TransportError as e:
             raise MCPProtocolError(f"Transport error: {e.message}", 0, {"cause": str(e.cause) if e.cause else None})
@@ -307,21 +594,10 @@ class StandardProtocolClient(ProtocolClient):
             ProtocolError: If an error occurs
         """
         try:
-            response = await self.transport.send_message(MessageMethod.RESOURCES_LIST, {})
-            
-            if "result" in response:
-                return response["result"].get("resources", [])
-            else:
-                # Handle error response
-                if "error" in response:
-                    error = response["error"]
-                    raise MCPProtocolError(
-                        error.get("message", "Unknown error"),
-                        error.get("code", 0),
-                        error.get("data")
-                    )
-                else:
-                    return []
+            response = await self._send(_M_RESOURCES_LIST, {})
+            
+            result = self._unwrap(response, _protocol_error, None)
+            return result.get("resources", []) if result is not None else []
                 
         except TransportError as e:
             raise MCPProtocolError(f"Transport error: {e.message}", 0, {"cause": str(e.cause) if e.cause else None})
@@ -345,21 +621,9 @@ class StandardProtocolClient(ProtocolClient):
             if params:
                 request_params["parameters"] = params
                 
-            response = await self.transport.send_message(MessageMethod.RESOURCES_GET, request_params)
-            
-            if "result" in response:
-                return response["result"]
-            else:
-                # Handle error response
-                if "error" in response:
-                    error = response["error"]
-                    raise MCPProtocolError(
-                        error.get("message", "Unknown error"),
-                        error.get("code", 0),
-                        error.get("data")
-                    )
-                else:
-                    raise MCPProtocolError("Invalid response from server", 0)
+            response = await self._send(_M_RESOURCES_GET, request_params)
+            
+            return self._unwrap(response, _protocol_error)
                 
         except TransportError as e:
             raise MCPProtocolError(f"Transport error: {e.message}", 0, {"cause": str(e.cause) if e.cause else None})
@@ -368,13 +632,44 @@ class StandardProtocolClient(ProtocolClient):
         """
         Shutdown the connection.
         
+        A pooled connection is released instead, and closed once it has
+        been idle for idle_timeout_s seconds.
+        
         Returns:
             True if shutdown was successful, False otherwise
         """
-        try:
-            await self.transport.send_message(MessageMethod.SHUTDOWN, {})
-            await self.transport.disconnect()
-            return True
-        except Exception as e:
-            self.logger.warning(f"Shutdown error: {str(e)}")
-            return False
+        self.capabilities = None
+        self._tool_cache.clear()
+        pooled = self._pooled
+        if pooled is None:
+            return await _close_transport(self.transport)
+        
+        self._pooled = None
+        pooled.users -= 1
+        if pooled.users == 0:
+            pooled.idle_since = time.monotonic()
+            task = asyncio.ensure_future(_evict_idle(self._idle_timeout_s))
+            _EVICTION_TASKS.add(task)
+            task.add_done_callback(_EVICTION_TASKS.discard)
+        return True
+    
+    async def close(self, force: bool = True) -> bool:
+        """
+        Close the connection, even if it is pooled.
+        
+        Args:
+            force: Close a pooled connection that other clients still use
+            
+        Returns:
+            True if shutdown was successful, False otherwise
+        """
+        pooled = self._pooled
+        if pooled is not None and not force and pooled.users > 1:
+            return await self.shutdown()
+        
+        self.capabilities = None
+        self._tool_cache.clear()
+        self._pooled = None
+        if pooled is not None and _POOL.get(self._pool_key) is pooled:
+            del _POOL[self._pool_key]
+        return await _close_transport(self.transport)
@@ -36,6 +36,29 @@ class ErrorCodes:
     DB_QUERY_ERROR = 3001
     DB_TABLE_NOT_FOUND = 3002
     
+    # Default messages for the error codes
+    _MESSAGES = {
+        PARSE_ERROR: "Parse error",
+        INVALID_REQUEST: "Invalid request",
+        METHOD_NOT_FOUND: "Method not found",
+        INVALID_PARAMS: "Invalid parameters",
+        INTERNAL_ERROR: "Internal error",
+        INITIALIZATION_FAILED: "Initialization failed",
+        INVALID_TOOL: "Invalid tool",
+        TOOL_EXECUTION_FAILED: "Tool execution failed",
+        INVALID_PROMPT: "Invalid prompt",
+        PROMPT_NOT_FOUND: "Prompt not found",
+        INVALID_RESOURCE: "Invalid resource",
+        RESOURCE_NOT_FOUND: "Resource not found",
+        FS_FILE_NOT_FOUND: "File not found",
+        FS_PERMISSION_DENIED: "Permission denied",
+        FS_IO_ERROR: "I/O error",
+        FS_INVALID_PATH: "Invalid path",
+        DB_CONNECTION_ERROR: "Database connection error",
+        DB_QUERY_ERROR: "Database query error",
+        DB_TABLE_NOT_FOUND: "Table not found"
+    }
+    
     @classmethod
     def get_message(cls, code: int) -> str:
         """
@@ -47,26 +70,4 @@ class ErrorCodes:
         Returns:
             The default error message
         """
-        messages = {
-            cls.PARSE_ERROR: "Parse error",
-            cls.INVALID_REQUEST: "Invalid request",
-            cls.METHOD_NOT_FOUND: "Method not found",
-            cls.INVALID_PARAMS: "Invalid parameters",
-            cls.INTERNAL_ERROR: "Internal error",
-            cls.INITIALIZATION_FAILED: "Initialization failed",
-            cls.INVALID_TOOL: "Invalid tool",
-            cls.TOOL_EXECUTION_FAILED: "Tool execution failed",
-            cls.INVALID_PROMPT: "Invalid prompt",
-            cls.PROMPT_NOT_FOUND: "Prompt not found",
-            cls.INVALID_RESOURCE: "Invalid resource",
-            cls.RESOURCE_NOT_FOUND: "Resource not found",
-            cls.FS_FILE_NOT_FOUND: "File not found",
-            cls.FS_PERMISSION_DENIED: "Permission denied",
-            cls.FS_IO_ERROR: "I/O error",
-            cls.FS_INVALID_PATH: "Invalid path",
-            cls.DB_CONNECTION_ERROR: "Database connection error",
-            cls.DB_QUERY_ERROR: "Database query error",
-            cls.DB_TABLE_NOT_FOUND: "Table not found"
-        }
-        
-        return messages.get(code, "Unknown error")
+        return cls._MESSAGES.get(code, "Unknown error")
@@ -4,14 +4,22 @@ MCP protocol exceptions.
 
 This module defines the exceptions used for MCP protocol errors.
 """
+import json
 from typing import Any, Dict, Optional
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
 from src.mcp.messages.error_codes import ErrorCodes
 
 
 class MCPProtocolError(Exception):
     """Base class for MCP protocol errors."""
     
+    __slots__ = ('message', 'code', 'data', '_encoded')
+    
     def __init__(self, message: str, code: int, data: Optional[Dict[str, Any]] = None):
         """
         Initialize a new MCP protocol error.
@@ -24,6 +32,7 @@ class MCPProtocolError(Exception):
         self.message = message
         self.code = code
         self.data = data
+        self._encoded: Optional[bytes] = None
         super().__init__(message)
     
     def to_json_rpc_error(self) -> Dict[str, Any]:
@@ -33,20 +42,37 @@ class MCPProtocolError(Exception):
         Returns:
             A JSON-RPC error object
         """
-        error = {
-            "code": self.code,
-            "message": self.message
-        }
+        if not self.data:
+            return {"code": self.code, "message": self.message}
+        return {"code": self.code, "message": self.message, "data": self.data}
+    
+    def to_json_rpc_bytes(self) -> bytes:
+        """
+        Encode the JSON-RPC error object.
+        
+        The encoding is computed on first use and reused afterwards, so an
+        error that is reported repeatedly is only serialized once. Do not
+        modify the error after calling this.
         
-        if self.data:
-            error["data"] = self.data
-            
-        return error
+        Returns:
+            The UTF-8 encoded JSON-RPC error object
+        """
+        encoded = self._encoded
+        if encoded is None:
+            error = self.to_json_rpc_error()
+            if orjson is not None:
+                encoded = orjson.dumps(error)
+            else:
+                encoded = json.dumps(error, separators=(",", ":")).encode()
+            self._encoded = encoded
+        return encoded
 
 
 class ParseError(MCPProtocolError):
     """Error raised when request parsing fails."""
     
+    __slots__ = ()
+    
     def __init__(self, message: Optional[str] = None, data: Optional[Dict[str, Any]] = None):
         message = message or ErrorCodes.get_message(ErrorCodes.PARSE_ERROR)
         super().__init__(message, ErrorCodes.PARSE_ERROR, data)
@@ -55,6 +81,8 @@ class ParseError(MCPProtocolError):
 class InvalidRequestError(MCPProtocolError):
     """Error raised when a request is invalid."""
     
+    __slots__ = ()
+    
     def __init__(self, message: Optional[str] = None, data: Optional[Dict[str, Any]] = None):
         message = message or ErrorCodes.get_message(ErrorCodes.INVALID_REQUEST)
         super().__init__(message, ErrorCodes.INVALID_REQUEST, data)
@@ -63,14 +91,18 @@ class InvalidRequestError(MCPProtocolError):
 class MethodNotFoundError(MCPProtocolError):
     """Error raised when a requested method is not found."""
     
+    __slots__ = ('method',)
+    
     def __init__(self, method: str, data: Optional[Dict[str, Any]] = None):
-        message = f"Method not found: {method}"
-        super().__init__(message, ErrorCodes.METHOD_NOT_FOUND, data)
+        self.method = method
+        super().__init__(f"Method not found: {method}", ErrorCodes.METHOD_NOT_FOUND, data)
 
 
 class InvalidParamsError(MCPProtocolError):
     """Error raised when request parameters are invalid."""
     
+    __slots__ = ()
+    
     def __init__(self, message: Optional[str] = None, data: Optional[Dict[str, Any]] = None):
         message = message or ErrorCodes.get_message(ErrorCodes.INVALID_PARAMS)
         super().__init__(message, ErrorCodes.INVALID_PARAMS, data)
@@ -79,6 +111,8 @@ class InvalidParamsError(MCPProtocolError):
 class InternalError(MCPProtocolError):
     """Error raised when an internal error occurs."""
     
+    __slots__ = ()
+    
     def __init__(self, message: Optional[str] = None, data: Optional[Dict[str, Any]] = None):
         message = message or ErrorCodes.get_message(ErrorCodes.INTERNAL_ERROR)
         super().__init__(message, ErrorCodes.INTERNAL_ERROR, data)
@@ -87,6 +121,8 @@ class InternalError(MCPProtocolError):
 class InitializationError(MCPProtocolError):
     """Error raised when initialization fails."""
     
+    __slots__ = ()
+    
     def __init__(self, message: Optional[str] = None, data: Optional[Dict[str, Any]] = None):
         message = message or ErrorCodes.get_message(ErrorCodes.INITIALIZATION_FAILED)
         super().__init__(message, ErrorCodes.INITIALIZATION_FAILED, data)
@@ -95,54 +131,70 @@ class InitializationError(MCPProtocolError):
 class InvalidToolError(MCPProtocolError):
     """Error raised when a requested tool is invalid."""
     
+    __slots__ = ('tool',)
+    
     def __init__(self, tool: str, data: Optional[Dict[str, Any]] = None):
-        message = f"Invalid tool: {tool}"
-        super().__init__(message, ErrorCodes.INVALID_TOOL, data)
+        self.tool = tool
+        super().__init__(f"Invalid tool: {tool}", ErrorCodes.INVALID_TOOL, data)
 
 
 class ToolExecutionError(MCPProtocolError):
     """Error raised when tool execution fails."""
     
+    __slots__ = ('tool', 'raw_message')
+    
     def __init__(self, tool: str, message: str, data: Optional[Dict[str, Any]] = None):
-        full_message = f"Tool execution failed ({tool}): {message}"
-        super().__init__(full_message, ErrorCodes.TOOL_EXECUTION_FAILED, data)
+        self.tool = tool
+        self.raw_message = message
+        super().__init__(f"Tool execution failed ({tool}): {message}", ErrorCodes.TOOL_EXECUTION_FAILED, data)
 
 
 class FileNotFoundError(MCPProtocolError):
     """Error raised when a file is not found."""
     
+    __slots__ = ('path',)
+    
     def __init__(self, path: str, data: Optional[Dict[str, Any]] = None):
-        message = f"File not found: {path}"
-        super().__init__(message, ErrorCodes.FS_FILE_NOT_FOUND, data)
+        self.path = path
+        super().__init__(f"File not found: {path}", ErrorCodes.FS_FILE_NOT_FOUND, data)
 
 
 class PermissionDeniedError(MCPProtocolError):
     """Error raised when permission is denied."""
     
+    __slots__ = ('path',)
+    
     def __init__(self, path: str, data: Optional[Dict[str, Any]] = None):
-        message = f"Permission denied: {path}"
-        super().__init__(message, ErrorCodes.FS_PERMISSION_DENIED, data)
+        self.path = path
+        super().__init__(f"Permission denied: {path}", ErrorCodes.FS_PERMISSION_DENIED, data)
 
 
 class IOError(MCPProtocolError):
     """Error raised when an I/O error occurs."""
     
+    __slots__ = ('path', 'raw_message')
+    
     def __init__(self, path: str, message: str, data: Optional[Dict[str, Any]] = None):
-        full_message = f"I/O error ({path}): {message}"
-        super().__init__(full_message, ErrorCodes.FS_IO_ERROR, data)
+        self.path = path
+        self.raw_message = message
+        super().__init__(f"I/O error ({path}): {message}", ErrorCodes.FS_IO_ERROR, data)
 
 
 class InvalidPathError(MCPProtocolError):
     """Error raised when a path is invalid."""
     
+    __slots__ = ('path',)
+    
     def __init__(self, path: str, data: Optional[Dict[str, Any]] = None):
-        message = f"Invalid path: {path}"
-        super().__init__(message, ErrorCodes.FS_INVALID_PATH, data)
+        self.path = path
+        super().__init__(f"Invalid path: {path}", ErrorCodes.FS_INVALID_PATH, data)
 
 
 class DatabaseError(MCPProtocolError):
     """Error raised when a database error occurs."""
     
+    __slots__ = ()
+    
     def __init__(self, message: str, code: int = ErrorCodes.DB_QUERY_ERROR, data: Optional[Dict[str, Any]] = None):
         super().__init__(message, code, data)
 
@@ -150,6 +202,8 @@ class DatabaseError(MCPProtocolError):
 class TableNotFoundError(DatabaseError):
     """Error raised when a table is not found."""
     
+    __slots__ = ('table',)
+    
     def __init__(self, table: str, data: Optional[Dict[str, Any]] = None):
-        message = f"Table not found: {table}"
-        super().__init__(message, ErrorCodes.DB_TABLE_NOT_FOUND, data)
+        self.table = table
+        super().__init__(f"Table not found: {table}", ErrorCodes.DB_TABLE_NOT_FOUND, data)
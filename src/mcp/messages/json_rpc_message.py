@@ -5,11 +5,65 @@ JSON-RPC message utilities for MCP protocol.
 This module provides functions for creating and validating JSON-RPC messages
 used in the MCP protocol.
 """
+import json
 from typing import Any, Dict, Optional, Union, List
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
+from mcp.messages.message_method import MessageMethod
 from mcp.validation.protocol_validator import ProtocolValidator
 
 
+# Validate outgoing messages built here. Enabled unless Python runs with -O,
+# so tests and development catch malformed messages at no cost in production.
+_VALIDATE = __debug__
+
+# Pre-encoded heads of requests for the known methods, up to the params.
+# Only the params, the id and the closing brace are added at send time.
+_REQUEST_PREFIXES: Dict[str, bytes] = {
+    method: b'{"jsonrpc":"2.0","method":"%s","params":' % method.encode()
+    for method in MessageMethod._VALID_METHODS
+}
+
+
+def encode_message(message: Any) -> bytes:
+    """
+    Serialize a JSON-RPC message (or batch) for the wire.
+    
+    Uses orjson when it is available, which encodes straight to bytes.
+    
+    Args:
+        message: The message or list of messages to encode
+        
+    Returns:
+        The UTF-8 encoded JSON, terminated by a newline
+    """
+    if orjson is not None:
+        return orjson.dumps(message, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(message, separators=(",", ":")) + "\n").encode()
+
+
+def decode_message(data: Union[bytes, str]) -> Any:
+    """
+    Parse a JSON-RPC message (or batch) received from the wire.
+    
+    Args:
+        data: The raw JSON data
+        
+    Returns:
+        The decoded message
+        
+    Raises:
+        json.JSONDecodeError: If the data is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 def create_request(method: str, params: Dict[str, Any], request_id: Union[str, int]) -> Dict[str, Any]:
     """
     Create a JSON-RPC request message.
@@ -30,13 +84,67 @@ def create_request(method: str, params: Dict[str, Any], request_id: Union[str, i
     }
     
     # Validate the request
-    error = ProtocolValidator.validate_request(request)
-    if error:
-        raise ValueError(f"Invalid request: {error}")
+    if _VALIDATE:
+        error = ProtocolValidator.validate_request(request)
+        if error:
+            raise ValueError(f"Invalid request: {error}")
     
     return request
 
 
+def create_request_fast(method: str, params: Dict[str, Any], request_id: Union[str, int]) -> Dict[str, Any]:
+    """
+    Create a JSON-RPC request message without validating it.
+    
+    For callers that always pass a string method, a dict of params and an
+    id they generated themselves, such as the transports.
+    
+    Args:
+        method: The method name to call
+        params: Parameters for the method
+        request_id: Unique identifier for the request
+        
+    Returns:
+        A JSON-RPC request object
+    """
+    return {
+        "jsonrpc": "2.0",
+        "method": method,
+        "params": params,
+        "id": request_id
+    }
+
+
+def create_request_bytes(method: str, params: Dict[str, Any], request_id: Union[str, int]) -> bytes:
+    """
+    Create a JSON-RPC request message encoded for the wire.
+    
+    The request is not validated; see create_request_fast. Requests for
+    the known MCP methods with an integer id are built from a pre-encoded
+    template, so only the params are serialized (and not even those when
+    they are empty), without building the request dict.
+    
+    Args:
+        method: The method name to call
+        params: Parameters for the method
+        request_id: Unique identifier for the request
+        
+    Returns:
+        The encoded request, terminated by a newline
+    """
+    if type(request_id) is int and type(params) is dict:
+        prefix = _REQUEST_PREFIXES.get(method)
+        if prefix is not None:
+            if not params:
+                encoded_params = b"{}"
+            elif orjson is not None:
+                encoded_params = orjson.dumps(params)
+            else:
+                encoded_params = json.dumps(params, separators=(",", ":")).encode()
+            return b'%s%s,"id":%d}\n' % (prefix, encoded_params, request_id)
+    return encode_message(create_request_fast(method, params, request_id))
+
+
 def create_response(result: Any, request_id: Union[str, int], partial: bool = False) -> Dict[str, Any]:
     """
     Create a JSON-RPC response message.
@@ -59,9 +167,10 @@ def create_response(result: Any, request_id: Union[str, int], partial: bool = Fa
         response["partial"] = True
     
     # Validate the response
-    error = ProtocolValidator.validate_response(response)
-    if error:
-        raise ValueError(f"Invalid response: {error}")
+    if _VALIDATE:
+        error = ProtocolValidator.validate_response(response)
+        if error:
+            raise ValueError(f"Invalid response: {error}")
     
     return response
 
@@ -92,9 +201,10 @@ def create_error(code: int, message: str, request_id: Union[str, int], data: Opt
         error_response["error"]["data"] = data
     
     # Validate the response
-    error = ProtocolValidator.validate_response(error_response)
-    if error:
-        raise ValueError(f"Invalid error response: {error}")
+    if _VALIDATE:
+        error = ProtocolValidator.validate_response(error_response)
+        if error:
+            raise ValueError(f"Invalid error response: {error}")
     
     return error_response
 
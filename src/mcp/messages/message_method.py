@@ -35,6 +35,24 @@ class MessageMethod:
     DB_QUERY = "db/query"
     DB_GET_TABLES = "db/getTables"
     
+    # All known methods, for constant-time validation
+    _VALID_METHODS = frozenset({
+        INITIALIZE,
+        SHUTDOWN,
+        PING,
+        TOOLS_LIST,
+        TOOLS_CALL,
+        PROMPTS_LIST,
+        PROMPTS_GET,
+        RESOURCES_LIST,
+        RESOURCES_GET,
+        FS_READ_FILE,
+        FS_WRITE_FILE,
+        FS_LIST_DIRECTORY,
+        DB_QUERY,
+        DB_GET_TABLES
+    })
+    
     @classmethod
     def is_valid_method(cls, method: str) -> bool:
         """
@@ -46,19 +64,4 @@ class MessageMethod:
         Returns:
             True if the method is valid, False otherwise
         """
-        return method in [
-            cls.INITIALIZE,
-            cls.SHUTDOWN,
-            cls.PING,
-            cls.TOOLS_LIST,
-            cls.TOOLS_CALL,
-            cls.PROMPTS_LIST,
-            cls.PROMPTS_GET,
-            cls.RESOURCES_LIST,
-            cls.RESOURCES_GET,
-            cls.FS_READ_FILE,
-            cls.FS_WRITE_FILE,
-            cls.FS_LIST_DIRECTORY,
-            cls.DB_QUERY,
-            cls.DB_GET_TABLES
-        ]
+        return method in cls._VALID_METHODS
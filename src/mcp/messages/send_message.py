@@ -57,7 +57,7 @@ async def send_message(
         is_final_attempt = attempt == retries
         
         try:
-            logging.debug(f"[send_message] Attempt {attempt}/{retries}: Sending message: {message}")
+            logging.debug("[send_message] Attempt %d/%d: Sending message: %s", attempt, retries, message)
             await write_stream.send(message)
 
             # Wait for a response with a timeout
@@ -130,11 +130,12 @@ async def _receive_matching_response(
 
         # Skip any response whose ID doesn't match our request ID
         if response.id != req_id:
-            logging.debug(f"[send_message] Ignoring unmatched response: {response}")
+            logging.debug("[send_message] Ignoring unmatched response: %s", response)
             continue
 
         # We have a matching response. Log, then check for errors
-        logging.debug(f"[send_message] Received response: {response.model_dump()}")
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            logging.debug("[send_message] Received response: %s", response.model_dump())
         
         # Per JSON-RPC 2.0 spec, a response must have either result or error, not both
         if response.error is not None:
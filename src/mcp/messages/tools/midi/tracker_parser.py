@@ -5,6 +5,13 @@ This module parses tracker file format strings and converts them to MIDI events.
 """
 from typing import Dict, List, Tuple, Optional
 
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; fall back to the vectorized NumPy decoder
+    njit = None
+
 
 # Note name to MIDI note number mapping
 NOTE_MAP = {
@@ -12,9 +19,15 @@ NOTE_MAP = {
     "F#": 6, "G-": 7, "G#": 8, "A-": 9, "A#": 10, "B-": 11
 }
 
+# Marker for empty fields in decoded pattern columns
+EMPTY = -32768
+
 
 class TrackerEvent:
     """Represents a single event in a tracker pattern."""
+    
+    __slots__ = ('row', 'note', 'instrument', 'volume', 'effect', 'effect_param')
+    
     def __init__(
         self,
         row: int,
@@ -40,17 +53,66 @@ class TrackerEvent:
 
 
 class TrackerPattern:
-    """Represents a pattern in a tracker file."""
+    """
+    Represents a pattern in a tracker file.
+    
+    Events are kept per channel in channels. Alongside them, each channel's
+    cells are indexed in an int16 array of shape (len(FIELDS), num_rows),
+    one column per field, with EMPTY for empty fields and effects stored as
+    character codes.
+    """
+    
+    __slots__ = ('pattern_idx', 'num_rows', 'channels', 'columns')
+    
+    # Fields of a cell, in column order
+    FIELDS = ("note", "instrument", "volume", "effect", "effect_param")
+    
     def __init__(self, pattern_idx: int, num_rows: int = 64):
         self.pattern_idx = pattern_idx
         self.num_rows = num_rows
         self.channels: Dict[int, List[TrackerEvent]] = {}
+        self.columns: Dict[int, np.ndarray] = {}
+    
+    def channel_columns(self, channel: int) -> np.ndarray:
+        """Get the field columns of a channel, allocating empty ones if needed."""
+        columns = self.columns.get(channel)
+        if columns is None:
+            columns = self.columns[channel] = np.full((len(self.FIELDS), self.num_rows), EMPTY, dtype=np.int16)
+        return columns
     
     def add_event(self, channel: int, event: TrackerEvent):
         """Add an event to the specified channel."""
         if channel not in self.channels:
             self.channels[channel] = []
         self.channels[channel].append(event)
+        
+        # Rows outside the pattern are kept as events but not indexed
+        if 0 <= event.row < self.num_rows:
+            self.channel_columns(channel)[:, event.row] = (
+                EMPTY if event.note is None else event.note,
+                EMPTY if event.instrument is None else event.instrument,
+                EMPTY if event.volume is None else event.volume,
+                EMPTY if event.effect is None else ord(event.effect),
+                EMPTY if event.effect_param is None else event.effect_param
+            )
+    
+    def get_event(self, channel: int, row: int) -> Optional[TrackerEvent]:
+        """Build the event at a channel and row, or None if the cell is empty."""
+        columns = self.columns.get(channel)
+        if columns is None or not 0 <= row < self.num_rows:
+            return None
+        
+        note, instrument, volume, effect, effect_param = columns[:, row].tolist()
+        if note == instrument == volume == effect == effect_param == EMPTY:
+            return None
+        return TrackerEvent(
+            row,
+            None if note == EMPTY else note,
+            None if instrument == EMPTY else instrument,
+            None if volume == EMPTY else volume,
+            None if effect == EMPTY else chr(effect),
+            None if effect_param == EMPTY else effect_param
+        )
     
     def __repr__(self):
         return f"TrackerPattern(pattern_idx={self.pattern_idx}, channels={len(self.channels)})"
@@ -58,6 +120,9 @@ class TrackerPattern:
 
 class TrackerSong:
     """Represents a complete tracker song."""
+    
+    __slots__ = ('title', 'bpm', 'speed', 'patterns', 'sequence')
+    
     def __init__(self, title: str = "Untitled", bpm: int = 120, speed: int = 6):
         self.title = title
         self.bpm = bpm
@@ -80,6 +145,13 @@ class TrackerSong:
         )
 
 
+# Semitone of each note name, indexed by the character codes of the name
+# (first * 128 + second). Covers all 7-bit ASCII pairs; other entries are None.
+_NOTE_LUT: List[Optional[int]] = [None] * (128 * 128)
+for _name, _semitone in NOTE_MAP.items():
+    _NOTE_LUT[ord(_name[0]) * 128 + ord(_name[1])] = _semitone
+
+
 def parse_note_string(note_str: str) -> Optional[int]:
     """Parse a note string (e.g., 'C-4') into a MIDI note number."""
     if not note_str or note_str == "...":
@@ -92,66 +164,226 @@ def parse_note_string(note_str: str) -> Optional[int]:
     if len(note_str) != 3:
         return None
     
-    note_name = note_str[0:2]
-    octave = int(note_str[2])
+    first, second = ord(note_str[0]), ord(note_str[1])
+    if first >= 128 or second >= 128:
+        return None
     
-    if note_name not in NOTE_MAP:
+    semitone = _NOTE_LUT[first * 128 + second]
+    octave = ord(note_str[2]) - 48
+    if semitone is None or not 0 <= octave <= 9:
         return None
     
-    return NOTE_MAP[note_name] + (octave * 12)
+    return semitone + (octave * 12)
+
+# Vectorized lookup tables: semitone by note name character codes, and the
+# value of a two-digit hex field by its character codes (high * 256 + low).
+# Invalid entries are EMPTY.
+_NOTE_TABLE = np.array([EMPTY if v is None else v for v in _NOTE_LUT], dtype=np.int16)
+_HEX_TABLE = np.full(256 * 256, EMPTY, dtype=np.int16)
+for _high in "0123456789abcdefABCDEF":
+    for _low in "0123456789abcdefABCDEF":
+        _HEX_TABLE[ord(_high) * 256 + ord(_low)] = int(_high + _low, 16)
+
+# Width of a channel column in a pattern row: a 13-character cell and a separator
+CELL_WIDTH = 14
+
+
+def _decode_hex(high: np.ndarray, low: np.ndarray) -> np.ndarray:
+    """Decode columns of two-digit hex fields, with EMPTY for invalid fields."""
+    return _HEX_TABLE[high.astype(np.intp) * 256 + low]
+
+
+def _decode_cells(grid: np.ndarray, note_table: np.ndarray, hex_table: np.ndarray, out: np.ndarray) -> None:
+    """
+    Decode a pattern byte grid cell by cell into out[field, row, channel].
+    
+    Plain integer loops for compilation with numba; the fields are those
+    returned by decode_pattern_rows.
+    """
+    for r in range(grid.shape[0]):
+        for c in range(grid.shape[1]):
+            cell = grid[r, c]
+            
+            if cell[0] == 61 and cell[1] == 61 and cell[2] == 61:  # '===' note cut
+                note = -1
+            else:
+                semitone = note_table[int(cell[0]) * 128 + int(cell[1])]
+                octave = int(cell[2]) - 48
+                note = semitone + octave * 12 if semitone != EMPTY and 0 <= octave <= 9 else EMPTY
+            out[0, r, c] = note
+            
+            for field, offset in ((1, 4), (2, 7), (4, 11)):
+                out[field, r, c] = hex_table[int(cell[offset]) * 256 + int(cell[offset + 1])]
+            
+            effect = int(cell[10])
+            out[3, r, c] = EMPTY if effect == 46 or effect == 32 else effect  # '.' or ' '
+
+
+_decode_cells_jit = njit(cache=True)(_decode_cells) if njit is not None else None
+
+
+def decode_pattern_rows(rows: List[str]) -> Tuple[np.ndarray, ...]:
+    """
+    Decode the rows of a pattern into columns of field values.
+    
+    The rows are loaded into one (rows, channels, CELL_WIDTH) byte grid,
+    which is decoded by a numba-compiled kernel when numba is installed,
+    and otherwise one field at a time for every cell at once.
+    
+    Args:
+        rows: The pattern rows, CELL_WIDTH characters per channel
+        
+    Returns:
+        (note, instrument, volume, effect, effect_param) int16 arrays of
+        shape (rows, channels). Effects are character codes, and empty or
+        invalid fields are EMPTY.
+    """
+    channels = max(1, -(-max(map(len, rows), default=0) // CELL_WIDTH))
+    width = channels * CELL_WIDTH
+    buf = "".join(row.ljust(width) for row in rows).encode("ascii", "replace")
+    grid = np.frombuffer(buf, dtype=np.uint8).reshape(len(rows), channels, CELL_WIDTH)
+    
+    if _decode_cells_jit is not None:
+        out = np.empty((5, len(rows), channels), dtype=np.int16)
+        _decode_cells_jit(grid, _NOTE_TABLE, _HEX_TABLE, out)
+        return tuple(out)
+    
+    # Notes: name from the first two characters, octave from the third
+    semitone = _NOTE_TABLE[grid[:, :, 0].astype(np.intp) * 128 + grid[:, :, 1]]
+    octave = grid[:, :, 2].astype(np.int16) - 48
+    valid = (semitone != EMPTY) & (octave >= 0) & (octave <= 9)
+    note = np.where(valid, semitone + octave * 12, EMPTY).astype(np.int16)
+    note[(grid[:, :, :3] == ord("=")).all(axis=2)] = -1  # Note cut
+    
+    effect = grid[:, :, 10].astype(np.int16)
+    effect[(effect == ord(".")) | (effect == ord(" "))] = EMPTY
+    
+    return (
+        note,
+        _decode_hex(grid[:, :, 4], grid[:, :, 5]),
+        _decode_hex(grid[:, :, 7], grid[:, :, 8]),
+        effect,
+        _decode_hex(grid[:, :, 11], grid[:, :, 12])
+    )
+
+
+def _add_pattern_rows(pattern: TrackerPattern, rows: List[str]) -> None:
+    """Decode pattern rows into the columns and events of each channel with non-empty cells."""
+    if not rows:
+        return
+    
+    grid = np.stack(decode_pattern_rows(rows))
+    occupied = (grid != EMPTY).any(axis=0)
+    for channel in np.nonzero(occupied.any(axis=0))[0].tolist():
+        pattern.channel_columns(channel)[:, :len(rows)] = grid[:, :, channel]
+        pattern.channels[channel] = [
+            pattern.get_event(channel, row) for row in np.nonzero(occupied[:, channel])[0].tolist()
+        ]
+
+
+class _ParseState:
+    """Pattern being parsed, and the rows collected for every pattern."""
+    
+    __slots__ = ('pattern', 'rows', 'blocks')
+    
+    def __init__(self):
+        self.pattern: Optional[TrackerPattern] = None
+        self.rows: List[str] = []
+        self.blocks: List[Tuple[TrackerPattern, List[str]]] = []
+
+
+def _parse_header(line: str, song: TrackerSong, state: _ParseState) -> bool:
+    """Parse a '#COMMAND: value' header line."""
+    cmd, sep, value = line[1:].partition(":")
+    if not sep:
+        return True
+    
+    cmd, value = cmd.strip().upper(), value.strip()
+    if cmd == "TITLE":
+        song.title = value
+    elif cmd == "BPM":
+        try:
+            song.bpm = int(value)
+        except ValueError:
+            pass
+    elif cmd == "SPEED":
+        try:
+            song.speed = int(value)
+        except ValueError:
+            pass
+    elif cmd == "SEQUENCE":
+        try:
+            song.sequence = [int(x) for x in value.split(",")]
+        except ValueError:
+            pass
+    return True
+
+
+def _parse_pattern_start(line: str, song: TrackerSong, state: _ParseState) -> bool:
+    """Parse a 'PATTERN <index> [ROWS <count>]' line; other lines are left to the caller."""
+    if not line.startswith("PATTERN"):
+        return False
+    
+    try:
+        pattern_idx = int(line.split()[1])
+        rows = 64  # Default
+        
+        # Check if rows are specified
+        _, found, rest = line.partition("ROWS")
+        if found:
+            rows = int(rest.split()[0])
+    except (IndexError, ValueError):
+        # Skip the rows of a malformed pattern header
+        state.pattern = None
+        return True
+    
+    state.pattern = TrackerPattern(pattern_idx, rows)
+    song.add_pattern(state.pattern)
+    state.rows = []
+    state.blocks.append((state.pattern, state.rows))
+    return True
+
+
+# Handlers for lines that are not pattern rows, by first character
+_LINE_HANDLERS = {"#": _parse_header, "P": _parse_pattern_start}
 
 
 def parse_tracker_string(tracker_str: str) -> TrackerSong:
-    """Parse a tracker file string and return a TrackerSong object."""
-    lines = tracker_str.strip().split("\n")
-    song = TrackerSong()
+    """
+    Parse a tracker file string and return a TrackerSong object.
     
-    # Track current pattern being parsed
-    current_pattern = None
-    pattern_started = False
+    Header lines have the form '#COMMAND: value' (TITLE, BPM, SPEED or
+    SEQUENCE). A 'PATTERN <index> [ROWS <count>]' line starts a pattern,
+    and the lines that follow are its rows. Each row holds one column per
+    channel, CELL_WIDTH characters apart:
     
-    for line in lines:
-        line = line.strip()
+        C-4 01 40 ...|... .. .. ...|E-4 02 30 F06
+    
+    Rows keep their leading whitespace, so blank cells stay aligned. Rows
+    beyond the pattern's row count are ignored.
+    """
+    song = TrackerSong()
+    state = _ParseState()
+    handlers = _LINE_HANDLERS
+    
+    for line in tracker_str.splitlines():
+        line = line.rstrip()
         
         # Skip empty lines
         if not line:
             continue
         
-        # Parse header commands
-        if line.startswith("#"):
-            parts = line[1:].strip().split(":", 1)
-            if len(parts) == 2:
-                cmd, value = parts[0].strip().upper(), parts[1].strip()
-                
-                if cmd == "TITLE":
-                    song.title = value
-                elif cmd == "BPM":
-                    try:
-                        song.bpm = int(value)
-                    except ValueError:
-                        pass
-                elif cmd == "SPEED":
-                    try:
-                        song.speed = int(value)
-                    except ValueError:
-                        pass
-                elif cmd == "SEQUENCE":
-                    try:
-                        song.sequence = [int(x.strip()) for x in value.split(",")]
-                    except ValueError:
-                        pass
+        # Parse header commands and pattern starts, which may be indented
+        head = line.lstrip() if line[0] in " \t" else line
+        handler = handlers.get(head[0])
+        if handler is not None and handler(head, song, state):
             continue
         
-        # Parse pattern start
-        if line.startswith("PATTERN"):
-            try:
-                pattern_idx = int(line.split()[1])
-                rows = 64  # Default
-                
-                # Check if rows are specified
-                if "ROWS" in line:
-                    rows_idx = line.find("ROWS")
-                    rows_str = line[rows_idx:].split()[1]
-                    rows = int(rows_str)
-                
-                current_pattern =
\ No newline at end of file
+        # Collect pattern rows, decoded per pattern below
+        if state.pattern is not None and len(state.rows) < state.pattern.num_rows:
+            state.rows.append(line)
+    
+    for pattern, rows in state.blocks:
+        _add_pattern_rows(pattern, rows)
+    
+    return song
@@ -5,8 +5,59 @@ Base transport interface for MCP protocol.
 This module defines the abstract Transport interface that all transport
 implementations must follow.
 """
+import asyncio
+import collections
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional, AsyncGenerator, Union
+from typing import Any, Dict, List, Optional, AsyncGenerator, Tuple, Union
+
+
+# Kinds of the (kind, payload) pairs yielded by send_streaming_message(extract=True)
+STREAM_RESULT = object()
+STREAM_ERROR = object()
+
+
+class SPSCBuffer:
+    """
+    Buffer for a single producer and a single consumer on one event loop.
+    
+    Items are kept in a deque, and each side parks on an Event only when
+    the buffer is empty or, if it has a size, full. This avoids
+    asyncio.Queue's per-item waiter bookkeeping on the response path.
+    """
+    
+    __slots__ = ('_items', '_size', '_readable', '_writable')
+    
+    def __init__(self, size: int = 0):
+        """
+        Initialize the buffer.
+        
+        Args:
+            size: Maximum number of items put() lets in (0 for unbounded)
+        """
+        self._items: collections.deque = collections.deque()
+        self._size = size
+        self._readable = asyncio.Event()
+        self._writable = asyncio.Event()
+    
+    def put_nowait(self, item: Any) -> None:
+        """Append an item without waiting, even if the buffer is full."""
+        self._items.append(item)
+        self._readable.set()
+    
+    async def put(self, item: Any) -> None:
+        """Append an item, waiting while the buffer is full."""
+        while 0 < self._size <= len(self._items):
+            self._writable.clear()
+            await self._writable.wait()
+        self.put_nowait(item)
+    
+    async def get(self) -> Any:
+        """Remove and return the oldest item, waiting while the buffer is empty."""
+        while not self._items:
+            self._readable.clear()
+            await self._readable.wait()
+        self._writable.set()
+        return self._items.popleft()
 
 
 class Transport(ABC):
@@ -50,13 +101,16 @@ class Transport(ABC):
         pass
     
     @abstractmethod
-    async def send_streaming_message(self, method: str, params: Dict[str, Any]) -> AsyncGenerator[Dict[str, Any], None]:
+    async def send_streaming_message(self, method: str, params: Dict[str, Any],
+                                     extract: bool = False) -> AsyncGenerator[Any, None]:
         """
         Send a message to the server and get a streaming response.
         
         Args:
             method: The method name to call
             params: Parameters for the method
+            extract: Yield (STREAM_RESULT, result) or (STREAM_ERROR, error)
+                pairs instead of whole responses, skipping chunks with neither
             
         Returns:
             An async generator yielding response chunks
@@ -65,6 +119,48 @@ class Transport(ABC):
             TransportError: If an error occurs during transport
         """
         pass
+    
+    def is_connected(self) -> bool:
+        """
+        Check whether the connection to the server is still open.
+        
+        The default implementation cannot tell and always returns True.
+        Transports that notice a lost connection should override this.
+        
+        Returns:
+            False if the connection is known to be closed, True otherwise
+        """
+        return True
+    
+    def endpoint_key(self) -> Optional[str]:
+        """
+        Get a key identifying the server endpoint of this transport.
+        
+        Pooled protocol clients share one open connection per key.
+        
+        Returns:
+            The endpoint key, or None if connections cannot be shared
+        """
+        return None
+    
+    async def send_batch(self, requests: List[Tuple[str, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """
+        Send several messages to the server and get their responses.
+        
+        The default implementation sends the messages one at a time.
+        Transports that can frame a JSON-RPC batch should override this
+        to send all messages in a single round-trip.
+        
+        Args:
+            requests: List of (method, params) pairs
+            
+        Returns:
+            The responses from the server, in request order
+            
+        Raises:
+            TransportError: If an error occurs during transport
+        """
+        return [await self.send_message(method, params) for method, params in requests]
 
 
 class TransportError(Exception):
@@ -28,11 +28,11 @@ class StdioClient:
 
     async def _process_json_line(self, line: str):
         try:
-            logging.debug(f"Processing line: {line.strip()}")
+            logging.debug("Processing line: %s", line.rstrip())
             data = json.loads(line)
-            logging.debug(f"Parsed JSON data: {data}")
+            logging.debug("Parsed JSON data: %s", data)
             message = JSONRPCMessage.model_validate(data)
-            logging.debug(f"Validated JSONRPCMessage: {message}")
+            logging.debug("Validated JSONRPCMessage: %s", message)
             await self.read_stream_writer.send(message)
         except json.JSONDecodeError as exc:
             logging.error(f"JSON decode error: {exc}. Line: {line.strip()}")
@@ -72,7 +72,7 @@ class StdioClient:
             async with self.write_stream_reader:
                 async for message in self.write_stream_reader:
                     json_str = message.model_dump_json(exclude_none=True)
-                    logging.debug(f"Sending: {json_str}")
+                    logging.debug("Sending: %s", json_str)
                     await self.process.stdin.send((json_str + "\n").encode())
         except anyio.ClosedResourceError:
             logging.debug("Write stream closed.")
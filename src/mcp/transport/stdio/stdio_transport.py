@@ -7,31 +7,84 @@ with an MCP server via standard input/output.
 """
 import json
 import asyncio
+import collections
 import sys
 import logging
 import subprocess
-from typing import Any, Dict, Optional, AsyncGenerator, Union
+from typing import Any, Dict, List, Optional, AsyncGenerator, Set, Tuple, Union
 
-from mcp.transport.base.transport import Transport, TransportError
-from mcp.messages.json_rpc_message import create_request
+from mcp.transport.base.transport import STREAM_ERROR, STREAM_RESULT, SPSCBuffer, Transport, TransportError
+from mcp.messages.json_rpc_message import create_request_fast, create_request_bytes, encode_message, decode_message
+
+# Sentinel for response members that are not present
+_MISSING = object()
+
+# Queue marker for the end of the server's output
+_CLOSED = object()
+
+# Maximum number of bytes taken from the reader at once
+_READ_SIZE = 65536
+
+
+class _BatchRejected(TransportError):
+    """Error passed to a batch the server answered with one error, or not at all."""
 
 
 class StdioTransport(Transport):
     """Transport implementation using stdio."""
     
-    def __init__(self, process: Optional[subprocess.Popen] = None):
+    def __init__(self, process: Optional[subprocess.Popen] = None, batch_timeout: Optional[float] = 5.0):
         """
         Initialize the STDIO transport.
         
         Args:
             process: The subprocess to communicate with (optional)
                     If not provided, the transport will use sys.stdin/stdout
+            batch_timeout: Seconds to wait for the responses to a batch before
+                    sending its requests one at a time (None waits forever)
         """
         self.process = process
         self.reader = None
         self.writer = None
         self.request_id = 0
         self.logger = logging.getLogger("mcp-cli.stdio-transport")
+        # Frames queued during the current loop iteration, written together
+        self._outbox: List[bytes] = []
+        self._flush_waiter: Optional[asyncio.Future] = None
+        self._flush_task: Optional[asyncio.Task] = None
+        # Received bytes not yet split into lines, and complete lines not yet read
+        self._read_buffer = bytearray()
+        self._lines: collections.deque = collections.deque()
+        # Background task routing responses to the queues of waiting requests
+        self._reader_task: Optional[asyncio.Task] = None
+        self._queues: Dict[Any, SPSCBuffer] = {}
+        # Queues of the batches in flight, which share an error with a null ID
+        self._batch_queues: Set[SPSCBuffer] = set()
+        self.batch_timeout = batch_timeout
+        # Cleared once the server fails to answer a batch
+        self._batch_supported = True
+    
+    def endpoint_key(self) -> Optional[str]:
+        """
+        Get a key identifying the server endpoint of this transport.
+        
+        Returns:
+            "stdio:<pid>" for a subprocess, or "stdio" for sys.stdin/stdout
+        """
+        if self.process:
+            return f"stdio:{self.process.pid}"
+        return "stdio"
+    
+    def is_connected(self) -> bool:
+        """
+        Check whether the connection to the server is still open.
+        
+        Returns:
+            True while connected and the server's output has not ended
+        """
+        if not self.writer or not self.reader:
+            return False
+        return self._reader_task is None or not self._reader_task.done()
     
     async def connect(self) -> bool:
         """
@@ -53,10 +106,7 @@ class StdioTransport(Transport):
                 )
                 
                 # Connect to process stdin for writing
-                self.writer, _ = await asyncio.get_event_loop().connect_write_pipe(
-                    lambda: asyncio.BaseProtocol(), 
-                    self.process.stdin
-                )
+                self.writer = await self._open_writer(self.process.stdin)
             else:
                 # Use sys.stdin and sys.stdout
                 self.reader = asyncio.StreamReader()
@@ -68,11 +118,11 @@ class StdioTransport(Transport):
                     sys.stdin
                 )
                 
-                self.writer, _ = await asyncio.get_event_loop().connect_write_pipe(
-                    lambda: asyncio.BaseProtocol(), 
-                    sys.stdout
-                )
+                self.writer = await self._open_writer(sys.stdout)
             
+            self._read_buffer.clear()
+            self._lines.clear()
+            self._start_reader()
             self.logger.debug("Connected to server via stdio")
             return True
             
@@ -80,6 +130,202 @@ class StdioTransport(Transport):
             self.logger.error(f"Error connecting to server: {str(e)}")
             return False
     
+    @staticmethod
+    async def _open_writer(pipe: Any) -> asyncio.StreamWriter:
+        """
+        Open a stream writer on a pipe.
+        
+        Args:
+            pipe: The pipe to write to
+            
+        Returns:
+            A StreamWriter supporting writelines and drain
+        """
+        loop = asyncio.get_running_loop()
+        # StreamReaderProtocol is the public protocol that implements drain flow control
+        transport, protocol = await loop.connect_write_pipe(
+            lambda: asyncio.StreamReaderProtocol(asyncio.StreamReader()),
+            pipe
+        )
+        return asyncio.StreamWriter(transport, protocol, None, loop)
+    
+    async def _write_frame(self, data: bytes) -> None:
+        """
+        Write a frame, coalesced with other frames sent in the same loop iteration.
+        
+        Frames queued before the next loop iteration are written with a
+        single writelines call and a single drain, so concurrent requests
+        share one write and one wait for the pipe.
+        
+        Args:
+            data: The encoded frame to write
+        """
+        self._outbox.append(data)
+        waiter = self._flush_waiter
+        if waiter is None:
+            loop = asyncio.get_running_loop()
+            waiter = self._flush_waiter = loop.create_future()
+            self._flush_task = loop.create_task(self._flush())
+        
+        await asyncio.shield(waiter)
+    
+    async def _flush(self) -> None:
+        """Write and drain all queued frames, then wake up their senders."""
+        outbox, self._outbox = self._outbox, []
+        waiter, self._flush_waiter = self._flush_waiter, None
+        
+        try:
+            writer = self.writer
+            if not writer:
+                raise TransportError("Not connected to server")
+            writer.writelines(outbox)
+            await writer.drain()
+        except asyncio.CancelledError:
+            # Cancelled by disconnect
+            if not waiter.done():
+                waiter.set_exception(TransportError("Disconnected from server"))
+            raise
+        except Exception as e:
+            if not waiter.done():
+                waiter.set_exception(e)
+            return
+        
+        if not waiter.done():
+            waiter.set_result(None)
+    
+    async def _read_line(self) -> bytes:
+        """
+        Read the next non-empty line received from the server.
+        
+        Takes up to _READ_SIZE bytes from the reader at a time and splits
+        every complete line out of them at once, so a burst of messages
+        costs one read instead of one per message.
+        
+        Returns:
+            The line without its newline, or b"" at end of stream
+        """
+        lines = self._lines
+        buffer = self._read_buffer
+        while not lines:
+            chunk = await self.reader.read(_READ_SIZE)
+            if not chunk:
+                # End of stream: return any unterminated last line
+                line = bytes(buffer)
+                buffer.clear()
+                return line
+            
+            buffer += chunk
+            end = buffer.rfind(b"\n")
+            if end >= 0:
+                lines.extend(line for line in bytes(buffer[:end]).split(b"\n") if line)
+                del buffer[:end + 1]
+        
+        return lines.popleft()
+    
+    def _start_reader(self) -> None:
+        """Start the background reader unless it is already running."""
+        if self._reader_task is None or self._reader_task.done():
+            self._reader_task = asyncio.create_task(self._dispatch_loop())
+    
+    def _register(self, request_ids: Any) -> SPSCBuffer:
+        """
+        Create the queue that receives the responses to one or more requests.
+        
+        Args:
+            request_ids: The IDs of the requests sharing the queue
+            
+        Returns:
+            The queue for the requests
+        """
+        queue = SPSCBuffer()
+        for request_id in request_ids:
+            self._queues[request_id] = queue
+        self._start_reader()
+        return queue
+    
+    def _fail_pending(self, error: Any) -> None:
+        """
+        Pass an error to every request waiting for a response.
+        
+        Args:
+            error: The exception, or _CLOSED at end of stream
+        """
+        for queue in set(self._queues.values()):
+            queue.put_nowait(error)
+    
+    async def _dispatch_loop(self) -> None:
+        """
+        Read responses from the server and route them to the waiting requests.
+        
+        Each response is put on the queue registered for its ID, so concurrent
+        requests receive their own responses in whatever order they arrive.
+        Malformed lines are logged and skipped. Read errors, which cannot be
+        attributed to one request, are passed to all of them.
+        """
+        try:
+            while True:
+                response_line = await self._read_line()
+                if not response_line:
+                    self.logger.debug("Connection closed by server")
+                    self._fail_pending(_CLOSED)
+                    return
+                
+                # Parse the response
+                try:
+                    parsed = decode_message(response_line)
+                except json.JSONDecodeError:
+                    # A malformed line cannot be attributed to a request, so skip it
+                    self.logger.warning("Skipping invalid JSON in response: %s", response_line.decode(errors='replace'))
+                    continue
+                
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug("Received response: %s", response_line.decode(errors='replace'))
+                
+                for response in (parsed if isinstance(parsed, list) else (parsed,)):
+                    if not isinstance(response, dict):
+                        self.logger.warning("Skipping malformed response: %r", response)
+                        continue
+                    if "id" not in response:
+                        self.logger.debug("Skipping notification: %s", response.get("method"))
+                        continue
+                    if response["id"] is None and "error" in response and self._batch_queues:
+                        # A server without batch support rejects the whole batch at once
+                        error = _BatchRejected(f"Batch rejected by server: {response['error']}")
+                        for queue in self._batch_queues:
+                            queue.put_nowait(error)
+                        continue
+                    queue = self._queues.get(response["id"])
+                    if queue is None:
+                        self.logger.warning("Skipping response with unknown ID: %s", response.get("id"))
+                        continue
+                    queue.put_nowait(response)
+                    
+        except asyncio.CancelledError:
+            # Stopped by disconnect, which fails the waiting requests itself
+            raise
+        except Exception as e:
+            self._fail_pending(TransportError(f"Error reading response: {str(e)}", e))
+    
+    @staticmethod
+    def _check_response(response: Any) -> Dict[str, Any]:
+        """
+        Return a response taken from a request queue, or raise the error in its place.
+        
+        Args:
+            response: The item taken from the queue
+            
+        Returns:
+            The response
+            
+        Raises:
+            TransportError: If the connection closed or failed instead
+        """
+        if response is _CLOSED:
+            raise TransportError("Connection closed by server")
+        if isinstance(response, TransportError):
+            raise response
+        return response
+    
     async def disconnect(self) -> bool:
         """
         Disconnect from the server.
@@ -88,6 +334,20 @@ class StdioTransport(Transport):
             True if disconnected successfully, False otherwise
         """
         try:
+            if self._reader_task is not None:
+                self._reader_task.cancel()
+                self._reader_task = None
+            self._fail_pending(TransportError("Disconnected from server"))
+            
+            # Stop a pending write; frames not yet taken by it are dropped
+            if self._flush_task is not None:
+                self._flush_task.cancel()
+                self._flush_task = None
+            waiter, self._flush_waiter = self._flush_waiter, None
+            if waiter is not None and not waiter.done():
+                waiter.set_exception(TransportError("Disconnected from server"))
+            self._outbox = []
+            
             if self.writer:
                 self.writer.close()
                 self.reader = None
@@ -97,9 +357,13 @@ class StdioTransport(Transport):
                 if self.process and self.process.poll() is None:
                     try:
                         self.process.terminate()
-                        await asyncio.sleep(0.1)
-                        if self.process.poll() is None:
+                        # Wait for it to exit, but kill it if it takes longer than 100ms
+                        exited = asyncio.get_running_loop().run_in_executor(None, self.process.wait)
+                        try:
+                            await asyncio.wait_for(asyncio.shield(exited), timeout=0.1)
+                        except asyncio.TimeoutError:
                             self.process.kill()
+                            await exited
                     except Exception as e:
                         self.logger.warning(f"Error terminating process: {str(e)}")
             
@@ -130,42 +394,92 @@ class StdioTransport(Transport):
         # Get a unique request ID
         self.request_id += 1
         request_id = self.request_id
+        queue = self._register((request_id,))
         
         try:
-            # Create the request
-            request = create_request(method, params, request_id)
-            
-            # Convert to JSON and add newline
-            request_json = json.dumps(request) + "\n"
+            # Create the request as newline-terminated JSON bytes
+            request_bytes = create_request_bytes(method, params, request_id)
             
             # Log the request
-            self.logger.debug(f"Sending request: {request_json.strip()}")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("Sending request: %s", request_bytes[:-1].decode())
             
             # Send the request
-            self.writer.write(request_json.encode())
-            await self.writer.drain()
+            await self._write_frame(request_bytes)
+            
+            # Wait for the reader to route our response
+            return self._check_response(await queue.get())
             
-            # Read the response
-            response_line = await self.reader.readline()
-            if not response_line:
-                raise TransportError("Connection closed by server")
+        except asyncio.CancelledError:
+            # Re-raise cancellation
+            raise
+        except Exception as e:
+            if isinstance(e, TransportError):
+                raise
+            else:
+                raise TransportError(f"Error sending message: {str(e)}", e)
+        finally:
+            del self._queues[request_id]
+    
+    async def send_batch(self, requests: List[Tuple[str, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """
+        Send several messages to the server as one JSON-RPC batch.
+        
+        If the server rejects the batch with a single error, or does not answer
+        it within batch_timeout, the requests are sent again one at a time, and
+        so are all later batches.
+        
+        Args:
+            requests: List of (method, params) pairs
+            
+        Returns:
+            The responses from the server, in request order
+            
+        Raises:
+            TransportError: If an error occurs during transport
+        """
+        if not requests:
+            return []
+        
+        if not self.writer or not self.reader:
+            raise TransportError("Not connected to server")
+        
+        if not self._batch_supported:
+            return await super().send_batch(requests)
+        
+        # Get a unique request ID for each message
+        first_id = self.request_id + 1
+        self.request_id += len(requests)
+        request_ids = range(first_id, self.request_id + 1)
+        queue = self._register(request_ids)
+        self._batch_queues.add(queue)
+        
+        try:
+            # Create the batch
+            batch = [
+                create_request_fast(method, params, request_id)
+                for request_id, (method, params) in zip(request_ids, requests)
+            ]
+            
+            # Convert to newline-terminated JSON bytes
+            batch_bytes = encode_message(batch)
+            
+            # Log the batch
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("Sending batch: %s", batch_bytes[:-1].decode())
+            
+            # Send the whole batch in one frame
+            await self._write_frame(batch_bytes)
             
-            # Parse the response
             try:
-                response_str = response_line.decode().strip()
-                self.logger.debug(f"Received response: {response_str}")
-                response = json.loads(response_str)
-            except json.JSONDecodeError as e:
-                raise TransportError(f"Invalid JSON in response: {response_line.decode()}", e)
-            
-            # Verify it's for our request
-            if "id" not in response or response["id"] != request_id:
-                raise TransportError(
-                    f"Response ID mismatch: expected {request_id}, got {response.get('id')}"
-                )
+                responses = await asyncio.wait_for(self._collect_batch(queue, len(batch)), self.batch_timeout)
+            except asyncio.TimeoutError:
+                raise _BatchRejected(f"No response to batch within {self.batch_timeout}s")
             
-            return response
+            return [responses[request_id] for request_id in request_ids]
             
+        except _BatchRejected as e:
+            rejected = e
         except asyncio.CancelledError:
             # Re-raise cancellation
             raise
@@ -173,15 +487,48 @@ class StdioTransport(Transport):
             if isinstance(e, TransportError):
                 raise
             else:
-                raise TransportError(f"Error sending message: {str(e)}", e)
+                raise TransportError(f"Error sending batch: {str(e)}", e)
+        finally:
+            self._batch_queues.discard(queue)
+            for request_id in request_ids:
+                del self._queues[request_id]
+        
+        self.logger.warning("%s; sending requests one at a time", rejected)
+        self._batch_supported = False
+        return await super().send_batch(requests)
     
-    async def send_streaming_message(self, method: str, params: Dict[str, Any]) -> AsyncGenerator[Dict[str, Any], None]:
+    async def _collect_batch(self, queue: SPSCBuffer, count: int) -> Dict[Any, Dict[str, Any]]:
+        """
+        Wait until every request in a batch has been answered.
+        
+        Servers may reply with a single batch array or with one response per line.
+        
+        Args:
+            queue: The queue registered for the batch
+            count: The number of requests in the batch
+            
+        Returns:
+            The responses keyed by request ID
+            
+        Raises:
+            TransportError: If the connection closed, failed or rejected the batch
+        """
+        responses: Dict[Any, Dict[str, Any]] = {}
+        while len(responses) < count:
+            response = self._check_response(await queue.get())
+            responses[response["id"]] = response
+        return responses
+    
+    async def send_streaming_message(self, method: str, params: Dict[str, Any],
+                                     extract: bool = False) -> AsyncGenerator[Any, None]:
         """
         Send a message to the server and get a streaming response.
         
         Args:
             method: The method name to call
             params: Parameters for the method
+            extract: Yield (STREAM_RESULT, result) or (STREAM_ERROR, error)
+                pairs instead of whole responses, skipping chunks with neither
             
         Returns:
             An async generator yielding response chunks
@@ -195,48 +542,42 @@ class StdioTransport(Transport):
         # Get a unique request ID
         self.request_id += 1
         request_id = self.request_id
+        queue = self._register((request_id,))
         
         try:
-            # Create the request
-            request = create_request(method, params, request_id)
-            
-            # Convert to JSON and add newline
-            request_json = json.dumps(request) + "\n"
+            # Create the request as newline-terminated JSON bytes
+            request_bytes = create_request_bytes(method, params, request_id)
             
             # Log the request
-            self.logger.debug(f"Sending streaming request: {request_json.strip()}")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("Sending streaming request: %s", request_bytes[:-1].decode())
             
             # Send the request
-            self.writer.write(request_json.encode())
-            await self.writer.drain()
+            await self._write_frame(request_bytes)
             
-            # Read responses until complete
+            # Take responses routed to us until complete
             while True:
-                response_line = await self.reader.readline()
-                if not response_line:
+                response = await queue.get()
+                if response is _CLOSED:
                     # Connection closed
                     self.logger.debug("Connection closed by server in streaming response")
                     break
+                response = self._check_response(response)
                 
-                # Parse the response
-                try:
-                    response_str = response_line.decode().strip()
-                    self.logger.debug(f"Received streaming response chunk: {response_str}")
-                    response = json.loads(response_str)
-                except json.JSONDecodeError as e:
-                    raise TransportError(f"Invalid JSON in streaming response: {response_line.decode()}", e)
-                
-                # Verify it's for our request
-                if "id" not in response or response["id"] != request_id:
-                    # Skip responses that don't match our request ID
-                    self.logger.warning(f"Skipping response with mismatched ID: {response.get('id')}")
-                    continue
-                
-                # Yield the response
-                yield response
+                # Yield the response, or just its payload
+                if not extract:
+                    yield response
+                else:
+                    result = response.get("result", _MISSING)
+                    if result is not _MISSING:
+                        yield STREAM_RESULT, result
+                    else:
+                        error = response.get("error", _MISSING)
+                        if error is not _MISSING:
+                            yield STREAM_ERROR, error
                 
                 # If this is the final response (not partial), stop
-                if "partial" not in response or not response["partial"]:
+                if not response.get("partial"):
                     break
             
         except asyncio.CancelledError:
@@ -247,3 +588,5 @@ class StdioTransport(Transport):
                 raise
             else:
                 raise TransportError(f"Error in streaming message: {str(e)}", e)
+        finally:
+            del self._queues[request_id]
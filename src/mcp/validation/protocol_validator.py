@@ -5,12 +5,115 @@ Protocol Validator for MCP messages.
 Validates that messages and responses conform to the MCP specification.
 """
 import json
-from typing import Any, Dict, Optional
+from typing import Any, Callable, ClassVar, Dict, List, Optional, Tuple
+
+# Sentinel for fields that are not present
+_MISSING = object()
+
+
+# Valid 'type' values of listDirectory entries; a tuple, since entry types
+# may be unhashable values such as lists
+_ENTRY_TYPES = ("file", "directory")
+
+# Exact types allowed for request and response ids; bool is a subclass of
+# int, so ids are checked with type() rather than isinstance()
+_ID_TYPES = frozenset({str, int})
+_RESPONSE_ID_TYPES = frozenset({str, int, type(None)})
+
+# Type descriptions used in tool result error messages
+_TYPE_NAMES = {bool: "a boolean", list: "an array"}
+
+
+def _make_fields_validator(tool_name: str,
+                           fields: Tuple[Tuple[str, Optional[type]], ...]) -> Callable[[Dict[str, Any]], Optional[str]]:
+    """
+    Build a validator checking that a tool result has the given fields.
+    
+    The error messages are formatted once, when the validator is built.
+    
+    Args:
+        tool_name: Name of the tool, used in error messages
+        fields: (key, type) pairs in checking order; a type of None only
+            requires the field to be present
+        
+    Returns:
+        A function returning None for a valid result, error message otherwise
+    """
+    checks = tuple(
+        (
+            key,
+            expected,
+            f"Invalid result for {tool_name}: missing required field '{key}'",
+            f"Invalid result for {tool_name}: '{key}' must be {_TYPE_NAMES.get(expected)}"
+        )
+        for key, expected in fields
+    )
+    
+    def validate(result: Dict[str, Any]) -> Optional[str]:
+        for key, expected, missing_error, type_error in checks:
+            value = result.get(key, _MISSING)
+            if value is _MISSING:
+                return missing_error
+            if expected is not None and not isinstance(value, expected):
+                return type_error
+        return None
+    
+    return validate
+
+
+_validate_entries_field = _make_fields_validator("listDirectory", (("entries", list),))
+
+
+def _validate_list_directory(result: Dict[str, Any]) -> Optional[str]:
+    """Validate a listDirectory result, including each of its entries."""
+    error = _validate_entries_field(result)
+    if error is not None:
+        return error
+    
+    entries = result["entries"]
+    if all(isinstance(entry, dict) and entry.get("type") in _ENTRY_TYPES and "name" in entry
+           for entry in entries):
+        return None
+    
+    # Report the first problem
+    for entry in entries:
+        if not isinstance(entry, dict):
+            return "Invalid result for listDirectory: each entry must be an object"
+        if "name" not in entry:
+            return "Invalid result for listDirectory: each entry must have a 'name'"
+        if "type" not in entry:
+            return "Invalid result for listDirectory: each entry must have a 'type'"
+        if entry["type"] not in _ENTRY_TYPES:
+            return "Invalid result for listDirectory: 'type' must be 'file' or 'directory'"
+    return None
+
 
 # We'll use a simple validation approach first and can add jsonschema later if needed
 class ProtocolValidator:
     """Validates MCP protocol messages and responses."""
     
+    # Required request fields between 'jsonrpc' and 'id', in reporting
+    # order, with their expected type and the error for a value of the wrong type
+    _REQUEST_FIELDS: ClassVar[Tuple[Tuple[str, type, str], ...]] = (
+        ("method", str, "Invalid 'method' type: must be a string"),
+        ("params", dict, "Invalid 'params' type: must be an object"),
+    )
+    
+    # Required fields of a response error object, checked the same way
+    _ERROR_FIELDS: ClassVar[Tuple[Tuple[str, type, str], ...]] = (
+        ("code", int, "Invalid error 'code' type: must be a number"),
+        ("message", str, "Invalid error 'message' type: must be a string"),
+    )
+    
+    # Result validators of the tools with a known result schema
+    _TOOL_VALIDATORS: ClassVar[Dict[str, Callable[[Dict[str, Any]], Optional[str]]]] = {
+        "readFile": _make_fields_validator("readFile", (("content", None),)),
+        "writeFile": _make_fields_validator("writeFile", (("success", bool),)),
+        "listDirectory": _validate_list_directory,
+        "query": _make_fields_validator("query", (("rows", list),)),
+        "getTables": _make_fields_validator("getTables", (("tables", None),)),
+    }
+    
     @classmethod
     def validate_request(cls, request: Dict[str, Any]) -> Optional[str]:
         """
@@ -23,28 +126,44 @@ class ProtocolValidator:
             None if valid, error message otherwise
         """
         # Check required fields
-        if "jsonrpc" not in request:
+        jsonrpc = request.get("jsonrpc", _MISSING)
+        if jsonrpc is _MISSING:
             return "Missing required field: 'jsonrpc'"
-        if request["jsonrpc"] != "2.0":
+        if jsonrpc != "2.0":
             return "Invalid 'jsonrpc' value: must be '2.0'"
         
-        if "method" not in request:
-            return "Missing required field: 'method'"
-        if not isinstance(request["method"], str):
-            return "Invalid 'method' type: must be a string"
-        
-        if "params" not in request:
-            return "Missing required field: 'params'"
-        if not isinstance(request["params"], dict):
-            return "Invalid 'params' type: must be an object"
+        for key, expected, type_error in cls._REQUEST_FIELDS:
+            value = request.get(key, _MISSING)
+            if value is _MISSING:
+                return f"Missing required field: '{key}'"
+            if not isinstance(value, expected):
+                return type_error
         
-        if "id" not in request:
+        request_id = request.get("id", _MISSING)
+        if request_id is _MISSING:
             return "Missing required field: 'id'"
-        if not isinstance(request["id"], (str, int)):
+        if type(request_id) not in _ID_TYPES:
             return "Invalid 'id' type: must be a string or number"
         
         return None
     
+    @classmethod
+    def validate_batch(cls, requests: List[Any]) -> List[Optional[str]]:
+        """
+        Validate the requests of a JSON-RPC batch.
+        
+        Args:
+            requests: The requests of the batch
+            
+        Returns:
+            For each request, None if valid, error message otherwise
+        """
+        validate = cls.validate_request
+        return [
+            validate(request) if isinstance(request, dict) else "Invalid request: must be an object"
+            for request in requests
+        ]
+    
     @classmethod
     def validate_response(cls, response: Dict[str, Any]) -> Optional[str]:
         """
@@ -57,41 +176,41 @@ class ProtocolValidator:
             None if valid, error message otherwise
         """
         # Check required fields
-        if "jsonrpc" not in response:
+        jsonrpc = response.get("jsonrpc", _MISSING)
+        if jsonrpc is _MISSING:
             return "Missing required field: 'jsonrpc'"
-        if response["jsonrpc"] != "2.0":
+        if jsonrpc != "2.0":
             return "Invalid 'jsonrpc' value: must be '2.0'"
         
-        if "id" not in response:
+        response_id = response.get("id", _MISSING)
+        if response_id is _MISSING:
             return "Missing required field: 'id'"
-        if not isinstance(response["id"], (str, int)) and response["id"] is not None:
+        if type(response_id) not in _RESPONSE_ID_TYPES:
             return "Invalid 'id' type: must be a string, number, or null"
         
         # Check result or error
-        if "result" not in response and "error" not in response:
-            return "Missing required field: either 'result' or 'error' must be present"
-        
-        if "error" in response and "result" in response:
-            return "Invalid response: cannot have both 'result' and 'error'"
-        
-        # Validate error structure if present
-        if "error" in response:
-            error = response["error"]
+        has_result = "result" in response
+        error = response.get("error", _MISSING)
+        if error is _MISSING:
+            if not has_result:
+                return "Missing required field: either 'result' or 'error' must be present"
+        else:
+            if has_result:
+                return "Invalid response: cannot have both 'result' and 'error'"
+            
+            # Validate error structure
             if not isinstance(error, dict):
                 return "Invalid 'error' type: must be an object"
-            
-            if "code" not in error:
-                return "Missing required field in error: 'code'"
-            if not isinstance(error["code"], int):
-                return "Invalid error 'code' type: must be a number"
-            
-            if "message" not in error:
-                return "Missing required field in error: 'message'"
-            if not isinstance(error["message"], str):
-                return "Invalid error 'message' type: must be a string"
+            for key, expected, type_error in cls._ERROR_FIELDS:
+                value = error.get(key, _MISSING)
+                if value is _MISSING:
+                    return f"Missing required field in error: '{key}'"
+                if not isinstance(value, expected):
+                    return type_error
         
         # Check optional partial field
-        if "partial" in response and not isinstance(response["partial"], bool):
+        partial = response.get("partial", _MISSING)
+        if partial is not _MISSING and not isinstance(partial, bool):
             return "Invalid 'partial' type: must be a boolean"
         
         return None
@@ -108,42 +227,7 @@ class ProtocolValidator:
         Returns:
             None if valid, error message otherwise
         """
-        # Basic validation for common tools
-        if tool_name == "readFile":
-            if "content" not in result:
-                return "Invalid result for readFile: missing required field 'content'"
-        
-        elif tool_name == "writeFile":
-            if "success" not in result:
-                return "Invalid result for writeFile: missing required field 'success'"
-            if not isinstance(result["success"], bool):
-                return "Invalid result for writeFile: 'success' must be a boolean"
-        
-        elif tool_name == "listDirectory":
-            if "entries" not in result:
-                return "Invalid result for listDirectory: missing required field 'entries'"
-            if not isinstance(result["entries"], list):
-                return "Invalid result for listDirectory: 'entries' must be an array"
-            
-            for entry in result["entries"]:
-                if not isinstance(entry, dict):
-                    return "Invalid result for listDirectory: each entry must be an object"
-                if "name" not in entry:
-                    return "Invalid result for listDirectory: each entry must have a 'name'"
-                if "type" not in entry:
-                    return "Invalid result for listDirectory: each entry must have a 'type'"
-                if entry["type"] not in ["file", "directory"]:
-                    return "Invalid result for listDirectory: 'type' must be 'file' or 'directory'"
-        
-        elif tool_name == "query":
-            if "rows" not in result:
-                return "Invalid result for query: missing required field 'rows'"
-            if not isinstance(result["rows"], list):
-                return "Invalid result for query: 'rows' must be an array"
-        
-        elif tool_name == "getTables":
-            if "tables" not in result:
-                return "Invalid result for getTables: missing required field 'tables'"
-        
-        # For unrecognized tools, we perform minimal validation
-        return None
+        # Basic validation for common tools; for unrecognized tools, we
+        # perform minimal validation
+        validator = cls._TOOL_VALIDATORS.get(tool_name)
+        return validator(result) if validator is not None else None
@@ -0,0 +1,27 @@
+# tests/core/conftest.py
+"""
+Shared fixtures for the core tests.
+"""
+import json
+from pathlib import Path
+
+import pytest
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib parser
+    orjson = None
+
+
+def _read_json(path):
+    """Parse a JSON file, read as bytes in one go."""
+    data = Path(path).read_bytes()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+@pytest.fixture
+def read_json():
+    """Function reading a saved JSON config file."""
+    return _read_json
@@ -74,7 +74,7 @@ def test_get_all_servers(temp_config_file):
     assert len(servers) == 2
 
 
-def test_add_server(temp_config_file):
+def test_add_server(temp_config_file, read_json):
     """Test adding a server configuration."""
     config_service = ConfigService(temp_config_file)
     
@@ -92,12 +92,11 @@ def test_add_server(temp_config_file):
     assert servers["test3"]["command"] == "test3"
     
     # Verify it was saved to the file
-    with open(temp_config_file, 'r') as f:
-        saved_config = json.load(f)
-        assert "test3" in saved_config["mcpServers"]
+    saved_config = read_json(temp_config_file)
+    assert "test3" in saved_config["mcpServers"]
 
 
-def test_remove_server(temp_config_file):
+def test_remove_server(temp_config_file, read_json):
     """Test removing a server configuration."""
     config_service = ConfigService(temp_config_file)
     
@@ -112,12 +111,11 @@ def test_remove_server(temp_config_file):
     assert "test2" in servers
     
     # Verify it was saved to the file
-    with open(temp_config_file, 'r') as f:
-        saved_config = json.load(f)
-        assert "test1" not in saved_config["mcpServers"]
+    saved_config = read_json(temp_config_file)
+    assert "test1" not in saved_config["mcpServers"]
 
 
-def test_update_server(temp_config_file):
+def test_update_server(temp_config_file, read_json):
     """Test updating a server configuration."""
     config_service = ConfigService(temp_config_file)
     
@@ -135,6 +133,51 @@ def test_update_server(temp_config_file):
     assert "--new-arg" in server_config["args"]
     
     # Verify it was saved to the file
-    with open(temp_config_file, 'r') as f:
-        saved_config = json.load(f)
-        assert saved_config["mcpServers"]["test1"]["command"] == "updated"
+    saved_config = read_json(temp_config_file)
+    assert saved_config["mcpServers"]["test1"]["command"] == "updated"
+
+
+def test_load_config_private_copy(temp_config_file):
+    """Test that each service loads its own copy of the file."""
+    first = ConfigService(temp_config_file)
+    first.config["mcpServers"]["scratch"] = {"command": "scratch"}
+    
+    # A second service must not see the unsaved mutation
+    second = ConfigService(temp_config_file)
+    assert "scratch" not in second.get_all_servers()
+    
+    # New services see saved changes
+    assert first.save_config()
+    third = ConfigService(temp_config_file)
+    assert "scratch" in third.get_all_servers()
+
+
+def test_transaction_batches_writes(temp_config_file, read_json):
+    """Test that mutations inside a transaction are written once at the end."""
+    config_service = ConfigService(temp_config_file)
+    
+    with config_service.transaction():
+        assert config_service.add_server("test3", {"command": "test3", "args": []})
+        assert config_service.remove_server("test2")
+        
+        # Nothing is written until the transaction ends
+        saved_config = read_json(temp_config_file)
+        assert "test3" not in saved_config["mcpServers"]
+        assert "test2" in saved_config["mcpServers"]
+    
+    saved_config = read_json(temp_config_file)
+    assert "test3" in saved_config["mcpServers"]
+    assert "test2" not in saved_config["mcpServers"]
+    assert not os.path.exists(temp_config_file + ".tmp")
+
+
+def test_failed_transaction_not_written(temp_config_file, read_json):
+    """Test that a transaction ending in an exception does not write the file."""
+    config_service = ConfigService(temp_config_file)
+    
+    with pytest.raises(RuntimeError):
+        with config_service.transaction():
+            config_service.add_server("test3", {"command": "test3", "args": []})
+            raise RuntimeError("abort")
+    
+    assert "test3" not in read_json(temp_config_file)["mcpServers"]
@@ -96,3 +96,14 @@ def test_override_registration():
     
     # Resolve the implementation
     assert Container.resolve("service") == "Override"
+
+
+def test_register_instance_replaces_factory():
+    """Test that a later instance registration replaces a pending factory."""
+    # Clear container before test
+    Container.clear()
+    
+    Container.register("service", factory=lambda: "From factory")
+    Container.register("service", "Instance")
+    
+    assert Container.resolve("service") == "Instance"
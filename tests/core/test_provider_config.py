@@ -2,48 +2,54 @@
 """
 Tests for the provider configuration service.
 """
-import os
 import json
+import shutil
 import pytest
-import tempfile
+from core.di import Container
 from src.core.provider_config import ProviderConfigService
 
 
-@pytest.fixture
-def temp_config_file():
-    """Create a temporary config file for testing."""
-    # Create a temporary file
-    fd, path = tempfile.mkstemp(suffix=".json")
-    
-    # Write test configuration
-    with os.fdopen(fd, 'w') as f:
-        json.dump({
-            "defaultProvider": "test-provider",
-            "defaultModels": {
-                "test-provider": "test-model",
-                "other-provider": "other-model"
+@pytest.fixture(scope="session")
+def base_config_dict():
+    """The test configuration, shared by all tests (do not mutate)."""
+    return {
+        "defaultProvider": "test-provider",
+        "defaultModels": {
+            "test-provider": "test-model",
+            "other-provider": "other-model"
+        },
+        "providers": {
+            "test-provider": {
+                "type": "test",
+                "apiKeyEnvVar": "TEST_API_KEY",
+                "baseUrl": "https://test.api",
+                "models": ["test-model", "test-model-2"],
+                "streaming": True
             },
-            "providers": {
-                "test-provider": {
-                    "type": "test",
-                    "apiKeyEnvVar": "TEST_API_KEY",
-                    "baseUrl": "https://test.api",
-                    "models": ["test-model", "test-model-2"],
-                    "streaming": True
-                },
-                "other-provider": {
-                    "type": "other",
-                    "baseUrl": "http://other.api",
-                    "models": ["other-model"],
-                    "streaming": False
-                }
+            "other-provider": {
+                "type": "other",
+                "baseUrl": "http://other.api",
+                "models": ["other-model"],
+                "streaming": False
             }
-        }, f)
-    
-    yield path
-    
-    # Clean up
-    os.unlink(path)
+        }
+    }
+
+
+@pytest.fixture(scope="session")
+def baseline_config_file(base_config_dict, tmp_path_factory):
+    """The test configuration, written to disk once per session."""
+    path = tmp_path_factory.mktemp("baseline") / "config.json"
+    path.write_text(json.dumps(base_config_dict))
+    return path
+
+
+@pytest.fixture
+def temp_config_file(baseline_config_file, tmp_path):
+    """Create a temporary config file for testing."""
+    path = tmp_path / "config.json"
+    shutil.copyfile(baseline_config_file, path)
+    return str(path)
 
 
 def test_load_config(temp_config_file):
@@ -63,6 +69,71 @@ def test_load_config(temp_config_file):
     assert len(provider_config["models"]) == 2
 
 
+def test_injected_config(base_config_dict, tmp_path):
+    """Test that an injected configuration is used without reading the file."""
+    config_file = tmp_path / "config.json"
+    config_service = ProviderConfigService(str(config_file), config=base_config_dict)
+    
+    assert config_service.get_default_provider() == "test-provider"
+    assert not config_file.exists()
+    
+    # Changes are written to the file, leaving the injected dict untouched
+    assert config_service.set_default_provider("other-provider")
+    assert json.loads(config_file.read_text())["defaultProvider"] == "other-provider"
+    assert base_config_dict["defaultProvider"] == "test-provider"
+
+
+def test_persistence_roundtrip(temp_config_file):
+    """Test that changes written to the file are read back by a new service."""
+    config_service = ProviderConfigService(temp_config_file)
+    assert config_service.set_default_model("test-provider", "test-model-2")
+    
+    with open(temp_config_file, 'rb') as f:
+        assert f.read() == config_service._last_written
+    
+    reloaded = ProviderConfigService(temp_config_file)
+    assert reloaded.get_default_model("test-provider") == "test-model-2"
+    assert reloaded.config == config_service.config
+
+
+def test_get_shared_service(temp_config_file):
+    """Test that get() shares the registered service and reloads it when changed."""
+    Container.clear()
+    config_service = ProviderConfigService.get(temp_config_file)
+    assert Container.resolve('provider_config') is config_service
+    assert ProviderConfigService.get(temp_config_file) is config_service
+    
+    # Our own writes do not trigger a reload
+    assert config_service.set_default_provider("other-provider")
+    assert ProviderConfigService.get(temp_config_file) is config_service
+    assert config_service.get_default_provider() == "other-provider"
+    
+    # A change made by someone else is picked up
+    with open(temp_config_file, 'w') as f:
+        json.dump({"defaultProvider": "external-provider", "providers": {}}, f)
+    assert ProviderConfigService.get(temp_config_file) is config_service
+    assert config_service.get_default_provider() == "external-provider"
+    assert config_service.get_all_providers() == {}
+    
+    # Clearing the container drops the shared service
+    Container.clear()
+    assert ProviderConfigService.get(temp_config_file) is not config_service
+    Container.clear()
+
+
+def test_get_injected_service(base_config_dict, temp_config_file):
+    """Test that get() keeps a registered service built from a dict."""
+    Container.clear()
+    config_service = ProviderConfigService(temp_config_file, config={**base_config_dict, "defaultProvider": "injected"})
+    Container.register('provider_config', config_service)
+    
+    # Without a path, the registered service is used whatever its file
+    assert ProviderConfigService.get() is config_service
+    assert ProviderConfigService.get(temp_config_file) is config_service
+    assert config_service.get_default_provider() == "injected"
+    Container.clear()
+
+
 def test_load_nonexistent_config():
     """Test loading a non-existent config file."""
     # Create config service with non-existent file
@@ -74,9 +145,9 @@ def test_load_nonexistent_config():
     assert "ollama" in config_service.get_all_providers()
 
 
-def test_get_default_model(temp_config_file):
+def test_get_default_model(base_config_dict):
     """Test getting the default model for a provider."""
-    config_service = ProviderConfigService(temp_config_file)
+    config_service = ProviderConfigService(config=base_config_dict)
     
     assert config_service.get_default_model("test-provider") == "test-model"
     assert config_service.get_default_model("other-provider") == "other-model"
@@ -103,9 +174,8 @@ def test_add_provider(temp_config_file):
     assert providers["new-provider"]["type"] == "new"
     
     # Verify it was saved to the file
-    with open(temp_config_file, 'r') as f:
-        saved_config = json.load(f)
-        assert "new-provider" in saved_config["providers"]
+    saved_config = json.loads(config_service._last_written)
+    assert "new-provider" in saved_config["providers"]
 
 
 def test_remove_provider(temp_config_file):
@@ -123,9 +193,8 @@ def test_remove_provider(temp_config_file):
     assert "test-provider" in providers
     
     # Verify it was removed from defaultModels
-    with open(temp_config_file, 'r') as f:
-        saved_config = json.load(f)
-        assert "other-provider" not in saved_config["defaultModels"]
+    saved_config = json.loads(config_service._last_written)
+    assert "other-provider" not in saved_config["defaultModels"]
 
 
 def test_remove_default_provider(temp_config_file):
@@ -141,9 +210,8 @@ def test_remove_default_provider(temp_config_file):
     assert config_service.get_default_provider() == "other-provider"
     
     # Verify it was saved to the file
-    with open(temp_config_file, 'r') as f:
-        saved_config = json.load(f)
-        assert saved_config["defaultProvider"] == "other-provider"
+    saved_config = json.loads(config_service._last_written)
+    assert saved_config["defaultProvider"] == "other-provider"
 
 
 def test_update_provider(temp_config_file):
@@ -168,9 +236,8 @@ def test_update_provider(temp_config_file):
     assert provider_config["streaming"] == False
     
     # Verify it was saved to the file
-    with open(temp_config_file, 'r') as f:
-        saved_config = json.load(f)
-        assert saved_config["providers"]["test-provider"]["type"] == "updated"
+    saved_config = json.loads(config_service._last_written)
+    assert saved_config["providers"]["test-provider"]["type"] == "updated"
 
 
 def test_set_default_provider(temp_config_file):
@@ -184,9 +251,8 @@ def test_set_default_provider(temp_config_file):
     assert config_service.get_default_provider() == "other-provider"
     
     # Verify it was saved to the file
-    with open(temp_config_file, 'r') as f:
-        saved_config = json.load(f)
-        assert saved_config["defaultProvider"] == "other-provider"
+    saved_config = json.loads(config_service._last_written)
+    assert saved_config["defaultProvider"] == "other-provider"
 
 
 def test_set_default_model(temp_config_file):
@@ -200,14 +266,13 @@ def test_set_default_model(temp_config_file):
     assert config_service.get_default_model("test-provider") == "test-model-2"
     
     # Verify it was saved to the file
-    with open(temp_config_file, 'r') as f:
-        saved_config = json.load(f)
-        assert saved_config["defaultModels"]["test-provider"] == "test-model-2"
+    saved_config = json.loads(config_service._last_written)
+    assert saved_config["defaultModels"]["test-provider"] == "test-model-2"
 
 
-def test_get_api_key(temp_config_file, monkeypatch):
+def test_get_api_key(base_config_dict, monkeypatch):
     """Test getting the API key for a provider."""
-    config_service = ProviderConfigService(temp_config_file)
+    config_service = ProviderConfigService(config=base_config_dict)
     
     # Set environment variable
     monkeypatch.setenv("TEST_API_KEY", "test-key-value")
@@ -223,9 +288,9 @@ def test_get_api_key(temp_config_file, monkeypatch):
     assert api_key is None
 
 
-def test_get_models(temp_config_file):
+def test_get_models(base_config_dict):
     """Test getting the models for a provider."""
-    config_service = ProviderConfigService(temp_config_file)
+    config_service = ProviderConfigService(config=base_config_dict)
     
     # Get models
     models = config_service.get_models("test-provider")
@@ -236,3 +301,49 @@ def test_get_models(temp_config_file):
     models = config_service.get_models("unknown-provider")
     
     assert models == []
+
+
+def test_transaction_batches_writes(temp_config_file, read_json):
+    """Test that mutations inside a transaction are written once at the end."""
+    config_service = ProviderConfigService(temp_config_file)
+    
+    with config_service.transaction():
+        assert config_service.set_default_provider("other-provider")
+        assert config_service.set_default_model("other-provider", "other-model-2")
+        
+        # Nothing is written until the transaction ends
+        saved_config = read_json(temp_config_file)
+        assert saved_config["defaultProvider"] == "test-provider"
+    
+    saved_config = read_json(temp_config_file)
+    assert saved_config["defaultProvider"] == "other-provider"
+    assert saved_config["defaultModels"]["other-provider"] == "other-model-2"
+    
+    # A transaction ending in an exception is not written
+    with pytest.raises(RuntimeError):
+        with config_service.transaction():
+            config_service.set_default_provider("test-provider")
+            raise RuntimeError("abort")
+    
+    assert read_json(temp_config_file)["defaultProvider"] == "other-provider"
+
+
+def test_get_api_key_cached(temp_config_file, monkeypatch):
+    """Test that API keys are cached until the provider is updated."""
+    config_service = ProviderConfigService(temp_config_file)
+    
+    # A missing key is not cached
+    monkeypatch.delenv("TEST_API_KEY", raising=False)
+    assert config_service.get_api_key("test-provider") is None
+    
+    monkeypatch.setenv("TEST_API_KEY", "first-key")
+    assert config_service.get_api_key("test-provider") == "first-key"
+    
+    # The cached key is returned even if the environment changes
+    monkeypatch.setenv("TEST_API_KEY", "second-key")
+    assert config_service.get_api_key("test-provider") == "first-key"
+    
+    # Updating the provider drops the cached key
+    provider_config = dict(config_service.get_provider_config("test-provider"))
+    config_service.update_provider("test-provider", provider_config)
+    assert config_service.get_api_key("test-provider") == "second-key"
@@ -0,0 +1,73 @@
+"""
+Tests for the mock LLM provider.
+"""
+import pytest
+
+from llm.providers.mock_provider import MockProvider
+
+# Force asyncio only for all tests in this file
+pytestmark = [pytest.mark.asyncio]
+
+
+async def test_generate_text():
+    """Test predefined and default text responses."""
+    provider = MockProvider()
+    provider.add_response("hello", "Hi there")
+    
+    messages = [{"role": "user", "content": "hello"}]
+    assert await provider.generate_text(messages) == "Hi there"
+    
+    messages = [{"role": "user", "content": "other"}]
+    assert await provider.generate_text(messages) == "This is a mock response from mock-model."
+
+
+async def test_generate_streaming_text():
+    """Test predefined and default streaming responses."""
+    provider = MockProvider()
+    provider.add_streaming_response("hello", ["Hi ", "there"])
+    
+    messages = [{"role": "user", "content": "hello"}]
+    chunks = [chunk async for chunk in provider.generate_streaming_text(messages)]
+    assert chunks == ["Hi ", "there"]
+    
+    messages = [{"role": "user", "content": "other"}]
+    chunks = [chunk async for chunk in provider.generate_streaming_text(messages)]
+    assert "".join(chunks) == "This is a mock streaming response from mock-model."
+
+
+async def test_change_model_default_responses():
+    """Test that default responses follow model changes."""
+    provider = MockProvider()
+    provider.change_model("other-model")
+    
+    messages = [{"role": "user", "content": "hello"}]
+    assert await provider.generate_text(messages) == "This is a mock response from other-model."
+    chunks = [chunk async for chunk in provider.generate_streaming_text(messages)]
+    assert "".join(chunks) == "This is a mock streaming response from other-model."
+
+
+async def test_tool_call():
+    """Test that predefined tool calls are passed to the tool handler."""
+    provider = MockProvider()
+    provider.add_tool_call("read", "readFile", {"path": "a.txt"})
+    calls = []
+    
+    async def tool_handler(tool_name, params):
+        calls.append((tool_name, params))
+    
+    messages = [
+        {"role": "user", "content": "read"},
+        {"role": "assistant", "content": "Reading"}
+    ]
+    await provider.generate_text(messages, tool_handler)
+    
+    assert calls == [("readFile", {"path": "a.txt"})]
+
+
+async def test_slots():
+    """Test that mock providers have no instance dict but support weak references."""
+    provider = MockProvider()
+    
+    assert not hasattr(provider, "__dict__")
+    with pytest.raises(AttributeError):
+        provider.unknown = True
@@ -0,0 +1,100 @@
+"""
+Tests for the LLM provider factory.
+"""
+import json
+import pytest
+
+from core.di import Container
+from core.provider_config import ProviderConfigService
+from llm.providers.provider_factory import ProviderFactory
+from llm.providers.mock_provider import MockProvider
+
+
+@pytest.fixture
+def factory(tmp_path):
+    """Create a provider factory backed by a mock provider configuration."""
+    config_file = tmp_path / "providers_config.json"
+    config_file.write_text(json.dumps({
+        "defaultProvider": "mock",
+        "defaultModels": {"mock": "mock-model"},
+        "providers": {
+            "mock": {
+                "type": "mock",
+                "baseUrl": "http://mock.api",
+                "models": ["mock-model", "mock-model-2"],
+                "streaming": False
+            }
+        }
+    }))
+    
+    Container.clear()
+    Container.register('provider_config', ProviderConfigService(str(config_file)))
+    yield ProviderFactory()
+    Container.clear()
+
+
+def test_create_provider(factory):
+    """Test creating a provider from configuration."""
+    provider = factory.create_provider("mock")
+    
+    assert isinstance(provider, MockProvider)
+    assert provider.model_name == "mock-model"
+    assert factory.get_provider("mock") is provider
+
+
+def test_create_provider_model_override(factory):
+    """Test creating a provider with an explicit model."""
+    provider = factory.create_provider("mock", "mock-model-2")
+    
+    assert provider.model_name == "mock-model-2"
+
+
+def test_create_unknown_provider(factory):
+    """Test creating a provider that is not configured."""
+    with pytest.raises(ValueError):
+        factory.create_provider("unknown")
+
+
+def test_create_provider_fresh_instances(factory):
+    """Test that each creation returns a new provider instance."""
+    provider = factory.create_provider("mock")
+    other = factory.create_provider("mock")
+    
+    assert other is not provider
+    assert factory.get_provider("mock") is other
+    other.model_name = "mock-model-2"
+    assert provider.model_name == "mock-model"
+
+
+def test_load_custom_providers(factory, tmp_path):
+    """Test loading custom providers once per unchanged module."""
+    providers_dir = tmp_path / "custom_providers"
+    providers_dir.mkdir()
+    (providers_dir / "echo.py").write_text(
+        "from llm.providers.mock_provider import MockProvider\n"
+        "\n"
+        "class EchoProvider(MockProvider):\n"
+        "    PROVIDER_TYPE = 'echo'\n"
+    )
+    (providers_dir / "_private.py").write_text("raise RuntimeError('not loaded')\n")
+    
+    # MockProvider is imported by the module as well, so it is registered too
+    assert factory.load_custom_providers(str(providers_dir)) == 2
+    assert "echo" in factory.get_available_provider_types()
+    
+    # Unchanged modules are not executed again
+    assert factory.load_custom_providers(str(providers_dir)) == 0
+    assert factory.load_custom_providers(str(tmp_path / "missing")) == 0
+
+
+def test_available_provider_types(factory):
+    """Test that provider type lists are fresh and follow registration."""
+    types = factory.get_available_provider_types()
+    
+    assert types == ["mock"]
+    types.append("changed")
+    assert factory.get_available_provider_types() == ["mock"]
+    
+    factory.register_provider_type("other", MockProvider)
+    assert factory.get_available_provider_types() == ["mock", "other"]
+    assert factory.get_available_providers() == ["mock"]
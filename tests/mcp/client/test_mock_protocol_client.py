@@ -0,0 +1,203 @@
+"""
+Tests for the mock MCP protocol client.
+"""
+import asyncio
+
+import pytest
+
+from mcp.client.mock_protocol_client import MockProtocolClient
+from mcp.client.protocol_client import buffered_stream
+from mcp.messages.exceptions import InvalidToolError, ToolExecutionError, MCPProtocolError
+
+# Force asyncio only for all tests in this file
+pytestmark = [pytest.mark.asyncio]
+
+
+@pytest.fixture
+def client():
+    """Create a mock client with one tool, prompt and resource."""
+    client = MockProtocolClient()
+    client.add_tool({"name": "echo", "description": "Echo the input"})
+    client.add_prompt({"name": "greeting"})
+    client.add_resource({"name": "readme"})
+    return client
+
+
+async def test_connection_lifecycle(client):
+    """Test that ping follows initialize and shutdown."""
+    assert await client.ping() is False
+    
+    assert await client.initialize() == client.capabilities
+    assert await client.initialize() == client.capabilities
+    assert await client.ping() is True
+    
+    assert await client.shutdown() is True
+    assert await client.ping() is False
+
+
+async def test_call_tool(client):
+    """Test predefined and default tool results."""
+    params = {"text": "hello"}
+    client.set_tool_result("echo", client._hash_params(params), {"result": "hello"})
+    
+    assert await client.call_tool("echo", params) == {"result": "hello"}
+    assert await client.call_tool("echo", {"text": "other"}) == {"result": "Mock result for echo"}
+    
+    # Each call gets its own default result, and predefined results take precedence
+    result = await client.call_tool("echo", {})
+    result["result"] = "changed"
+    assert await client.call_tool("echo", {}) == {"result": "Mock result for echo"}
+    client.set_tool_result("echo", client._hash_params({}), {"result": "set"})
+    assert await client.call_tool("echo", {}) == {"result": "set"}
+
+
+async def test_call_tool_errors(client):
+    """Test unknown tools and predefined exceptions."""
+    with pytest.raises(InvalidToolError):
+        await client.call_tool("unknown", {})
+    
+    client.set_tool_result("echo", client._hash_params({}), ToolExecutionError("echo", "boom"))
+    with pytest.raises(ToolExecutionError):
+        await client.call_tool("echo", {})
+
+
+async def test_call_tools_batch(client):
+    """Test that batched calls match individual calls."""
+    client.set_tool_result("echo", client._hash_params({"text": "a"}), {"result": "a"})
+    calls = [("echo", {"text": "a"}), ("echo", {"text": "b"}), ("echo", {"text": "a"})]
+    
+    assert await client.call_tools_batch(calls) == [await client.call_tool(n, p) for n, p in calls]
+    
+    with pytest.raises(InvalidToolError):
+        await client.call_tools_batch([("echo", {}), ("unknown", {})])
+
+
+async def test_call_streaming_tool(client):
+    """Test predefined and default streaming results."""
+    params = {"text": "hello"}
+    client.set_streaming_tool_result("echo", client._hash_params(params), [{"chunk": 1}, {"chunk": 2}])
+    
+    chunks = [chunk async for chunk in client.call_streaming_tool("echo", params)]
+    assert chunks == [{"chunk": 1}, {"chunk": 2}]
+    
+    chunks = [chunk async for chunk in client.call_streaming_tool("echo", {})]
+    assert chunks == [{"result": "Mock streaming result for echo"}]
+
+
+async def test_get_prompt_and_resource(client):
+    """Test prompt and resource lookups."""
+    client.set_prompt_result("greeting", client._hash_params(None), {"content": "Hi"})
+    
+    assert await client.get_prompt("greeting") == {"content": "Hi"}
+    assert await client.get_resource("readme") == {"content": "Mock resource content for readme"}
+    
+    with pytest.raises(MCPProtocolError):
+        await client.get_prompt("unknown")
+    with pytest.raises(MCPProtocolError):
+        await client.get_resource("unknown")
+
+
+async def test_set_capabilities(client):
+    """Test that replacing the capabilities replaces the known names."""
+    client.set_capabilities({"tools": [{"name": "other"}]})
+    
+    assert await client.call_tool("other", {}) == {"result": "Mock result for other"}
+    with pytest.raises(InvalidToolError):
+        await client.call_tool("echo", {})
+    with pytest.raises(MCPProtocolError):
+        await client.get_prompt("greeting")
+    
+    assert await client.get_tools() == [{"name": "other"}]
+    assert await client.get_prompts() == []
+    
+    client.add_prompt({"name": "farewell"})
+    assert await client.get_prompts() == [{"name": "farewell"}]
+    assert client.capabilities["prompts"] == [{"name": "farewell"}]
+
+
+
+async def test_capabilities_copied(client):
+    """Test that changing returned or given capabilities does not desync the client."""
+    capabilities = {"tools": [{"name": "other"}]}
+    client.set_capabilities(capabilities)
+    capabilities["tools"].append({"name": "late"})
+    (await client.get_tools()).clear()
+    client.capabilities["tools"].append({"name": "extra"})
+    
+    assert await client.get_tools() == [{"name": "other"}]
+    assert await client.call_tool("other", {}) == {"result": "Mock result for other"}
+    with pytest.raises(InvalidToolError):
+        await client.call_tool("late", {})
+    
+    client.capabilities = {"tools": [{"name": "late"}]}
+    assert await client.call_tool("late", {}) == {"result": "Mock result for late"}
+
+
+async def test_discover(client):
+    """Test getting tools, prompts and resources together."""
+    assert await client.discover() == {
+        "tools": [{"name": "echo", "description": "Echo the input"}],
+        "prompts": [{"name": "greeting"}],
+        "resources": [{"name": "readme"}]
+    }
+
+
+async def test_hash_params():
+    """Test that parameter keys ignore key order and distinguish values."""
+    client = MockProtocolClient()
+    
+    assert client._hash_params(None) == client._hash_params({})
+    assert client._hash_params({"a": 1, "b": [1, 2]}) == client._hash_params({"b": [1, 2], "a": 1})
+    assert client._hash_params({"a": {"b": 1}}) != client._hash_params({"a": {"b": 2}})
+    assert client._hash_params({"a": [1, 2]}) != client._hash_params({"a": [2, 1]})
+    assert len({client._hash_params({"a": v}) for v in (True, 1, 1.0, "1")}) == 4
+
+
+async def test_buffered_stream(client):
+    """Test prefetching a streaming tool through a bounded queue."""
+    chunks = [{"chunk": i} for i in range(10)]
+    client.set_streaming_tool_result("echo", client._hash_params({}), chunks)
+    
+    stream = buffered_stream(client.call_streaming_tool("echo", {}), size=2)
+    assert [chunk async for chunk in stream] == chunks
+    
+    # Errors are raised after the chunks that preceded them
+    client.set_streaming_tool_result(
+        "echo", client._hash_params({}), [{"chunk": 0}, ToolExecutionError("echo", "boom")]
+    )
+    received = []
+    with pytest.raises(ToolExecutionError):
+        async for chunk in buffered_stream(client.call_streaming_tool("echo", {})):
+            received.append(chunk)
+    assert received == [{"chunk": 0}]
+
+
+async def test_buffered_stream_read_ahead():
+    """Test that the producer reads at most `size` items ahead of the consumer."""
+    produced = []
+    
+    async def source():
+        for i in range(10):
+            produced.append(i)
+            yield i
+    
+    stream = buffered_stream(source(), size=2)
+    assert await stream.__anext__() == 0
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+    assert len(produced) <= 4
+    
+    assert [item async for item in stream] == list(range(1, 10))
+
+
+async def test_buffered_stream_producer_cancelled():
+    """Test that the consumer is woken when the stream ends with a BaseException."""
+    async def source():
+        yield 0
+        raise asyncio.CancelledError()
+    
+    received = []
+    with pytest.raises(asyncio.CancelledError):
+        async for item in buffered_stream(source()):
+            received.append(item)
+    assert received == [0]
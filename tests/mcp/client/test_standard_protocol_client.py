@@ -0,0 +1,356 @@
+"""
+Tests for the standard MCP protocol client.
+"""
+import asyncio
+
+import pytest
+
+from mcp.client import standard_protocol_client
+from mcp.client.standard_protocol_client import StandardProtocolClient
+from mcp.messages.exceptions import (
+    InitializationError,
+    InvalidToolError,
+    ToolExecutionError,
+    MCPProtocolError
+)
+from mcp.messages.message_method import MessageMethod
+from mcp.transport.base.transport import STREAM_ERROR, STREAM_RESULT, Transport, TransportError
+
+# Force asyncio only for all tests in this file
+pytestmark = [pytest.mark.asyncio]
+
+
+class FakeTransport(Transport):
+    """In-memory transport that answers tool calls by echoing their parameters."""
+    
+    def __init__(self):
+        self.connected = False
+        self.sent = []
+        self.round_trips = 0
+        # Canned responses by method, used instead of the default behaviour
+        self.overrides = {}
+        # Chunks returned by send_streaming_message, if set
+        self.stream_responses = None
+    
+    def endpoint_key(self):
+        return "fake"
+    
+    def is_connected(self):
+        return self.connected
+    
+    async def connect(self):
+        self.connected = True
+        return True
+    
+    async def disconnect(self):
+        self.connected = False
+        return True
+    
+    def _respond(self, method, params):
+        self.sent.append((method, params))
+        if method in self.overrides:
+            return self.overrides[method]
+        if method == MessageMethod.TOOLS_CALL:
+            name = params["name"]
+            if name == "unknown":
+                return {"error": {"code": 1100, "message": "Invalid tool"}}
+            if name == "fail":
+                return {"error": {"code": 1101, "message": "boom"}}
+            return {"result": {"echo": params["parameters"]}}
+        if method.endswith("/list"):
+            kind = method.split("/")[0]
+            return {"result": {kind: [{"name": kind[:-1]}]}}
+        return {"result": {}}
+    
+    async def send_message(self, method, params):
+        self.round_trips += 1
+        return self._respond(method, params)
+    
+    async def send_streaming_message(self, method, params, extract=False):
+        self.round_trips += 1
+        for response in self.stream_responses or [self._respond(method, params)]:
+            if not extract:
+                yield response
+            elif "result" in response:
+                yield STREAM_RESULT, response["result"]
+            elif "error" in response:
+                yield STREAM_ERROR, response["error"]
+    
+    async def send_batch(self, requests):
+        self.round_trips += 1
+        return [self._respond(method, params) for method, params in requests]
+
+
+@pytest.fixture
+def transport():
+    """Create a fake transport."""
+    return FakeTransport()
+
+
+@pytest.fixture
+def client(transport):
+    """Create a client over the fake transport."""
+    return StandardProtocolClient(transport)
+
+
+async def test_initialize_once(client, transport):
+    """Test that initialize negotiates once per connection."""
+    capabilities = await client.initialize()
+    assert await client.initialize() is capabilities
+    assert [m for m, _ in transport.sent].count(MessageMethod.INITIALIZE) == 1
+    
+    await client.shutdown()
+    await client.initialize()
+    assert [m for m, _ in transport.sent].count(MessageMethod.INITIALIZE) == 2
+    
+    # A lost connection is reconnected and negotiated again
+    transport.connected = False
+    await client.initialize()
+    assert transport.connected
+    assert [m for m, _ in transport.sent].count(MessageMethod.INITIALIZE) == 3
+
+
+async def test_ping(client, transport):
+    """Test that ping reports transport errors but lets cancellation through."""
+    assert await client.ping() is True
+    
+    async def fail(method, params):
+        raise TransportError("gone")
+    
+    client._send = fail
+    assert await client.ping() is False
+    
+    async def broken_pipe(method, params):
+        raise BrokenPipeError()
+    
+    client._send = broken_pipe
+    assert await client.ping() is False
+    
+    async def cancel(method, params):
+        raise asyncio.CancelledError()
+    
+    client._send = cancel
+    with pytest.raises(asyncio.CancelledError):
+        await client.ping()
+
+
+async def test_call_tool(client, transport):
+    """Test tool results and error mapping."""
+    assert await client.call_tool("echo", {"a": 1}) == {"echo": {"a": 1}}
+    
+    with pytest.raises(InvalidToolError):
+        await client.call_tool("unknown", {})
+    with pytest.raises(ToolExecutionError, match="boom"):
+        await client.call_tool("fail", {})
+    
+    # Codes with a dedicated exception class still raise ToolExecutionError
+    # and keep the server's message
+    for code in (2001, -32601):
+        transport.overrides[MessageMethod.TOOLS_CALL] = {
+            "error": {"code": code, "message": "server says no", "data": {"code": code}}
+        }
+        with pytest.raises(ToolExecutionError, match="server says no") as exc_info:
+            await client.call_tool("echo", {})
+        assert exc_info.value.data == {"code": code}
+    
+    transport.overrides[MessageMethod.TOOLS_CALL] = {}
+    with pytest.raises(ToolExecutionError, match="Invalid response"):
+        await client.call_tool("echo", {})
+
+
+async def test_call_streaming_tool(client, transport):
+    """Test streamed results, skipped chunks and streamed errors."""
+    transport.stream_responses = [{"result": 1, "partial": True}, {"partial": True}, {"result": 2}]
+    assert [chunk async for chunk in client.call_streaming_tool("echo", {})] == [1, 2]
+    
+    transport.stream_responses = [{"result": 1}, {"error": {"code": 1100, "message": "Invalid tool"}}]
+    received = []
+    with pytest.raises(InvalidToolError):
+        async for chunk in client.call_streaming_tool("echo", {}):
+            received.append(chunk)
+    assert received == [1]
+
+
+async def test_error_responses(client, transport):
+    """Test error and invalid responses for the other methods."""
+    transport.overrides[MessageMethod.INITIALIZE] = {"error": {"code": 1000, "message": "nope"}}
+    with pytest.raises(InitializationError, match="nope"):
+        await client.initialize()
+    
+    transport.overrides[MessageMethod.PROMPTS_GET] = {"error": {"code": 1201, "message": "missing"}}
+    with pytest.raises(MCPProtocolError) as exc_info:
+        await client.get_prompt("greeting")
+    assert exc_info.value.code == 1201
+    
+    transport.overrides[MessageMethod.RESOURCES_GET] = {}
+    with pytest.raises(MCPProtocolError, match="Invalid response"):
+        await client.get_resource("readme")
+    
+    # List methods treat responses without a result as empty
+    transport.overrides[MessageMethod.TOOLS_LIST] = {}
+    assert await client.get_tools() == []
+
+
+async def test_call_tools_batch(client, transport):
+    """Test that batched calls use one round-trip and keep call order."""
+    calls = [("echo", {"i": i}) for i in range(5)]
+    
+    assert await client.call_tools_batch(calls) == [{"echo": {"i": i}} for i in range(5)]
+    assert transport.round_trips == 1
+    
+    assert await client.call_tools_batch(calls, max_concurrent=2) == [{"echo": {"i": i}} for i in range(5)]
+    assert transport.round_trips == 4
+    assert await client.call_tools_batch([]) == []
+
+
+async def test_call_tools_batch_errors(client, transport):
+    """Test failed calls in a batch."""
+    calls = [("echo", {}), ("unknown", {}), ("fail", {}), ("echo", {})]
+    
+    results = await client.call_tools_batch(calls)
+    assert results[0] == {"echo": {}}
+    assert isinstance(results[1], InvalidToolError)
+    assert isinstance(results[2], ToolExecutionError)
+    assert results[3] == {"echo": {}}
+    
+    # Later batches are not sent once a call has failed
+    transport.round_trips = 0
+    with pytest.raises(InvalidToolError):
+        await client.call_tools_batch(calls, max_concurrent=2, stop_on_error=True)
+    assert transport.round_trips == 1
+
+
+async def test_list_capabilities(client, transport):
+    """Test listing tools, prompts and resources in one round-trip."""
+    assert await client.list_capabilities() == {
+        "tools": [{"name": "tool"}],
+        "prompts": [{"name": "prompt"}],
+        "resources": [{"name": "resource"}]
+    }
+    assert transport.round_trips == 1
+
+
+async def test_tool_cache(transport):
+    """Test that results of cacheable tools are reused and evicted LRU-first."""
+    client = StandardProtocolClient(transport, cache_tools=["echo"], tool_cache_size=2)
+    
+    first = await client.call_tool("echo", {"a": 1, "b": 2})
+    first["echo"]["a"] = 99
+    second = await client.call_tool("echo", {"b": 2, "a": 1})
+    assert second == {"echo": {"a": 1, "b": 2}} and second is not first
+    assert transport.round_trips == 1
+    
+    # Parameters without a JSON key are sent uncached
+    await client.call_tool("echo", {"a": {1, 2}})
+    await client.call_tool("echo", {"a": {1, 2}})
+    assert transport.round_trips == 3
+    
+    await client.call_tool("other", {})
+    await client.call_tool("other", {})
+    assert transport.round_trips == 5
+    
+    await client.call_tool("echo", {"a": 2})
+    await client.call_tool("echo", {"a": 1, "b": 2})
+    await client.call_tool("echo", {"a": 3})
+    assert transport.round_trips == 7
+    await client.call_tool("echo", {"a": 2})
+    assert transport.round_trips == 8
+    
+    with pytest.raises(ToolExecutionError):
+        await client.call_tool("fail", {})
+    
+    await client.shutdown()
+    await client.call_tool("echo", {"a": 3})
+    assert transport.round_trips == 11
+
+
+async def test_discover(client, transport):
+    """Test that discovery uses a single batch round-trip."""
+    assert await client.discover() == {
+        "tools": [{"name": "tool"}],
+        "prompts": [{"name": "prompt"}],
+        "resources": [{"name": "resource"}]
+    }
+    assert transport.round_trips == 1
+
+
+async def test_batch_failure_falls_back(transport):
+    """Test that discovery and batched tool calls fall back to single requests."""
+    async def failing_batch(requests):
+        raise TransportError("Batch rejected by server")
+    
+    transport.send_batch = failing_batch
+    client = StandardProtocolClient(transport)
+    
+    assert await client.discover() == {
+        "tools": [{"name": "tool"}],
+        "prompts": [{"name": "prompt"}],
+        "resources": [{"name": "resource"}]
+    }
+    assert transport.round_trips == 3
+    
+    assert await client.call_tools_batch([("echo", {"i": 1}), ("echo", {"i": 2})]) == [
+        {"echo": {"i": 1}}, {"echo": {"i": 2}}
+    ]
+    assert transport.round_trips == 5
+
+
+async def test_default_send_batch(transport):
+    """Test that the base transport sends batches one message at a time."""
+    responses = await Transport.send_batch(transport, [(MessageMethod.PING, {}), (MessageMethod.PING, {})])
+    
+    assert responses == [{"result": {}}, {"result": {}}]
+    assert transport.round_trips == 2
+
+
+@pytest.fixture
+def pool():
+    """Give each test an empty connection pool."""
+    standard_protocol_client._POOL.clear()
+    yield standard_protocol_client._POOL
+    standard_protocol_client._POOL.clear()
+
+
+async def test_pooled_connection_reused(pool):
+    """Test that pooled clients share one initialized connection."""
+    first_transport, second_transport = FakeTransport(), FakeTransport()
+    first = StandardProtocolClient(first_transport, pool=True)
+    second = StandardProtocolClient(second_transport, pool=True)
+    
+    await first.initialize()
+    assert await first.shutdown() is True
+    assert first_transport.connected
+    
+    # The second client reuses the open connection without initializing again
+    assert await second.initialize() == {}
+    assert second.transport is first_transport
+    assert not second_transport.connected
+    assert [m for m, _ in first_transport.sent].count(MessageMethod.INITIALIZE) == 1
+    
+    assert await second.close() is True
+    assert not first_transport.connected
+    assert not pool
+
+
+async def test_pooled_connection_evicted(pool):
+    """Test that idle pooled connections are closed after the timeout."""
+    transport = FakeTransport()
+    client = StandardProtocolClient(transport, pool=True, idle_timeout_s=0.01)
+    
+    await client.initialize()
+    await client.shutdown()
+    assert transport.connected and pool
+    
+    await asyncio.sleep(0.05)
+    assert not transport.connected
+    assert not pool
+
+
+async def test_unpooled_shutdown(client, transport, pool):
+    """Test that clients without pooling disconnect on shutdown."""
+    await client.initialize()
+    assert await client.shutdown() is True
+    
+    assert not transport.connected
+    assert transport.sent[-1] == (MessageMethod.SHUTDOWN, {})
+    assert not pool
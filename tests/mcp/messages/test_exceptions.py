@@ -0,0 +1,68 @@
+"""
+Tests for the MCP protocol exceptions.
+"""
+import gc
+import json
+
+from mcp.messages.error_codes import ErrorCodes
+from mcp.messages.exceptions import (
+    MCPProtocolError,
+    InvalidParamsError,
+    InvalidToolError,
+    MethodNotFoundError,
+    ToolExecutionError,
+    IOError,
+    TableNotFoundError
+)
+
+
+def test_messages():
+    """Test that formatted messages match the error fields."""
+    error = ToolExecutionError("echo", "boom", {"x": 1})
+    assert error.message == "Tool execution failed (echo): boom"
+    assert str(error) == error.message
+    assert error.tool == "echo" and error.raw_message == "boom"
+    assert error.code == ErrorCodes.TOOL_EXECUTION_FAILED
+    
+    assert str(InvalidToolError("echo")) == "Invalid tool: echo"
+    assert str(IOError("a.txt", "disk full")) == "I/O error (a.txt): disk full"
+    assert str(TableNotFoundError("users")) == "Table not found: users"
+    assert str(InvalidParamsError()) == "Invalid parameters"
+    assert repr(MCPProtocolError("failed", 1)) == "MCPProtocolError('failed')"
+    
+    # args carries the message, as for any other exception
+    assert error.args == ("Tool execution failed (echo): boom",)
+    assert MCPProtocolError("failed", 1).args == ("failed",)
+    
+    # message is a plain attribute, as before
+    error.message = "replaced"
+    assert error.to_json_rpc_error()["message"] == "replaced"
+
+
+def test_to_json_rpc_error():
+    """Test conversion to a JSON-RPC error object."""
+    assert InvalidToolError("echo", {"x": 1}).to_json_rpc_error() == {
+        "code": ErrorCodes.INVALID_TOOL,
+        "message": "Invalid tool: echo",
+        "data": {"x": 1}
+    }
+    assert MethodNotFoundError("x").to_json_rpc_error() == {
+        "code": ErrorCodes.METHOD_NOT_FOUND,
+        "message": "Method not found: x"
+    }
+
+
+def test_to_json_rpc_bytes():
+    """Test that the encoded error object is computed once and reused."""
+    error = InvalidToolError("echo", {"x": 1})
+    encoded = error.to_json_rpc_bytes()
+    
+    assert json.loads(encoded) == error.to_json_rpc_error()
+    assert error.to_json_rpc_bytes() is encoded
+
+
+def test_no_instance_dict():
+    """Test that slotted errors do not materialize an instance dict."""
+    error = ToolExecutionError("echo", "boom")
+    assert not any(isinstance(ref, dict) and ref.get("tool") == "echo" for ref in gc.get_referents(error))
+    assert error.tool == "echo"
@@ -0,0 +1,70 @@
+"""
+Tests for JSON-RPC wire encoding.
+"""
+import json
+
+import pytest
+
+from mcp.messages import json_rpc_message
+from mcp.messages.json_rpc_message import create_request_bytes, decode_message, encode_message
+
+
+@pytest.fixture(params=["orjson", "json"])
+def encoder(request, monkeypatch):
+    """Run each test with and without orjson."""
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(json_rpc_message, "orjson", None)
+    return request.param
+
+
+def test_create_request_bytes(encoder):
+    """Test that encoded requests are newline-terminated JSON."""
+    data = create_request_bytes("tools/call", {"name": "echo", "text": "é"}, 7)
+    
+    assert isinstance(data, bytes)
+    assert data.endswith(b"\n") and data.count(b"\n") == 1
+    assert json.loads(data) == {
+        "jsonrpc": "2.0",
+        "method": "tools/call",
+        "params": {"name": "echo", "text": "é"},
+        "id": 7
+    }
+
+
+@pytest.mark.parametrize("method, params", [
+    ("ping", {}),
+    ("shutdown", {}),
+    ("tools/list", {}),
+    ("tools/call", {"name": "echo", "parameters": {"text": "é\n\""}}),
+    ("custom/method", {"a": 1}),
+])
+def test_create_request_bytes_templates(encoder, method, params):
+    """Test that templated requests match the full encoding."""
+    data = create_request_bytes(method, params, 12)
+    
+    assert data == json_rpc_message.encode_message(json_rpc_message.create_request_fast(method, params, 12))
+    assert json.loads(data) == {"jsonrpc": "2.0", "method": method, "params": params, "id": 12}
+    assert json.loads(create_request_bytes(method, params, "a"))["id"] == "a"
+
+
+def test_round_trip(encoder):
+    """Test that decode_message reverses encode_message."""
+    batch = [{"jsonrpc": "2.0", "result": {"items": [1, 2]}, "id": 1}]
+    
+    assert decode_message(encode_message(batch)) == batch
+    with pytest.raises(json.JSONDecodeError):
+        decode_message(b"{not json")
+
+
+def test_validation_switch(monkeypatch):
+    """Test that outgoing validation can be turned off."""
+    with pytest.raises(ValueError):
+        json_rpc_message.create_request("ping", [], 1)
+    
+    monkeypatch.setattr(json_rpc_message, "_VALIDATE", False)
+    assert json_rpc_message.create_request("ping", [], 1)["params"] == []
+    assert json_rpc_message.create_request_fast("ping", {}, 1) == {
+        "jsonrpc": "2.0", "method": "ping", "params": {}, "id": 1
+    }
@@ -0,0 +1,19 @@
+"""
+Tests for the MCP message method and error code constants.
+"""
+from mcp.messages.error_codes import ErrorCodes
+from mcp.messages.message_method import MessageMethod
+
+
+def test_is_valid_method():
+    """Test method name validation."""
+    assert MessageMethod.is_valid_method(MessageMethod.TOOLS_CALL)
+    assert MessageMethod.is_valid_method("db/getTables")
+    assert not MessageMethod.is_valid_method("tools/unknown")
+
+
+def test_get_message():
+    """Test default error messages."""
+    assert ErrorCodes.get_message(ErrorCodes.PARSE_ERROR) == "Parse error"
+    assert ErrorCodes.get_message(ErrorCodes.DB_TABLE_NOT_FOUND) == "Table not found"
+    assert ErrorCodes.get_message(42) == "Unknown error"
@@ -0,0 +1,140 @@
+"""
+Tests for the tracker file parser.
+"""
+import numpy as np
+import pytest
+
+from mcp.messages.tools.midi import tracker_parser
+from mcp.messages.tools.midi.tracker_parser import (
+    EMPTY,
+    TrackerEvent,
+    TrackerPattern,
+    decode_pattern_rows,
+    parse_note_string,
+    parse_tracker_string
+)
+
+
+SONG = """
+#TITLE: Demo
+#BPM: 140
+#SPEED: fast
+PATTERN 0 ROWS 2
+C-4 01 40 ...|... .. .. ...|E-4 02 30 F06
+... .. .. ...|=== .. .. ...
+... .. .. ...|C-4 .. .. ...
+PATTERN 1
+D#5 .. .. A0F
+"""
+
+
+@pytest.mark.parametrize("note_str, expected", [
+    ("C-0", 0),
+    ("C-4", 48),
+    ("A#3", 46),
+    ("B-9", 119),
+    ("===", -1),
+    ("...", None),
+    ("", None),
+    ("H-4", None),
+    ("C-x", None),
+    ("C-44", None),
+    ("é-4", None),
+])
+def test_parse_note_string(note_str, expected):
+    """Test note names, octaves and special notes."""
+    assert parse_note_string(note_str) == expected
+
+
+def test_parse_tracker_string():
+    """Test headers and pattern rows."""
+    song = parse_tracker_string(SONG)
+    
+    assert (song.title, song.bpm, song.speed) == ("Demo", 140, 6)
+    assert song.sequence == []
+    
+    pattern = song.patterns[0]
+    assert pattern.num_rows == 2
+    assert sorted(pattern.channels) == [0, 1, 2]
+    
+    event = pattern.channels[2][0]
+    assert (event.row, event.note, event.instrument, event.volume) == (0, 52, 2, 0x30)
+    assert (event.effect, event.effect_param) == ("F", 6)
+    
+    # The note cut is on row 1; the row past ROWS 2 is ignored
+    assert [(e.row, e.note) for e in pattern.channels[1]] == [(1, -1)]
+    
+    event = song.patterns[1].channels[0][0]
+    assert (event.note, event.instrument, event.effect, event.effect_param) == (63, None, "A", 0x0F)
+
+
+def test_pattern_columns():
+    """Test the per-channel field columns and events built from them."""
+    pattern = parse_tracker_string(SONG).patterns[0]
+    
+    assert pattern.columns[2].shape == (len(TrackerPattern.FIELDS), 2)
+    assert pattern.columns[2][:, 0].tolist() == [52, 2, 0x30, ord("F"), 6]
+    assert pattern.get_event(0, 1) is None
+    assert pattern.get_event(5, 0) is None
+    
+    pattern = TrackerPattern(0, num_rows=4)
+    pattern.add_event(3, TrackerEvent(2, note=60, effect="C", effect_param=0x20))
+    pattern.add_event(3, TrackerEvent(2, note=62))
+    pattern.add_event(3, TrackerEvent(7, note=64))
+    
+    # Events are appended; the grid holds the last event written to a row
+    assert [(e.row, e.note) for e in pattern.channels[3]] == [(2, 60), (2, 62), (7, 64)]
+    event = pattern.get_event(3, 2)
+    assert (event.row, event.note, event.instrument, event.effect, event.effect_param) == (2, 62, None, None, None)
+    assert pattern.get_event(3, 7) is None
+    
+    channel = pattern.channels[3]
+    pattern.add_event(3, TrackerEvent(0, note=48))
+    assert pattern.channels[3] is channel and len(channel) == 4
+
+
+def test_parse_tracker_string_headers():
+    """Test the sequence header and that rows of malformed patterns are skipped."""
+    song = parse_tracker_string("""
+# sequence : 1, 0,1
+#NOTE
+  PATTERN 1 ROWS 8
+C-4 .. .. ...\r
+              D-4 .. .. ...
+PATTERN x
+D-4 .. .. ...
+""")
+    
+    assert song.sequence == [1, 0, 1]
+    assert list(song.patterns) == [1]
+    assert [e.note for e in song.patterns[1].channels[0]] == [48]
+    assert [(e.row, e.note) for e in song.patterns[1].channels[1]] == [(1, 50)]
+    assert song.patterns[1].num_rows == 8
+
+
+def test_decode_pattern_rows():
+    """Test that block decoding agrees with parse_note_string and pads short rows."""
+    names = ["C-0", "G#4", "B-9", "===", "...", "H-4", "C-x", "é-4"]
+    rows = [f"{name} 1f .. ..." for name in names] + [""]
+    
+    note, instrument, volume, effect, effect_param = decode_pattern_rows(rows)
+    
+    assert note.shape == (len(rows), 1)
+    expected = [parse_note_string(name) for name in names] + [None]
+    assert [None if n == EMPTY else n for n in note[:, 0].tolist()] == expected
+    assert instrument[0, 0] == 0x1F and instrument[-1, 0] == EMPTY
+    assert (volume == EMPTY).all() and (effect == EMPTY).all() and (effect_param == EMPTY).all()
+
+
+
+def test_decode_cells_matches_vectorized(monkeypatch):
+    """Test that the cell-by-cell kernel decodes like the vectorized path."""
+    rows = [line for line in SONG.splitlines() if "|" in line or line.startswith("D#5")]
+    rows += ["ZZ9 g1 .F +xx", "=== 00 FF ..."]
+    
+    monkeypatch.setattr(tracker_parser, "_decode_cells_jit", None)
+    vectorized = decode_pattern_rows(rows)
+    
+    monkeypatch.setattr(tracker_parser, "_decode_cells_jit", tracker_parser._decode_cells)
+    for expected, actual in zip(vectorized, decode_pattern_rows(rows)):
+        np.testing.assert_array_equal(actual, expected)
@@ -0,0 +1,240 @@
+"""
+Tests for the stdio transport.
+"""
+import asyncio
+import json
+import subprocess
+import sys
+
+import pytest
+
+from mcp.transport.base.transport import TransportError
+from mcp.transport.stdio.stdio_transport import StdioTransport
+
+# Force asyncio only for all tests in this file
+pytestmark = [pytest.mark.asyncio]
+
+
+class RecordingWriter:
+    """Stream writer stand-in that records each write call."""
+    
+    def __init__(self):
+        self.calls = []
+        self.drains = 0
+    
+    def writelines(self, frames):
+        self.calls.append(list(frames))
+    
+    async def drain(self):
+        self.drains += 1
+    
+    def close(self):
+        pass
+
+
+def connected_transport(*responses):
+    """Create a transport whose server replies with the given responses."""
+    transport = StdioTransport()
+    transport.reader = asyncio.StreamReader()
+    for response in responses:
+        transport.reader.feed_data(json.dumps(response).encode() + b"\n")
+    transport.writer = RecordingWriter()
+    return transport
+
+
+async def test_concurrent_requests_coalesced():
+    """Test that requests sent in the same loop iteration share one write."""
+    transport = connected_transport(
+        {"jsonrpc": "2.0", "result": "a", "id": 1},
+        {"jsonrpc": "2.0", "result": "b", "id": 2}
+    )
+    
+    responses = await asyncio.gather(
+        transport.send_message("ping", {}),
+        transport.send_message("ping", {})
+    )
+    
+    assert [response["result"] for response in responses] == ["a", "b"]
+    assert len(transport.writer.calls) == 1
+    assert transport.writer.drains == 1
+    assert [json.loads(frame)["id"] for frame in transport.writer.calls[0]] == [1, 2]
+
+
+async def test_send_batch():
+    """Test that batches are sent as one frame and answered in request order."""
+    transport = connected_transport(
+        [{"jsonrpc": "2.0", "result": "b", "id": 2}, {"jsonrpc": "2.0", "result": "a", "id": 1}]
+    )
+    
+    responses = await transport.send_batch([("ping", {}), ("tools/list", {})])
+    
+    assert [response["result"] for response in responses] == ["a", "b"]
+    assert len(transport.writer.calls) == 1
+    assert [request["method"] for request in json.loads(transport.writer.calls[0][0])] == ["ping", "tools/list"]
+
+
+class NoBatchWriter(RecordingWriter):
+    """Writer for a server that answers single requests but not batches."""
+    
+    def __init__(self, reader, reject):
+        super().__init__()
+        self.reader = reader
+        self.reject = reject
+    
+    def writelines(self, frames):
+        super().writelines(frames)
+        for frame in frames:
+            request = json.loads(frame)
+            if isinstance(request, dict):
+                response = {"jsonrpc": "2.0", "result": request["method"], "id": request["id"]}
+            elif self.reject:
+                response = {"jsonrpc": "2.0", "error": {"code": -32600, "message": "Invalid Request"}, "id": None}
+            else:
+                continue
+            self.reader.feed_data(json.dumps(response).encode() + b"\n")
+
+
+@pytest.mark.parametrize("reject", [True, False])
+async def test_send_batch_falls_back(reject):
+    """Test that a rejected or unanswered batch is resent one request at a time."""
+    transport = connected_transport()
+    transport.writer = NoBatchWriter(transport.reader, reject)
+    transport.batch_timeout = 0.01
+    
+    responses = await transport.send_batch([("ping", {}), ("tools/list", {})])
+    
+    assert [response["result"] for response in responses] == ["ping", "tools/list"]
+    assert transport._queues == {} and transport._batch_queues == set()
+    
+    # Later batches skip straight to single requests
+    calls = len(transport.writer.calls)
+    await transport.send_batch([("ping", {})])
+    assert len(transport.writer.calls) == calls + 1
+    assert isinstance(json.loads(transport.writer.calls[-1][0]), dict)
+
+
+async def test_streaming_lines_split_across_reads():
+    """Test that lines are framed across reads, with several lines per read."""
+    transport = connected_transport()
+    chunks = [
+        {"jsonrpc": "2.0", "result": {"n": 1}, "id": 1, "partial": True},
+        {"jsonrpc": "2.0", "result": {"n": 2}, "id": 1, "partial": True},
+        {"jsonrpc": "2.0", "result": {"n": 3}, "id": 1}
+    ]
+    data = b"\n".join(json.dumps(chunk).encode() for chunk in chunks) + b"\n"
+    transport.reader.feed_data(data[:10])
+    transport.reader.feed_data(data[10:] + b"\n")
+    transport.reader.feed_eof()
+    
+    results = [result async for _, result in transport.send_streaming_message("tools/call", {}, extract=True)]
+    
+    assert results == [{"n": 1}, {"n": 2}, {"n": 3}]
+    assert await transport._read_line() == b""
+
+
+async def test_responses_routed_by_id():
+    """Test that interleaved, out-of-order responses reach their own callers."""
+    transport = connected_transport(
+        {"jsonrpc": "2.0", "result": {"n": 1}, "id": 1, "partial": True},
+        {"jsonrpc": "2.0", "result": "pong", "id": 2},
+        {"jsonrpc": "2.0", "result": "stale", "id": 99},
+        {"jsonrpc": "2.0", "result": {"n": 2}, "id": 1}
+    )
+    
+    async def stream():
+        return [result async for _, result in transport.send_streaming_message("tools/call", {}, extract=True)]
+    
+    results, response = await asyncio.gather(stream(), transport.send_message("ping", {}))
+    
+    assert results == [{"n": 1}, {"n": 2}]
+    assert response["result"] == "pong"
+    assert transport._queues == {}
+
+
+async def test_closed_while_waiting():
+    """Test that waiting requests fail when the server closes or we disconnect."""
+    transport = connected_transport()
+    transport.reader.feed_eof()
+    
+    with pytest.raises(TransportError, match="closed"):
+        await transport.send_message("ping", {})
+    assert not transport.is_connected()
+    
+    transport = connected_transport()
+    writer = transport.writer
+    pending = asyncio.ensure_future(transport.send_message("ping", {}))
+    while not writer.calls:
+        await asyncio.sleep(0)
+    await transport.disconnect()
+    
+    with pytest.raises(TransportError, match="Disconnected"):
+        await pending
+
+
+async def test_invalid_json_skipped():
+    """Test that a malformed line is skipped instead of failing pending requests."""
+    transport = connected_transport()
+    transport.reader.feed_data(b"not json\n")
+    transport.reader.feed_data(json.dumps({"jsonrpc": "2.0", "result": "pong", "id": 1}).encode() + b"\n")
+    
+    response = await transport.send_message("ping", {})
+    
+    assert response["result"] == "pong"
+
+
+async def test_notifications_and_non_objects_skipped():
+    """Test that notifications and non-object batch elements are skipped."""
+    transport = connected_transport(
+        {"jsonrpc": "2.0", "method": "notifications/progress", "params": {}},
+        [1, "x", None],
+        {"jsonrpc": "2.0", "result": "pong", "id": 1}
+    )
+    
+    response = await transport.send_message("ping", {})
+    
+    assert response["result"] == "pong"
+
+
+async def test_disconnect_cancels_flush():
+    """Test that disconnecting stops a write stuck waiting for the pipe."""
+    transport = connected_transport()
+    drained = asyncio.Event()
+    
+    async def blocked_drain():
+        drained.set()
+        await asyncio.Event().wait()
+    
+    transport.writer.drain = blocked_drain
+    pending = asyncio.ensure_future(transport.send_message("ping", {}))
+    await drained.wait()
+    flush_task = transport._flush_task
+    await transport.disconnect()
+    
+    with pytest.raises(TransportError, match="Disconnected"):
+        await pending
+    await asyncio.sleep(0)
+    assert flush_task.cancelled()
+    assert transport._flush_task is None
+
+
+async def test_not_connected():
+    """Test sending without a connection."""
+    with pytest.raises(TransportError):
+        await StdioTransport().send_message("ping", {})
+
+
+async def test_subprocess_round_trip():
+    """Test a real pipe round-trip against a process that echoes requests back."""
+    process = subprocess.Popen(
+        [sys.executable, "-c", "import sys\nfor line in sys.stdin: print(line, end='', flush=True)"],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE
+    )
+    transport = StdioTransport(process)
+    
+    assert await transport.connect()
+    try:
+        response = await transport.send_message("ping", {"n": 1})
+        assert response == {"jsonrpc": "2.0", "method": "ping", "params": {"n": 1}, "id": 1}
+    finally:
+        assert await transport.disconnect()